@@ -0,0 +1,197 @@
+"""
+Audio Capture Hub - One microphone stream fanned out to subscribers with their own block sizes.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  AudioCaptureHub                        │
+    │  ┌───────────────────────────────────┐  │
+    │  │  InputStream (16 kHz, 256 frames) │  │
+    │  │  → _on_audio (PortAudio thread)   │  │
+    │  │  → PrerollBuffer (last ~400 ms)   │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  _Subscription per consumer       │  │
+    │  │  → re-blocks to its blocksize     │  │
+    │  │    (wake word 1280, VAD 512, raw) │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  last unsubscribe                 │  │
+    │  │  → keep_open: stay warm           │  │
+    │  │  → else close after linger        │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+The wake word listener and the speech recorder share one hub, so handing
+the microphone from one to the other is a subscription switch instead of a
+stream close/reopen, and no audio is lost in between.
+
+Usage:
+    from hotkey_transcriber.audio.audio_capture_hub import AudioCaptureHub
+
+    hub = AudioCaptureHub(source=PortAudioSource(), keep_open=True)
+    sub = hub.subscribe(wake_word_callback, blocksize=1280)
+    hub.unsubscribe(sub)
+    rec = hub.subscribe(recorder_callback, blocksize=512, preroll=True)
+    hub.close()
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from hotkey_transcriber.audio.audio_ring_buffer import PrerollBuffer
+from hotkey_transcriber.audio.audio_source import AudioSource
+
+_SAMPLE_RATE = 16_000
+# gcd of the wake word (1280) and Silero VAD (512) block sizes, 16 ms.
+_DEVICE_BLOCKSIZE = 256
+
+
+class _Subscription:
+    """Re-blocks device audio for one consumer (sounddevice callback signature)."""
+
+    def __init__(self, callback, blocksize: int | None):
+        self.callback = callback
+        self.blocksize = blocksize
+        self._pending = np.zeros(0, dtype=np.float32)
+
+    def push(self, samples: np.ndarray, time_info=None, status=None) -> None:
+        if self.blocksize is None:
+            self.callback(samples[:, np.newaxis], len(samples), time_info, status)
+            return
+        if len(self._pending):
+            samples = np.concatenate([self._pending, samples])
+        bs = self.blocksize
+        n_full = len(samples) // bs * bs
+        for start in range(0, n_full, bs):
+            self.callback(samples[start : start + bs, np.newaxis], bs, time_info, status)
+        self._pending = samples[n_full:].copy()
+
+
+class AudioCaptureHub:
+    """Own one 16 kHz mono input stream and fan it out to subscribers.
+
+    The stream comes from *source* (PortAudio, a replayed file, a generated
+    signal).  It is opened by the first subscriber; without *keep_open* it is
+    closed *linger_s* seconds after the last subscriber left.
+    """
+
+    def __init__(
+        self,
+        source: AudioSource,
+        preroll_ms: int = 400,
+        keep_open: bool = False,
+        linger_s: float = 2.0,
+        blocksize: int = _DEVICE_BLOCKSIZE,
+    ):
+        self._source = source
+        self.blocksize = blocksize
+        self.keep_open = keep_open
+        self._linger_s = linger_s
+        self._lock = threading.Lock()  # subscribers + pre-roll (audio thread)
+        self._state_lock = threading.RLock()  # stream lifecycle
+        self._preroll = PrerollBuffer(_SAMPLE_RATE * preroll_ms // 1000)
+        self._subscriptions: list[_Subscription] = []
+        self._stream = None
+        self._linger_timer: threading.Timer | None = None
+        self.open_ms: float | None = None
+        self.close_ms: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._stream is not None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def open(self) -> None:
+        with self._state_lock:
+            self._cancel_linger()
+            if self._stream is not None:
+                return
+            t0 = time.perf_counter()
+            stream = self._source.open_stream(
+                samplerate=_SAMPLE_RATE,
+                channels=1,
+                dtype="float32",
+                blocksize=self.blocksize,
+                callback=self._on_audio,
+            )
+            stream.start()
+            self.open_ms = (time.perf_counter() - t0) * 1000
+            self._stream = stream
+
+    def close(self) -> None:
+        with self._state_lock:
+            self._cancel_linger()
+            stream, self._stream = self._stream, None
+            if stream is None:
+                return
+            # Not under self._lock: stop() waits for a running callback, which
+            # needs that lock itself.
+            t0 = time.perf_counter()
+            stream.stop()
+            stream.close()
+            self.close_ms = (time.perf_counter() - t0) * 1000
+            with self._lock:
+                self._preroll.clear()
+
+    def subscribe(self, callback, blocksize: int | None = None, preroll: bool = False):
+        """Attach *callback*; with *preroll* the buffered audio is replayed first.
+
+        The replay runs under the fan-out lock, so no block is lost or
+        duplicated between the pre-roll snapshot and the first live block.
+        """
+        with self._state_lock:
+            self.open()
+            subscription = _Subscription(callback, blocksize)
+            with self._lock:
+                if preroll and len(self._preroll):
+                    subscription.push(self._preroll.snapshot())
+                self._subscriptions.append(subscription)
+            return subscription
+
+    def unsubscribe(self, subscription, clear_preroll: bool = False) -> None:
+        """Detach *subscription*; no callback for it runs after this returns."""
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+            if clear_preroll:
+                # Don't replay the end of this recording as pre-roll of the next one.
+                self._preroll.clear()
+            idle = not self._subscriptions
+        if idle and not self.keep_open:
+            self._schedule_linger_close()
+
+    def _schedule_linger_close(self) -> None:
+        with self._state_lock:
+            self._cancel_linger()
+            if self._stream is None:
+                return
+            timer = threading.Timer(self._linger_s, self._close_if_idle)
+            timer.daemon = True
+            self._linger_timer = timer
+            timer.start()
+
+    def _cancel_linger(self) -> None:
+        if self._linger_timer is not None:
+            self._linger_timer.cancel()
+            self._linger_timer = None
+
+    def _close_if_idle(self) -> None:
+        with self._state_lock:
+            if self._subscriptions or self.keep_open:
+                return
+            self.close()
+
+    def _on_audio(self, indata, frames, time_info, status) -> None:
+        samples = indata[:, 0]
+        with self._lock:
+            self._preroll.write(samples)
+            for subscription in self._subscriptions:
+                try:
+                    subscription.push(samples, time_info, status)
+                except Exception as exc:
+                    print(f"Audio-Abonnent fehlgeschlagen: {exc}")
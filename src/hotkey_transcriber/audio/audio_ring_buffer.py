@@ -0,0 +1,126 @@
+"""
+Audio Ring Buffer - Preallocated, growable mono float32 arena for recorded audio.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  AudioRingBuffer                        │
+    │  ┌───────────────────────────────────┐  │
+    │  │  write(block)  (audio callback)   │  │
+    │  │  → copies channel 0 in place      │  │
+    │  │  → doubles capacity when full     │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  view(start, end)  (any thread)   │  │
+    │  │  → zero-copy slice of the arena   │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+The buffer is append-only between clear() calls, so a view handed to the
+model stays valid even if a later write has to reallocate the arena.
+
+Usage:
+    from hotkey_transcriber.audio.audio_ring_buffer import AudioRingBuffer
+
+    buf = AudioRingBuffer()
+    buf.write(indata)          # inside the sounddevice callback
+    audio = buf.view()         # float32 [n_samples], no copy
+"""
+
+import threading
+
+import numpy as np
+
+_SAMPLE_RATE = 16_000
+
+
+class AudioRingBuffer:
+    """Append-only mono float32 arena that is reused across recordings."""
+
+    def __init__(self, initial_seconds: float = 60.0, sample_rate: int = _SAMPLE_RATE):
+        self._lock = threading.Lock()
+        self._data = np.zeros(max(1, int(initial_seconds * sample_rate)), dtype=np.float32)
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Forget the recorded samples but keep the allocation."""
+        with self._lock:
+            self._length = 0
+
+    def write(self, block: np.ndarray) -> None:
+        """Append *block* ([frames] or [frames, channels]; only channel 0 is kept)."""
+        samples = block[:, 0] if block.ndim > 1 else block
+        n = len(samples)
+        if n == 0:
+            return
+        with self._lock:
+            end = self._length + n
+            if end > len(self._data):
+                self._grow(end)
+            self._data[self._length : end] = samples
+            self._length = end
+
+    def _grow(self, min_capacity: int) -> None:
+        capacity = len(self._data)
+        while capacity < min_capacity:
+            capacity *= 2
+        data = np.empty(capacity, dtype=np.float32)
+        data[: self._length] = self._data[: self._length]
+        self._data = data
+
+    def view(self, start: int = 0, end: int | None = None) -> np.ndarray:
+        """Return a zero-copy view of samples [start, end) (default: everything written)."""
+        with self._lock:
+            data, length = self._data, self._length
+        end = length if end is None else min(end, length)
+        start = max(0, min(start, end))
+        return data[start:end]
+
+
+class PrerollBuffer:
+    """Fixed-size circular buffer that always holds the most recent samples.
+
+    Not synchronised – the owner (e.g. AudioCaptureHub) serialises access.
+    """
+
+    def __init__(self, capacity: int):
+        self._data = np.zeros(max(1, capacity), dtype=np.float32)
+        self._pos = 0
+        self._filled = 0
+
+    def __len__(self) -> int:
+        return self._filled
+
+    def clear(self) -> None:
+        self._pos = 0
+        self._filled = 0
+
+    def write(self, block: np.ndarray) -> None:
+        samples = block[:, 0] if block.ndim > 1 else block
+        capacity = len(self._data)
+        if len(samples) >= capacity:
+            self._data[:] = samples[-capacity:]
+            self._pos = 0
+            self._filled = capacity
+            return
+        end = self._pos + len(samples)
+        if end <= capacity:
+            self._data[self._pos : end] = samples
+        else:
+            split = capacity - self._pos
+            self._data[self._pos :] = samples[:split]
+            self._data[: end - capacity] = samples[split:]
+        self._pos = end % capacity
+        self._filled = min(capacity, self._filled + len(samples))
+
+    def snapshot(self) -> np.ndarray:
+        """Return a copy of the buffered samples, oldest first."""
+        if self._filled < len(self._data):
+            return self._data[: self._filled].copy()
+        return np.concatenate([self._data[self._pos :], self._data[: self._pos]])
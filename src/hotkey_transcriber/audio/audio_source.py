@@ -0,0 +1,323 @@
+"""
+Audio Source - Where microphone audio comes from: PortAudio, replayed files or a generated signal.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  AudioSource.open_stream(...)           │
+    │  → object with start/stop/close         │
+    │  → callback(indata[frames, 1] float32,  │
+    │             frames, time_info, status)  │
+    │  ┌───────────────────────────────────┐  │
+    │  │  PortAudioSource                  │  │
+    │  │  → sd.InputStream (lazy import)   │  │
+    │  └───────────────────────────────────┘  │
+    │  ┌───────────────────────────────────┐  │
+    │  │  FileAudioSource                  │  │
+    │  │  → play(wav / array), real time   │  │
+    │  │    or as fast as possible         │  │
+    │  └───────────────────────────────────┘  │
+    │  ┌───────────────────────────────────┐  │
+    │  │  SyntheticAudioSource             │  │
+    │  │  → silence / tone / noise / fn    │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+sounddevice is only imported when a PortAudio stream is opened, so the
+recorder, the VAD and the wake word listener can run on a headless box.
+
+Usage:
+    from hotkey_transcriber.audio.audio_source import FileAudioSource
+
+    source = FileAudioSource(realtime=False)
+    hub = AudioCaptureHub(source=source)
+    done = source.play_file("take.wav")
+"""
+
+import ctypes
+import ctypes.util
+import platform
+import threading
+import time
+import wave
+from abc import ABC, abstractmethod
+from contextlib import suppress
+from pathlib import Path
+
+import numpy as np
+
+_SAMPLE_RATE = 16_000
+
+
+# ---------------------------------------------------------------------- #
+# PortAudio                                                                #
+# ---------------------------------------------------------------------- #
+
+
+def _linux_lib_dir() -> Path | None:
+    if platform.system().lower() != "linux":
+        return None
+    if platform.machine().lower() not in {"x86_64", "amd64"}:
+        return None
+
+    lib_dir = Path(__file__).resolve().parent.parent / "resources" / "lib" / "linux" / "x86_64"
+    return lib_dir if lib_dir.is_dir() else None
+
+
+def _portaudio_fallback_path() -> str | None:
+    lib_dir = _linux_lib_dir()
+    if not lib_dir:
+        return None
+    candidate = lib_dir / "libportaudio.so.2.0.0"
+    return str(candidate) if candidate.is_file() else None
+
+
+def _preload_linux_audio_deps() -> None:
+    lib_dir = _linux_lib_dir()
+    if not lib_dir:
+        return
+
+    jack = lib_dir / "libjack.so.0.1.0"
+    if jack.is_file():
+        with suppress(OSError):
+            ctypes.CDLL(str(jack), mode=ctypes.RTLD_GLOBAL)
+
+
+def _import_sounddevice():
+    try:
+        import sounddevice as sd_mod
+
+        return sd_mod
+    except OSError as exc:
+        if "PortAudio library not found" not in str(exc):
+            raise
+
+        fallback = _portaudio_fallback_path()
+        if not fallback:
+            raise
+        _preload_linux_audio_deps()
+
+        original_find_library = ctypes.util.find_library
+
+        def _patched_find_library(name: str):
+            if name == "portaudio":
+                return fallback
+            return original_find_library(name)
+
+        ctypes.util.find_library = _patched_find_library
+        try:
+            import sounddevice as sd_mod
+
+            return sd_mod
+        finally:
+            ctypes.util.find_library = original_find_library
+
+
+class AudioSource(ABC):
+    """Opens input streams with the ``sounddevice.InputStream`` interface."""
+
+    @abstractmethod
+    def open_stream(self, samplerate: int, channels: int, dtype: str, blocksize: int, callback):
+        """Return an unstarted stream that calls *callback* per block."""
+
+
+class PortAudioSource(AudioSource):
+    """The real microphone via sounddevice/PortAudio (imported on first use)."""
+
+    def __init__(self, device=None):
+        self.device = device
+        self._sd = None
+
+    def open_stream(self, samplerate, channels, dtype, blocksize, callback):
+        if self._sd is None:
+            self._sd = _import_sounddevice()
+        return self._sd.InputStream(
+            samplerate=samplerate,
+            channels=channels,
+            dtype=dtype,
+            blocksize=blocksize,
+            callback=callback,
+            device=self.device,
+        )
+
+
+# ---------------------------------------------------------------------- #
+# Generated streams                                                        #
+# ---------------------------------------------------------------------- #
+
+
+class _GeneratedStream:
+    """Thread that pulls blocks from *next_block* and feeds them to *callback*.
+
+    *next_block(blocksize)* returns ``(samples, paced)``: ``samples`` is None
+    to wait for more audio; *paced* blocks are delivered at microphone speed.
+    """
+
+    def __init__(self, blocksize, callback, next_block, wake: threading.Condition):
+        self._blocksize = blocksize
+        self._callback = callback
+        self._next_block = next_block
+        self._wake = wake
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._wake:
+            self._stopped = True
+            self._wake.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def close(self):
+        self.stop()
+
+    def _run(self):
+        bs = self._blocksize
+        next_due = time.perf_counter()
+        while True:
+            with self._wake:
+                while True:
+                    if self._stopped:
+                        return
+                    samples, paced = self._next_block(bs)
+                    if samples is not None:
+                        break
+                    self._wake.wait()
+                    next_due = time.perf_counter()
+            if paced:
+                next_due += bs / _SAMPLE_RATE
+                delay = next_due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            else:
+                next_due = time.perf_counter()
+            block = np.zeros((bs, 1), dtype=np.float32)
+            block[: len(samples), 0] = samples
+            self._callback(block, bs, None, None)
+
+
+def load_wav(path) -> np.ndarray:
+    """Read a PCM WAV file as mono float32 at 16 kHz."""
+    with wave.open(str(path), "rb") as wf:
+        channels, width, rate = wf.getnchannels(), wf.getsampwidth(), wf.getframerate()
+        raw = wf.readframes(wf.getnframes())
+    dtype = {1: np.uint8, 2: np.int16, 4: np.int32}[width]
+    audio = np.frombuffer(raw, dtype=dtype).astype(np.float32)
+    if width == 1:
+        audio = (audio - 128.0) / 128.0
+    else:
+        audio /= float(2 ** (8 * width - 1))
+    if channels > 1:
+        audio = audio.reshape(-1, channels).mean(axis=1)
+    if rate != _SAMPLE_RATE:
+        n_out = int(len(audio) * _SAMPLE_RATE / rate)
+        audio = np.interp(
+            np.linspace(0, len(audio) - 1, n_out), np.arange(len(audio)), audio
+        ).astype(np.float32)
+    return audio
+
+
+class FileAudioSource(AudioSource):
+    """Replays queued clips; between clips it is silent or (with *idle_silence*) emits zeros.
+
+    With *realtime* clips are paced like a microphone, otherwise they are
+    delivered as fast as the consumer accepts them.  Idle silence is always
+    paced, so silence timeouts behave as with a real microphone.
+    """
+
+    def __init__(self, realtime: bool = True, idle_silence: bool = False):
+        self.realtime = realtime
+        self.idle_silence = idle_silence
+        self._wake = threading.Condition()
+        self._clips: list[tuple[np.ndarray, threading.Event]] = []
+        self._pos = 0
+
+    def play(self, audio: np.ndarray) -> threading.Event:
+        """Queue *audio* (mono float32, 16 kHz); the event is set once it was delivered."""
+        done = threading.Event()
+        with self._wake:
+            self._clips.append((np.asarray(audio, dtype=np.float32).reshape(-1), done))
+            self._wake.notify_all()
+        return done
+
+    def play_file(self, path) -> threading.Event:
+        return self.play(load_wav(path))
+
+    def open_stream(self, samplerate, channels, dtype, blocksize, callback):
+        return _GeneratedStream(blocksize, callback, self._next_block, self._wake)
+
+    def _next_block(self, n: int):
+        # Called with self._wake held.
+        if not self._clips:
+            return (np.zeros(n, dtype=np.float32), True) if self.idle_silence else (None, False)
+        audio, done = self._clips[0]
+        block = audio[self._pos : self._pos + n]
+        self._pos += n
+        if self._pos >= len(audio):
+            self._clips.pop(0)
+            self._pos = 0
+            done.set()
+        return block, self.realtime
+
+
+class SyntheticAudioSource(AudioSource):
+    """Generated input: ``"silence"``, ``"tone"``, ``"noise"`` or ``fn(n, offset) -> samples``.
+
+    With *duration_s* the signal ends after that many seconds and
+    ``finished`` is set; the stream then stays silent without delivering.
+    """
+
+    def __init__(
+        self,
+        signal="tone",
+        amplitude: float = 0.3,
+        frequency: float = 220.0,
+        realtime: bool = True,
+        duration_s: float | None = None,
+        seed: int = 0,
+    ):
+        self.realtime = realtime
+        self.finished = threading.Event()
+        self._amplitude = amplitude
+        self._frequency = frequency
+        self._rng = np.random.default_rng(seed)
+        self._signal = signal if callable(signal) else self._builtin(signal)
+        self._total = None if duration_s is None else int(duration_s * _SAMPLE_RATE)
+        self._offset = 0
+        self._wake = threading.Condition()
+
+    def _builtin(self, name: str):
+        if name == "silence":
+            return lambda n, offset: np.zeros(n, dtype=np.float32)
+        if name == "tone":
+
+            def _tone(n, offset):
+                t = (np.arange(n) + offset) / _SAMPLE_RATE
+                return (self._amplitude * np.sin(2 * np.pi * self._frequency * t)).astype(
+                    np.float32
+                )
+
+            return _tone
+        if name == "noise":
+            return lambda n, offset: (self._amplitude * self._rng.standard_normal(n)).astype(
+                np.float32
+            )
+        raise ValueError(f"Unbekanntes Signal: {name}")
+
+    def open_stream(self, samplerate, channels, dtype, blocksize, callback):
+        return _GeneratedStream(blocksize, callback, self._next_block, self._wake)
+
+    def _next_block(self, n: int):
+        if self._total is not None:
+            n = min(n, self._total - self._offset)
+            if n <= 0:
+                self.finished.set()
+                return None, False
+        block = self._signal(n, self._offset)
+        self._offset += n
+        return block, self.realtime
@@ -0,0 +1,156 @@
+"""
+Speech Timeline - Per-frame Silero decisions for one recording, turned into sample spans.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  SpeechTimeline                         │
+    │  ┌───────────────────────────────────┐  │
+    │  │  flags[i]: frame i is speech      │  │
+    │  │  frame i = samples [i*512, +512)  │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  speech_spans(n_samples)          │  │
+    │  │  → pad each speech run            │  │
+    │  │  → merge runs across short gaps   │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  split_points(max_segment_ms)     │  │
+    │  │  → cut long takes in the longest  │  │
+    │  │    pause of each window           │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+The span defaults mirror faster-whisper's VadOptions, so handing the spans
+to the model with vad_filter=False selects the same audio its own VAD pass
+would have selected.
+
+Usage:
+    from hotkey_transcriber.audio.speech_timeline import SpeechTimeline
+
+    timeline = SpeechTimeline(flags)
+    for start, end in timeline.speech_spans(len(audio)):
+        ...
+"""
+
+import numpy as np
+
+_SAMPLE_RATE = 16_000
+_FRAME_SIZE = 512
+
+
+class SpeechTimeline:
+    """Speech/non-speech flag per fixed-size frame, aligned to sample 0 of a recording."""
+
+    def __init__(self, flags, frame_size: int = _FRAME_SIZE, sample_rate: int = _SAMPLE_RATE):
+        self.flags = np.asarray(flags, dtype=bool)
+        self.frame_size = frame_size
+        self.sample_rate = sample_rate
+
+    def __len__(self) -> int:
+        return len(self.flags)
+
+    @property
+    def speech_frames(self) -> int:
+        return int(self.flags.sum())
+
+    @property
+    def speech_ms(self) -> float:
+        return self.speech_frames * self.frame_size * 1000 / self.sample_rate
+
+    @property
+    def speech_ratio(self) -> float:
+        return self.speech_frames / len(self.flags) if len(self.flags) else 0.0
+
+    def _ms_to_samples(self, ms: float) -> int:
+        return int(self.sample_rate * ms / 1000)
+
+    def segment(self, start: int, end: int) -> "SpeechTimeline":
+        """Return the timeline of samples [start, end); both must be frame-aligned."""
+        return SpeechTimeline(
+            self.flags[start // self.frame_size : end // self.frame_size],
+            self.frame_size,
+            self.sample_rate,
+        )
+
+    def split_points(
+        self,
+        n_samples: int | None = None,
+        max_segment_ms: float = 25_000,
+        min_segment_ms: float = 5_000,
+    ) -> list[int]:
+        """Return frame-aligned sample offsets that cut the recording into segments.
+
+        Each cut lies in the middle of the longest non-speech run between
+        *min_segment_ms* and *max_segment_ms* after the previous cut; without
+        any pause there the segment is cut hard at *max_segment_ms*.
+        """
+        if n_samples is None:
+            n_samples = len(self.flags) * self.frame_size
+        n_frames = -(-n_samples // self.frame_size)
+        max_frames = max(1, self._ms_to_samples(max_segment_ms) // self.frame_size)
+        min_frames = min(max_frames, self._ms_to_samples(min_segment_ms) // self.frame_size)
+
+        cuts: list[int] = []
+        start = 0
+        while n_frames - start > max_frames:
+            window = ~self.flags[start + min_frames : start + max_frames]
+            cut = start + max_frames
+            if window.any():
+                edges = np.diff(np.concatenate([[0], window.astype(np.int8), [0]]))
+                run_starts = np.flatnonzero(edges == 1)
+                run_ends = np.flatnonzero(edges == -1)
+                longest = int(np.argmax(run_ends - run_starts))
+                mid = (int(run_starts[longest]) + int(run_ends[longest])) // 2
+                cut = max(start + 1, start + min_frames + mid)
+            cuts.append(cut * self.frame_size)
+            start = cut
+        return cuts
+
+    def speech_spans(
+        self,
+        n_samples: int | None = None,
+        pad_ms: float = 400,
+        min_silence_ms: float = 2000,
+        edge_pad_ms: float | None = None,
+    ) -> list[tuple[int, int]]:
+        """Return padded ``(start, end)`` sample ranges of speech, merged across short gaps.
+
+        Gaps shorter than *min_silence_ms* are kept; every span is widened by
+        *pad_ms* on both sides and clipped to ``[0, n_samples)``.  With
+        *edge_pad_ms* the start of the first and the end of the last span
+        use that (usually shorter) margin instead, trimming leading and
+        trailing silence more tightly.
+        """
+        if n_samples is None:
+            n_samples = len(self.flags) * self.frame_size
+        if not self.flags.any() or n_samples <= 0:
+            return []
+
+        # Runs of speech frames as [start, end) frame indices.
+        edges = np.diff(np.concatenate([[0], self.flags.astype(np.int8), [0]]))
+        run_starts = np.flatnonzero(edges == 1)
+        run_ends = np.flatnonzero(edges == -1)
+
+        min_gap = self._ms_to_samples(min_silence_ms)
+        spans: list[list[int]] = []
+        for start_f, end_f in zip(run_starts, run_ends, strict=True):
+            start, end = int(start_f) * self.frame_size, int(end_f) * self.frame_size
+            if spans and start - spans[-1][1] < min_gap:
+                spans[-1][1] = end
+            else:
+                spans.append([start, end])
+
+        pad = self._ms_to_samples(pad_ms)
+        edge_pad = pad if edge_pad_ms is None else self._ms_to_samples(edge_pad_ms)
+        last = len(spans) - 1
+        padded: list[tuple[int, int]] = []
+        for i, (start, end) in enumerate(spans):
+            start = max(0, start - (edge_pad if i == 0 else pad))
+            end = min(n_samples, end + (edge_pad if i == last else pad))
+            if start >= end:
+                continue
+            if padded and start <= padded[-1][1]:
+                padded[-1] = (padded[-1][0], end)
+            else:
+                padded.append((start, end))
+        return padded
@@ -0,0 +1,185 @@
+"""
+VAD Worker - Run Silero VAD and the auto-stop state machine off the PortAudio callback thread.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  VadWorker                              │
+    │  ┌───────────────────────────────────┐  │
+    │  │  submit(frame)  (audio callback)  │  │
+    │  │  → deque.append, no lock, no ONNX │  │
+    │  │  → overflow counted when full     │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  _run (worker thread)             │  │
+    │  │  → vad.is_speech(frame)           │  │
+    │  │  → lag = now - capture time       │  │
+    │  │  → per-frame flag → SpeechTimeline│  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  auto-stop state machine          │  │
+    │  │  → silence timeout / initial wait │  │
+    │  │  → on_auto_stop() (own thread)    │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+The state machine is driven by the capture timestamps of the frames, so a
+lagging worker makes exactly the same decisions as inline VAD would have.
+
+Usage:
+    from hotkey_transcriber.audio.vad_worker import VadWorker
+
+    worker = VadWorker(vad, on_auto_stop=recorder.stop)
+    worker.start(silence_timeout_ms=1500, max_initial_wait_ms=5000)
+    worker.submit(indata[:, 0])      # inside the audio callback
+    worker.stop()
+    timeline = worker.timeline()     # None if frames were dropped
+"""
+
+import collections
+import threading
+import time
+
+import numpy as np
+
+from hotkey_transcriber.audio.speech_timeline import SpeechTimeline
+
+_POLL_INTERVAL_S = 0.005
+
+
+class VadWorker:
+    """Consume 512-sample frames on a dedicated thread and publish speech state.
+
+    *vad* must provide ``reset()`` and ``is_speech(frame)``.  *on_auto_stop*
+    is called (on a fresh thread) once the silence timeout or the initial
+    wait expires.
+    """
+
+    def __init__(self, vad, on_auto_stop, max_pending_frames: int = 256):
+        self._vad = vad
+        self._on_auto_stop = on_auto_stop
+        # deque.append/popleft are atomic, so the audio callback never blocks.
+        self._frames: collections.deque = collections.deque(maxlen=max_pending_frames)
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._active = False
+        self._silence_timeout_ms = 1500
+        self._max_initial_wait_ms: int | None = None
+        self._start_time: float | None = None
+        self._silence_start_time: float | None = None
+        self._speech_detected = False
+        self.last_is_speech = False
+        self.lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.overflows = 0
+        self.frames_processed = 0
+        self._flags: list[bool] = []
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    @property
+    def speech_detected(self) -> bool:
+        return self._speech_detected
+
+    def start(
+        self,
+        silence_timeout_ms: int,
+        max_initial_wait_ms: int | None,
+        start_time: float | None = None,
+    ) -> None:
+        """Reset the state machine and start the worker thread for a new recording."""
+        self.stop()
+        self._frames.clear()
+        self._vad.reset()
+        self._silence_timeout_ms = silence_timeout_ms
+        self._max_initial_wait_ms = max_initial_wait_ms
+        self._start_time = time.time() if start_time is None else start_time
+        self._silence_start_time = None
+        self._speech_detected = False
+        self.last_is_speech = False
+        self.lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self.overflows = 0
+        self.frames_processed = 0
+        self._flags = []
+        self._active = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the worker after it has processed every submitted frame."""
+        self._stop_event.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._active = False
+
+    def timeline(self) -> SpeechTimeline | None:
+        """Per-frame speech flags of the last recording, or None if frames were dropped."""
+        if self.overflows:
+            return None
+        return SpeechTimeline(self._flags)
+
+    def submit(self, frame: np.ndarray, capture_time: float | None = None) -> None:
+        """Queue *frame* (copied) for classification.  Safe to call from the audio callback."""
+        if len(self._frames) == self._frames.maxlen:
+            self.overflows += 1  # the oldest frame is dropped by the deque
+        self._frames.append(
+            (
+                np.array(frame, dtype=np.float32),
+                time.time() if capture_time is None else capture_time,
+            )
+        )
+
+    # ------------------------------------------------------------------ #
+    # Worker thread                                                        #
+    # ------------------------------------------------------------------ #
+
+    def _run(self) -> None:
+        while True:
+            stopping = self._stop_event.is_set()
+            while self._frames:
+                frame, capture_time = self._frames.popleft()
+                self._process(frame, capture_time)
+            if stopping:
+                return
+            time.sleep(_POLL_INTERVAL_S)
+
+    def _process(self, frame: np.ndarray, now: float) -> None:
+        try:
+            is_speech = self._vad.is_speech(frame)
+        except Exception:
+            is_speech = True  # Fallback if VAD fails
+
+        self.last_is_speech = is_speech
+        self._flags.append(is_speech)
+        self.frames_processed += 1
+        self.lag_ms = max(0.0, (time.time() - now) * 1000)
+        self.max_lag_ms = max(self.max_lag_ms, self.lag_ms)
+
+        if not self._active:
+            return
+
+        if is_speech:
+            self._speech_detected = True
+            self._silence_start_time = now
+        else:
+            if not self._speech_detected:
+                if (
+                    self._max_initial_wait_ms is not None
+                    and self._start_time is not None
+                    and (now - self._start_time) * 1000 > self._max_initial_wait_ms
+                ):
+                    self._trigger_auto_stop()
+                return
+
+            if self._silence_start_time is None:
+                self._silence_start_time = now
+            elif (now - self._silence_start_time) * 1000 > self._silence_timeout_ms:
+                self._trigger_auto_stop()
+
+    def _trigger_auto_stop(self) -> None:
+        self._active = False
+        threading.Thread(target=self._on_auto_stop, daemon=True).start()
@@ -23,6 +23,7 @@ Usage:
 
 import sys
 
+from PyQt5.QtCore import QTimer
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QAction, QActionGroup, QApplication, QMenu, QSystemTrayIcon
 
@@ -241,6 +242,7 @@ class TrayApp:
         menu.addSeparator()
 
         self._build_model_menu(menu)
+        self._build_worker_status_action(menu)
         self._build_language_menu(menu)
         menu.addSeparator()
         self._build_wake_word_menu(menu)
@@ -257,6 +259,7 @@ class TrayApp:
         act_exit.triggered.connect(
             lambda: (
                 self.recorder.stop(),
+                self.recorder.close(),
                 self.ww_listener.stop(),
                 self.hotkey_ref[0].stop(),
                 self.app.quit(),
@@ -306,6 +309,8 @@ class TrayApp:
                     compute_type=self.compute_type,
                     backend=self.backend,
                     engine=self.engine,
+                    num_workers=self.config.get("transcription_workers", 1),
+                    worker_standby=self.config.get("worker_standby_enabled", False),
                 )
             except Exception as exc:
                 self.notifier.notify(
@@ -324,6 +329,43 @@ class TrayApp:
 
         return slot
 
+    def _build_worker_status_action(self, parent_menu: QMenu) -> None:
+        """Read-only status line for supervised WSL/NPU workers, refreshed by a QTimer."""
+        self._act_worker_status = self._keep_qt_ref(QAction(parent_menu))
+        self._act_worker_status.setEnabled(False)
+        parent_menu.addAction(self._act_worker_status)
+        self._worker_supervisor = None
+        self._worker_restarts_seen = 0
+        self._worker_timer = self._keep_qt_ref(QTimer())
+        self._worker_timer.timeout.connect(self._refresh_worker_status)
+        self._worker_timer.start(2000)
+        self._refresh_worker_status()
+
+    def _refresh_worker_status(self) -> None:
+        supervisor = getattr(self.recorder.model, "supervisor", None)
+        self._act_worker_status.setVisible(supervisor is not None)
+        if supervisor is None:
+            return
+        if supervisor is not self._worker_supervisor:
+            # Model switched: a new supervisor starts counting from zero.
+            self._worker_supervisor = supervisor
+            self._worker_restarts_seen = 0
+        stats = supervisor.stats()
+        state = {"running": "bereit", "restarting": "startet neu", "stopped": "beendet"}
+        text = (
+            f"{stats['name']}-Worker: {state.get(stats['state'], stats['state'])}, "
+            f"{stats['restarts']} Neustarts, {stats['downtime_s']:.0f}s Ausfall"
+        )
+        if stats["standby"] is not None:
+            text += ", Standby bereit" if stats["standby"] else ", Standby laedt"
+        self._act_worker_status.setText(text)
+        self._act_worker_status.setToolTip(stats["last_error"] or "")
+        if stats["restarts"] > self._worker_restarts_seen:
+            self._worker_restarts_seen = stats["restarts"]
+            self.notifier.notify(
+                "Worker neu gestartet", stats["last_error"] or f"{stats['name']}-Worker"
+            )
+
     def _build_language_menu(self, parent_menu: QMenu) -> None:
         lang_menu = parent_menu.addMenu("Erkennungssprache")
         assert lang_menu is not None
@@ -0,0 +1,228 @@
+"""
+Focus Tracker - Caches the focused application from AT-SPI window events, no tree walk per paste.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  FocusTracker                           │
+    │  ┌───────────────────────────────────┐  │
+    │  │  listener thread (own GLib loop)  │  │
+    │  │  → window:activate: app name      │  │
+    │  │  → window:deactivate: clear       │  │
+    │  │  → heartbeat every heartbeat_s:   │  │
+    │  │    loop runs, registry answers    │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  cache: focused app name          │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  focused_app() / is_terminal()    │  │
+    │  │  → listener healthy: O(1)         │  │
+    │  │  → no listener or heartbeat       │  │
+    │  │    missed: walk the desktop       │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+The listener runs ``Atspi`` on its own ``GLib.MainContext``, so it does not
+compete with the Qt/GLib loop of the main thread.  The cache stays valid for
+as long as the user keeps a window focused; what can go stale is the event
+stream itself.  A heartbeat on the listener's context checks that its loop
+still runs and the AT-SPI registry still answers.  When a heartbeat is
+missed, lookups fall back to a direct query; when the registry is gone, the
+listener is set up again.
+
+Usage:
+    from hotkey_transcriber.keyboard.focus_tracker import is_terminal_focused
+
+    if is_terminal_focused():
+        ...                                     # paste with Ctrl+Shift+V
+"""
+
+import threading
+import time
+
+TERMINAL_APP_NAMES = frozenset(
+    {
+        "gnome-terminal-server",
+        "konsole",
+        "xfce4-terminal",
+        "mate-terminal",
+        "lxterminal",
+        "tilix",
+        "terminator",
+        "guake",
+        "yakuake",
+        "sakura",
+        "alacritty",
+        "kitty",
+        "wezterm",
+        "foot",
+        "st",
+        "urxvt",
+        "xterm",
+    }
+)
+
+_FOCUS_EVENTS = ("window:activate", "window:deactivate")
+
+
+def query_active_app() -> str | None:
+    """Walk the AT-SPI desktop for the ACTIVE window; returns its application name."""
+    try:
+        import gi
+
+        gi.require_version("Atspi", "2.0")
+        from gi.repository import Atspi
+
+        Atspi.init()
+        desktop = Atspi.get_desktop(0)
+        for i in range(desktop.get_child_count()):
+            app = desktop.get_child_at_index(i)
+            for j in range(app.get_child_count()):
+                win = app.get_child_at_index(j)
+                if win.get_state_set().contains(Atspi.StateType.ACTIVE):
+                    return app.get_name()
+    except Exception:
+        pass
+    return None
+
+
+class FocusTracker:
+    """Focused application name, kept current by AT-SPI focus events."""
+
+    def __init__(self, query=query_active_app, heartbeat_s: float = 5.0, clock=time.monotonic):
+        self._query = query
+        self._heartbeat_s = heartbeat_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._app: str | None = None
+        self._heartbeat_at: float | None = None
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------ #
+    # Lookup                                                               #
+    # ------------------------------------------------------------------ #
+
+    def focused_app(self) -> str | None:
+        if self._listener_healthy():
+            with self._lock:
+                return self._app
+        return self._query()
+
+    def is_terminal(self) -> bool:
+        return self.focused_app() in TERMINAL_APP_NAMES
+
+    def _listener_healthy(self) -> bool:
+        beat = self._heartbeat_at
+        return beat is not None and self._clock() - beat < 3 * self._heartbeat_s
+
+    # ------------------------------------------------------------------ #
+    # Events                                                               #
+    # ------------------------------------------------------------------ #
+
+    def on_activate(self, app_name: str | None) -> None:
+        with self._lock:
+            self._app = app_name
+
+    def on_deactivate(self, app_name: str | None) -> None:
+        # Focus may move to a window without AT-SPI; until its activate arrives, nothing is active.
+        with self._lock:
+            if self._app == app_name:
+                self._app = None
+
+    def _beat(self) -> None:
+        self._heartbeat_at = self._clock()
+
+    # ------------------------------------------------------------------ #
+    # Listener thread                                                      #
+    # ------------------------------------------------------------------ #
+
+    def start(self) -> None:
+        """Start the event listener in the background (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._listen, name="focus-tracker", daemon=True)
+        self._thread.start()
+
+    def _listen(self) -> None:
+        try:
+            import gi
+
+            gi.require_version("Atspi", "2.0")
+            from gi.repository import Atspi, GLib
+        except Exception:
+            return  # no AT-SPI bindings: every lookup stays a direct query
+        reported = False
+        while True:
+            try:
+                self._run_listener(Atspi, GLib)
+            except Exception as exc:
+                if not reported:
+                    print(f"[focus] AT-SPI-Events nicht verfuegbar: {exc}", flush=True)
+                    reported = True
+            # The registry went away (session restart, crash): register again later.
+            time.sleep(6 * self._heartbeat_s)
+
+    def _run_listener(self, Atspi, GLib) -> None:
+        context = GLib.MainContext.new()
+        context.push_thread_default()
+        try:
+            Atspi.init()
+            Atspi.set_main_context(context)
+            listener = Atspi.EventListener.new(self._on_event)
+            for event in _FOCUS_EVENTS:
+                listener.register(event)
+            self.on_activate(self._query())
+            desktop = Atspi.get_desktop(0)
+            loop = GLib.MainLoop.new(context, False)
+
+            def heartbeat():
+                try:
+                    desktop.get_child_count()  # a round trip to the registry
+                except Exception:
+                    loop.quit()
+                    return False
+                self._beat()
+                return True
+
+            heartbeat()
+            source = GLib.timeout_source_new(int(self._heartbeat_s * 1000))
+            source.set_callback(heartbeat)
+            source.attach(context)
+            try:
+                loop.run()
+            finally:
+                source.destroy()
+                for event in _FOCUS_EVENTS:
+                    listener.deregister(event)
+        finally:
+            self._heartbeat_at = None
+            context.pop_thread_default()
+
+    def _on_event(self, event) -> None:
+        try:
+            app_name = event.source.get_application().get_name()
+        except Exception:
+            app_name = None
+        if event.type == "window:activate":
+            self.on_activate(app_name)
+        else:
+            self.on_deactivate(app_name)
+
+
+_tracker: FocusTracker | None = None
+_tracker_lock = threading.Lock()
+
+
+def get_focus_tracker() -> FocusTracker:
+    """The process-wide tracker; its listener is started on first use."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = FocusTracker()
+            _tracker.start()
+        return _tracker
+
+
+def is_terminal_focused() -> bool:
+    """Detect if the focused window is a terminal emulator (cached AT-SPI focus)."""
+    return get_focus_tracker().is_terminal()
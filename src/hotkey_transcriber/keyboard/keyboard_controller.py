@@ -1,3 +1,4 @@
+import contextlib
 import os
 import shutil
 import subprocess
@@ -5,10 +6,16 @@ import sys
 import threading
 import time
 import types
+from abc import ABC, abstractmethod
 
 import keyboard
 import pyperclip
 
+from hotkey_transcriber.keyboard.focus_tracker import get_focus_tracker, is_terminal_focused
+from hotkey_transcriber.keyboard.keyboard_layout import get_keyboard_layout
+from hotkey_transcriber.keyboard.ydotool_socket import YdotoolSocket, qwerty_key_events
+from hotkey_transcriber.latency_tracker import mark_stage
+
 
 def _ensure_display_env():
     """
@@ -53,58 +60,25 @@ def _ensure_display_env():
 # ydotool backend
 # ---------------------------------------------------------------------------
 
-def _detect_yz_swap() -> bool:
-    """Return True if the active keyboard layout swaps Y and Z (QWERTZ).
-
-    Checks GNOME gsettings first (works on Wayland), then falls back to
-    localectl / setxkbmap.  Layouts that swap Y/Z: de, ch, at, etc.
-    """
-    _qwertz_prefixes = ("de", "ch", "at", "cz", "sk", "hu", "si", "hr", "ba", "rs", "me")
-    # GNOME / gsettings (most reliable on Wayland)
-    try:
-        proc = subprocess.run(
-            ["gsettings", "get", "org.gnome.desktop.input-sources", "sources"],
-            capture_output=True, text=True, timeout=3,
-        )
-        out = proc.stdout.strip().lower()
-        # e.g. "[('xkb', 'ch+de_nodeadkeys')]"
-        for prefix in _qwertz_prefixes:
-            if f"'{prefix}" in out or f'"{prefix}' in out:
-                return True
-    except Exception:
-        pass
-    # localectl fallback
-    try:
-        proc = subprocess.run(
-            ["localectl", "status"],
-            capture_output=True, text=True, timeout=3,
-        )
-        for line in proc.stdout.lower().splitlines():
-            if "layout" in line:
-                for prefix in _qwertz_prefixes:
-                    if prefix in line:
-                        return True
-    except Exception:
-        pass
-    return False
-
-
 # Y↔Z translation table for QWERTZ layouts
 _YZ_SWAP = str.maketrans("yzYZ", "zyZY")
 
 
-class _YdotoolBackend:
-    """
-    Wrapper around ydotool v1.x CLI with a pyautogui-compatible API.
-    Requires ydotoold daemon (started via systemd user service).
-    Works on both X11 and Wayland.
+def _connect_ydotool_socket() -> YdotoolSocket | None:
+    try:
+        return YdotoolSocket()
+    except OSError:
+        return None
 
-    ydotool v1.x uses raw Linux input-event-codes for the ``key`` command.
+
+class _RawKeyBackend(ABC):
+    """
+    pyautogui-compatible hotkey/press/keyUp on top of raw Linux KEY_* codes.
     See /usr/include/linux/input-event-codes.h for the full list.
 
-    ``ydotool type`` maps characters via a built-in QWERTY table.  On QWERTZ
-    layouts (de, ch, at, …) Y and Z are swapped, so we pre-swap them in the
-    text before passing it to ydotool.
+    Subclasses deliver the (code, value) events: ydotoold or a uinput device.
+    Both inject physical key positions that the compositor maps through the
+    active layout, so on QWERTZ layouts (de, ch, at, …) Y and Z are swapped.
     """
 
     # Map pyautogui-style names → Linux KEY_* codes (decimal)
@@ -120,61 +94,125 @@ class _YdotoolBackend:
         "ctrl": 29, "ctrlleft": 29, "ctrlright": 97,
         "alt": 56, "altleft": 56, "altright": 100,
         "shift": 42, "shiftleft": 42, "shiftright": 54,
-        # Letters / digits used by hotkey combos (ctrl+z, ctrl+v, …)
-        "v": 47, "z": 44, "y": 21, "c": 46, "x": 45, "a": 30,
+        # Letters / digits used by hotkey combos (ctrl+z, ctrl+v, ctrl+shift+u, …)
+        "v": 47, "z": 44, "y": 21, "c": 46, "x": 45, "a": 30, "u": 22,
     }
 
     # On QWERTZ layouts, KEY_Y (21) and KEY_Z (44) are physically swapped.
-    # ydotool sends raw keycodes that the compositor maps via the active layout,
+    # Raw keycodes are mapped by the compositor via the active layout,
     # so we must swap the codes to hit the intended character.
     _YZ_CODE_SWAP = {44: 21, 21: 44}
 
     def __init__(self):
-        self._yz_swap = _detect_yz_swap()
+        self._layout = get_keyboard_layout()
+
+    @property
+    def _yz_swap(self) -> bool:
+        # Read per keystroke: the layout watcher updates it when the input source changes.
+        return self._layout.yz_swap
+
+    @abstractmethod
+    def send_keys(self, events, interval=0):
+        """Inject (code, value) key events; 1 = down, 0 = up."""
+
+    @abstractmethod
+    def text_events(self, text: str) -> list[tuple[int, int]]:
+        """Key events that type *text*; ValueError if the backend cannot type it."""
 
     def _k(self, key: str) -> int:
         code = self._KEYMAP.get(key.lower())
         if code is None:
-            raise ValueError(f"Unknown key for ydotool: {key!r}")
+            raise ValueError(f"Unknown key for {type(self).__name__}: {key!r}")
         if self._yz_swap:
             code = self._YZ_CODE_SWAP.get(code, code)
         return code
 
-    @staticmethod
-    def _run(args, timeout):
-        proc = subprocess.run(args, capture_output=True, timeout=timeout, text=True)
-        if proc.returncode != 0:
-            err = (proc.stderr or proc.stdout or "").strip()
-            raise RuntimeError(err or f"ydotool exited with code {proc.returncode}")
-        return proc
+    def hotkey_events(self, *keys) -> list[tuple[int, int]]:
+        codes = [self._k(k) for k in keys]
+        # Press all keys down, then release in reverse order
+        return [(c, 1) for c in codes] + [(c, 0) for c in reversed(codes)]
+
+    def press_events(self, key, presses=1) -> list[tuple[int, int]]:
+        code = self._k(key)
+        return [(code, 1), (code, 0)] * max(1, int(presses))
 
     def hotkey(self, *keys):
         """Press a key combo using raw keycodes.  E.g. hotkey("ctrl", "v")."""
-        codes = [self._k(k) for k in keys]
-        # Build sequence: press all keys down, then release in reverse order
-        seq = [f"{c}:1" for c in codes] + [f"{c}:0" for c in reversed(codes)]
-        self._run(["ydotool", "key", *seq], timeout=5)
+        self.send_keys(self.hotkey_events(*keys))
 
     def keyUp(self, key):
         """Release a key.  Needed to cancel physical modifiers (e.g. Alt from
         the hotkey) before injecting a new combo like Ctrl+V."""
-        code = self._k(key)
-        self._run(["ydotool", "key", f"{code}:0"], timeout=5)
+        self.send_keys([(self._k(key), 0)])
 
     def press(self, key, presses=1, interval=0):
-        code = self._k(key)
-        seq = []
-        for _ in range(max(1, int(presses))):
-            seq += [f"{code}:1", f"{code}:0"]
+        self.send_keys(self.press_events(key, presses), interval)
+
+
+class _YdotoolBackend(_RawKeyBackend):
+    """
+    Wrapper around ydotool v1.x with a pyautogui-compatible API.
+    Requires ydotoold daemon (started via systemd user service).
+    Works on both X11 and Wayland.
+
+    Key events are written straight to ydotoold's socket (YdotoolSocket);
+    the ydotool CLI is only spawned when the socket is unreachable or the
+    text contains characters outside ydotool's QWERTY table.
+
+    ``ydotool type`` maps characters via a built-in QWERTY table.  On QWERTZ
+    layouts Y and Z are swapped, so we pre-swap them in the text before
+    passing it to ydotool.
+    """
+
+    def __init__(self, sock: YdotoolSocket | None = None):
+        super().__init__()
+        self._socket = sock or _connect_ydotool_socket()
+
+    @property
+    def uses_socket(self) -> bool:
+        return self._socket is not None
+
+    def _drop_socket(self, exc: Exception) -> None:
+        _safe_print(f"⚠️ ydotoold-Socket nicht nutzbar ({exc}). Fallback auf ydotool-CLI.")
+        self._socket.close()
+        self._socket = None
+
+    def send_keys(self, events, interval=0):
+        """Send (code, value) events via the socket, or as one ``ydotool key`` call."""
+        if self._socket is not None:
+            try:
+                self._socket.send_keys(events, delay_s=interval)
+                return
+            except OSError as exc:
+                self._drop_socket(exc)
         args = ["ydotool", "key"]
         if interval:
             args += ["--key-delay", str(int(interval * 1000))]
-        args += seq
+        args += [f"{code}:{value}" for code, value in events]
         self._run(args, timeout=5)
 
+    @staticmethod
+    def _run(args, timeout):
+        proc = subprocess.run(args, capture_output=True, timeout=timeout, text=True)
+        if proc.returncode != 0:
+            err = (proc.stderr or proc.stdout or "").strip()
+            raise RuntimeError(err or f"ydotool exited with code {proc.returncode}")
+        return proc
+
+    def text_events(self, text):
+        return qwerty_key_events(text.translate(_YZ_SWAP) if self._yz_swap else text)
+
     def write(self, text, interval=0):
         if self._yz_swap:
             text = text.translate(_YZ_SWAP)
+        if self._socket is not None:
+            try:
+                self._socket.type_text(text, delay_s=interval)
+                return
+            except ValueError:
+                pass  # characters outside the QWERTY table: leave them to ydotool type
+            except OSError as exc:
+                self._drop_socket(exc)
         args = ["ydotool", "type"]
         if interval:
             args += ["--key-delay", str(int(interval * 1000))]
@@ -184,35 +222,101 @@ class _YdotoolBackend:
         self._run(args, timeout=10)
 
 
-_TERMINAL_APP_NAMES = frozenset({
-    "gnome-terminal-server", "konsole", "xfce4-terminal", "mate-terminal",
-    "lxterminal", "tilix", "terminator", "guake", "yakuake", "sakura",
-    "alacritty", "kitty", "wezterm", "foot", "st", "urxvt", "xterm",
-})
+# ---------------------------------------------------------------------------
+# uinput backend
+# ---------------------------------------------------------------------------
+
+# Characters on their US QWERTY keys in every layout with a verified table
+# (KeyboardLayout.typing_verified: us, de, ch, at; Y/Z aside).  On other
+# layouts only whitespace is typed; everything else goes through the clipboard.
+_LAYOUT_SAFE_CHARS = frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 ,.\n\t"
+)
+_WHITESPACE_CHARS = frozenset(" \n\t")
+
+# Short texts are typed key by key; longer ones are pasted (faster, no autocomplete races).
+_MAX_TYPED_CHARS = 80
 
 
-def is_terminal_focused() -> bool:
-    """Detect if the focused window is a terminal emulator via AT-SPI."""
-    try:
-        import gi
-        gi.require_version("Atspi", "2.0")
-        from gi.repository import Atspi
-        Atspi.init()
-        desktop = Atspi.get_desktop(0)
-        for i in range(desktop.get_child_count()):
-            app = desktop.get_child_at_index(i)
-            for j in range(app.get_child_count()):
-                win = app.get_child_at_index(j)
-                states = win.get_state_set()
-                if states.contains(Atspi.StateType.ACTIVE):
-                    return app.get_name() in _TERMINAL_APP_NAMES
-    except Exception:
-        pass
-    return False
+# The hotkey listener skips this device; it must never bind to the app's own output.
+UINPUT_DEVICE_NAME = "hotkey-transcriber virtual input"
+
+
+def _create_uinput():
+    """Persistent virtual keyboard; needs write access to /dev/uinput."""
+    from evdev import UInput, ecodes
+
+    return UInput({ecodes.EV_KEY: list(range(1, 256))}, name=UINPUT_DEVICE_NAME)
+
+
+def _ibus_active() -> bool:
+    """IBus (GNOME's default input method) turns Ctrl+Shift+U <hex> Space into a character."""
+    im_vars = (os.environ.get(k, "") for k in ("GTK_IM_MODULE", "QT_IM_MODULE", "XMODIFIERS"))
+    return any("ibus" in value.lower() for value in im_vars)
+
+
+class _UinputBackend(_RawKeyBackend):
+    """
+    Virtual keyboard on /dev/uinput via evdev, created once and kept open.
+    Works on both X11 and Wayland without a daemon or a process per call.
+
+    Text made of layout-safe characters is typed directly, as long as the
+    active layout has a verified key table.  With *unicode_input* (opt-in,
+    only honoured under IBus) any other character is entered as
+    Ctrl+Shift+U, its hex code point, Space; apps that do not route input
+    through IBus would show that sequence literally.  For everything else
+    ``can_type`` is False and KeyboardController pastes via the clipboard.
+    """
+
+    def __init__(self, device=None, unicode_input: bool = False):
+        super().__init__()
+        self._device = device if device is not None else _create_uinput()
+        self._unicode_input = unicode_input
+
+    def send_keys(self, events, interval=0):
+        from evdev import ecodes
+
+        for i, (code, value) in enumerate(events):
+            if interval and i:
+                time.sleep(interval)
+            self._device.write(ecodes.EV_KEY, code, value)
+            self._device.syn()
+
+    def _types_as_key(self, char: str) -> bool:
+        return char in _WHITESPACE_CHARS or (
+            char in _LAYOUT_SAFE_CHARS and self._layout.typing_verified
+        )
+
+    def can_type(self, text: str) -> bool:
+        if self._unicode_input and self._layout.typing_verified:
+            return True
+        return all(self._types_as_key(c) for c in text)
+
+    def text_events(self, text: str):
+        events = []
+        for char in text:
+            if self._types_as_key(char):
+                events += qwerty_key_events(char.translate(_YZ_SWAP) if self._yz_swap else char)
+            elif self._unicode_input and self._layout.typing_verified:
+                events += self.hotkey_events("ctrl", "shift", "u")
+                events += qwerty_key_events(f"{ord(char):x} ")
+            else:
+                raise ValueError(f"Zeichen {char!r} ist per uinput nicht tippbar")
+        return events
+
+    def write(self, text, interval=0):
+        self.send_keys(self.text_events(text), interval)
+
+    def close(self):
+        self._device.close()
 
 
 def _ydotool_available() -> bool:
-    """Check if ydotool v1.x is installed with ydotoold running."""
+    """Check if ydotoold is running (socket reachable) or ydotool v1.x works via the CLI."""
+    sock = _connect_ydotool_socket()
+    if sock is not None:
+        sock.close()
+        return True
     if not shutil.which("ydotool"):
         return False
     # v1.x requires ydotoold – test by running a no-op key command.
@@ -230,10 +334,10 @@ def _ydotool_available() -> bool:
 # Backend loader
 # ---------------------------------------------------------------------------
 
-def _load_input_backend():
+def _load_input_backend(unicode_input: bool = False):
     """
     Platform-specific backend selection:
-      Linux:   ydotool → pyautogui → keyboard
+      Linux:   uinput → ydotool → pyautogui → keyboard
       Windows: pyautogui → keyboard
       Other:   pyautogui → keyboard
     """
@@ -245,9 +349,14 @@ def _load_input_backend():
     mouseinfo_stub.MouseInfoWindow = lambda *args, **kw: None
     sys.modules["mouseinfo"] = mouseinfo_stub
 
-    # Linux: prefer ydotool (works on Wayland and X11)
-    if sys.platform == "linux" and _ydotool_available():
-        return "ydotool", _YdotoolBackend(), None
+    # Linux: prefer an own uinput device, then ydotool (both work on Wayland and X11)
+    if sys.platform == "linux":
+        try:
+            return "uinput", _UinputBackend(unicode_input=unicode_input and _ibus_active()), None
+        except Exception:
+            pass  # evdev missing or /dev/uinput not writable
+        if _ydotool_available():
+            return "ydotool", _YdotoolBackend(), None
 
     try:
         import pyautogui  # type: ignore
@@ -256,6 +365,10 @@ def _load_input_backend():
         return "keyboard", keyboard, exc
 
 
+# Backends with the pyautogui-style hotkey/press/keyUp/write API
+_RAW_KEY_BACKENDS = ("pyautogui", "ydotool", "uinput")
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -275,19 +388,26 @@ class KeyboardController:
     Wraps undo/paste logic with clipboard restore and internal lock.
     """
 
-    def __init__(self, wait: float = 0.05):
+    def __init__(self, wait: float = 0.05, unicode_input: bool = False):
         self.wait = wait
         self.clipboard_content = None
         self.lock = threading.Lock()
-        self.backend_name, self.backend, self.pyautogui_error = _load_input_backend()
+        self.backend_name, self.backend, self.pyautogui_error = _load_input_backend(
+            unicode_input=unicode_input
+        )
         self._backend_error_reported = False
-        if self.backend_name == "ydotool":
-            _safe_print("✅ ydotool-Backend aktiv.")
+        if self.backend_name == "uinput":
+            _safe_print("✅ uinput-Backend aktiv (virtuelle Tastatur).")
+        elif self.backend_name == "ydotool":
+            via = "ydotoold-Socket" if self.backend.uses_socket else "ydotool-CLI"
+            _safe_print(f"✅ ydotool-Backend aktiv ({via}).")
         elif self.pyautogui_error is not None:
             _safe_print(
                 f"⚠️ pyautogui nicht nutzbar ({self.pyautogui_error}). "
                 "Fallback auf keyboard-Backend."
             )
+        if self.backend_name in ("ydotool", "uinput"):
+            get_focus_tracker()  # start listening for focus changes before the first paste
 
     def _mark_backend_unavailable(self, exc: Exception) -> None:
         if not self._backend_error_reported:
@@ -301,7 +421,7 @@ class KeyboardController:
     def undo(self):
         """Send Ctrl+Z."""
         with self.lock:
-            if self.backend_name in ("pyautogui", "ydotool"):
+            if self.backend_name in _RAW_KEY_BACKENDS:
                 try:
                     self.backend.hotkey("ctrl", "z")
                 except Exception as exc:
@@ -316,75 +436,190 @@ class KeyboardController:
     def backspace(self, n_times=1):
         """Send Backspace n times."""
         with self.lock:
-            if self.backend_name in ("pyautogui", "ydotool"):
+            self._backspace(n_times)
+
+    def _backspace(self, n_times=1):
+        if self.backend_name in _RAW_KEY_BACKENDS:
+            try:
+                self.backend.press("backspace", presses=n_times, interval=0)
+            except Exception as exc:
+                self._mark_backend_unavailable(exc)
+        elif self.backend_name == "keyboard":
+            for _ in range(max(1, int(n_times))):
                 try:
-                    self.backend.press("backspace", presses=n_times, interval=0)
+                    self.backend.send("backspace")
                 except Exception as exc:
                     self._mark_backend_unavailable(exc)
-            elif self.backend_name == "keyboard":
-                for _ in range(max(1, int(n_times))):
-                    try:
-                        self.backend.send("backspace")
-                    except Exception as exc:
-                        self._mark_backend_unavailable(exc)
-                        break
+                    break
 
     def press(self, key: str, presses: int = 1, interval: float = 0):
         """Press a single key one or more times."""
         with self.lock:
-            if self.backend_name in ("pyautogui", "ydotool"):
+            self._press(key, presses, interval)
+
+    def _press(self, key: str, presses: int = 1, interval: float = 0):
+        if self.backend_name in _RAW_KEY_BACKENDS:
+            try:
+                self.backend.press(key, presses=presses, interval=interval)
+            except Exception as exc:
+                self._mark_backend_unavailable(exc)
+        elif self.backend_name == "keyboard":
+            for _ in range(max(1, int(presses))):
                 try:
-                    self.backend.press(key, presses=presses, interval=interval)
+                    self.backend.send(key)
                 except Exception as exc:
                     self._mark_backend_unavailable(exc)
-            elif self.backend_name == "keyboard":
-                for _ in range(max(1, int(presses))):
-                    try:
-                        self.backend.send(key)
-                    except Exception as exc:
-                        self._mark_backend_unavailable(exc)
-                        break
+                    break
 
     def paste(self, text: str, end="\n"):
         """
         Type text into the focused window via clipboard + Ctrl+V.
         This handles Unicode, emojis, and all keyboard layouts correctly.
+        The uinput backend types short texts directly and skips the clipboard.
         """
         with self.lock:
-            _safe_print(text, end=end, flush=True)
-            pyperclip.copy(text)
+            self._paste(text, end)
+
+    def _paste(self, text: str, end="\n"):
+        _safe_print(text, end=end, flush=True)
+        if self._can_type_directly(text):
+            try:
+                self.backend.write(text)
+            except Exception as exc:
+                self._mark_backend_unavailable(exc)
+            return
+        self._paste_via_clipboard(text)
+
+    def _can_type_directly(self, text: str) -> bool:
+        return (
+            self.backend_name == "uinput"
+            and len(text) <= _MAX_TYPED_CHARS
+            and self.backend.can_type(text)
+        )
+
+    def _paste_hotkey(self, terminal: bool) -> tuple[str, ...]:
+        # Terminals paste with Ctrl+Shift+V; Ctrl+V would arrive as a literal ^V.
+        return ("ctrl", "shift", "v") if terminal else ("ctrl", "v")
+
+    def _paste_via_clipboard(self, text: str):
+        """Clipboard + Ctrl+V; caller holds self.lock."""
+        pyperclip.copy(text)
+        time.sleep(self.wait)
+        if self.backend_name in ("ydotool", "uinput"):
+            try:
+                self.backend.hotkey(*self._paste_hotkey(is_terminal_focused()))
+            except Exception as exc:
+                self._mark_backend_unavailable(exc)
+        elif self.backend_name == "pyautogui":
+            self.backend.keyUp("altleft")
+            self.backend.keyUp("altright")
             time.sleep(self.wait)
-            if self.backend_name == "ydotool":
+            self.backend.hotkey("ctrl", "v")
+        elif self.backend_name == "keyboard":
+            try:
+                self.backend.send("ctrl+v")
+            except Exception as exc:
+                self._mark_backend_unavailable(exc)
+        time.sleep(self.wait)
+
+    def write(self, text: str, end="\n", interval=0):
+        with self.lock:
+            self._write(text, end, interval)
+
+    def _write(self, text: str, end="\n", interval=0):
+        _safe_print(text, end=end, flush=True)
+        if self.backend_name == "uinput" and not self.backend.can_type(text):
+            self._paste_via_clipboard(text)
+            return
+        try:
+            if self.backend_name == "keyboard":
+                self.backend.write(text, delay=interval)
+            elif self.backend_name in _RAW_KEY_BACKENDS:
+                self.backend.write(text, interval=interval)
+        except Exception as exc:
+            self._mark_backend_unavailable(exc)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Collect key operations and send them as one batch while holding the lock.
+
+        On ydotool and uinput the whole batch becomes one key-event list
+        (one ``ydotool key`` call or one burst to the socket or device)
+        followed by a single settle delay.  A clipboard paste ends its burst
+        with Ctrl+V and waits before any further keys, since the target app
+        fetches the clipboard asynchronously.  Other backends run the
+        operations back to back.  Nothing is sent if the block raises.
+
+            with keyb_c.transaction() as keys:
+                keys.paste(text)
+                keys.write(" ")
+        """
+        tx = KeyboardTransaction()
+        yield tx
+        with self.lock:
+            if self.backend_name in ("ydotool", "uinput"):
                 try:
-                    if is_terminal_focused():
-                        self.backend.hotkey("ctrl", "shift", "v")
-                    else:
-                        self.backend.hotkey("ctrl", "v")
+                    self._flush_key_events(tx.ops)
                 except Exception as exc:
                     self._mark_backend_unavailable(exc)
-            elif self.backend_name == "pyautogui":
-                self.backend.keyUp("altleft")
-                self.backend.keyUp("altright")
+            else:
+                steps = {
+                    "backspace": self._backspace,
+                    "press": self._press,
+                    "paste": self._paste,
+                    "write": self._write,
+                }
+                for op, *args in tx.ops:
+                    steps[op](*args)
+
+    def _flush_key_events(self, ops):
+        """Turn *ops* into key events for ydotool/uinput and send them; caller holds the lock."""
+        backend = self.backend
+        events: list[tuple[int, int]] = []
+        unsettled = False  # keys sent or queued since the last settle delay
+        terminal = None
+
+        def send():
+            if events:
+                backend.send_keys(list(events))
+                events.clear()
+
+        for op, *args in ops:
+            if op == "backspace":
+                events += backend.press_events("backspace", args[0])
+            elif op == "press":
+                events += backend.press_events(args[0], args[1])
+            else:
+                text, end = args
+                _safe_print(text, end=end, flush=True)
+                if op == "write" or self._can_type_directly(text):
+                    try:
+                        events += backend.text_events(text)
+                        unsettled = True
+                        continue
+                    except ValueError:
+                        if op == "write" and self.backend_name == "ydotool":
+                            send()
+                            backend.write(text)  # ydotool type handles the rest
+                            unsettled = True
+                            continue
+                if terminal is None:
+                    terminal = is_terminal_focused()
+                pyperclip.copy(text)
+                time.sleep(self.wait)  # let the clipboard owner settle before Ctrl+V
+                events += backend.hotkey_events(*self._paste_hotkey(terminal))
+                send()
+                # The app fetches the clipboard asynchronously: later keys (or the next
+                # clipboard text) must wait until it has read this one.
                 time.sleep(self.wait)
-                self.backend.hotkey("ctrl", "v")
-            elif self.backend_name == "keyboard":
-                try:
-                    self.backend.send("ctrl+v")
-                except Exception as exc:
-                    self._mark_backend_unavailable(exc)
+                unsettled = False
+                continue
+            unsettled = True
+        send()
+        if unsettled:
             time.sleep(self.wait)
 
-    def write(self, text: str, end="\n", interval=0):
-        with self.lock:
-            _safe_print(text, end=end, flush=True)
-            try:
-                if self.backend_name == "keyboard":
-                    self.backend.write(text, delay=interval)
-                elif self.backend_name in ("pyautogui", "ydotool"):
-                    self.backend.write(text, interval=interval)
-            except Exception as exc:
-                self._mark_backend_unavailable(exc)
-
     def save_clipboard(self):
         """Store current clipboard content."""
         with self.lock:
@@ -404,4 +639,24 @@ class KeyboardController:
                 pyperclip.copy(self.clipboard_content)
             except Exception:
                 return
+            mark_stage("clipboard_restored")
             _safe_print("📤 Clipboard wieder geladen.")
+
+
+class KeyboardTransaction:
+    """Key operations recorded by ``KeyboardController.transaction()``; sent when the block ends."""
+
+    def __init__(self):
+        self.ops: list[tuple] = []
+
+    def backspace(self, n_times=1):
+        self.ops.append(("backspace", n_times))
+
+    def press(self, key: str, presses: int = 1):
+        self.ops.append(("press", key, presses))
+
+    def paste(self, text: str, end="\n"):
+        self.ops.append(("paste", text, end))
+
+    def write(self, text: str, end="\n"):
+        self.ops.append(("write", text, end))
@@ -0,0 +1,247 @@
+"""
+Keyboard Layout - Active XKB layout and its Y/Z swap, cached on disk and refreshed in the background.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  KeyboardLayout                         │
+    │  ┌───────────────────────────────────┐  │
+    │  │  layout / yz_swap /               │  │
+    │  │  typing_verified                  │  │
+    │  │  → starts with the cached layout  │  │
+    │  │    from keyboard_layout.json      │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  watcher thread                   │  │
+    │  │  → detect_layout() once           │  │
+    │  │  → gsettings monitor of the GNOME │  │
+    │  │    input sources: re-detect on    │  │
+    │  │    every change                   │  │
+    │  │  → no GNOME: re-detect every      │  │
+    │  │    poll_interval_s                │  │
+    │  │  → changed: update, write cache   │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+Raw key backends (ydotool, uinput) send physical key positions, so on
+QWERTZ layouts (de, ch, at, …) they must swap Y and Z.  Text is only typed
+key by key on layouts whose key table is verified (``typing_verified``);
+on AZERTY, Dvorak, cz/sk/hu etc. the digits and letters sit elsewhere, so
+callers paste such text via the clipboard.  Detection shells out to
+gsettings/localectl; the watcher keeps that off the startup path, and a
+switch of the input source takes effect on the next keystroke.  GNOME
+records the current source first in ``mru-sources``.
+
+Usage:
+    from hotkey_transcriber.keyboard.keyboard_layout import get_keyboard_layout
+
+    layout = get_keyboard_layout()              # never blocks on subprocesses
+    if layout.yz_swap:
+        text = text.translate(str.maketrans("yzYZ", "zyZY"))
+"""
+
+import ast
+import json
+import os
+import subprocess
+import threading
+
+from hotkey_transcriber.config.config_manager import CONFIG_DIR
+
+LAYOUT_CACHE_FILE = os.path.join(CONFIG_DIR, "keyboard_layout.json")
+
+_QWERTZ_LAYOUTS = frozenset({"de", "ch", "at", "cz", "sk", "hu", "si", "hr", "ba", "rs", "me"})
+# Letters (Y/Z aside), unshifted digits, "," and "." are on their US QWERTY keys in these
+# layouts and variants (only dead keys differ); Dvorak, Colemak, Neo etc. move them.
+_VERIFIED_TYPING_LAYOUTS = frozenset({"us", "de", "ch", "at"})
+_VERIFIED_TYPING_VARIANTS = frozenset(
+    {
+        "",
+        "nodeadkeys",
+        "deadacute",
+        "deadgraveacute",
+        "deadtilde",
+        "mac",
+        "mac_nodeadkeys",
+        "de",
+        "de_nodeadkeys",
+        "de_mac",
+        "fr",
+        "fr_nodeadkeys",
+        "fr_mac",
+        "intl",
+        "altgr-intl",
+    }
+)
+_INPUT_SOURCES_SCHEMA = "org.gnome.desktop.input-sources"
+
+
+def _run(args: list[str]) -> str:
+    try:
+        return subprocess.run(args, capture_output=True, text=True, timeout=3).stdout
+    except Exception:
+        return ""
+
+
+def parse_input_sources(value: str) -> list[str]:
+    """XKB layouts from a gsettings ``a(ss)`` value, e.g. ``[('xkb', 'ch+de_nodeadkeys')]``."""
+    value = value.strip().removeprefix("@a(ss)").strip()
+    try:
+        sources = ast.literal_eval(value) if value else []
+    except (ValueError, SyntaxError):
+        return []
+    return [layout for kind, layout in sources if kind == "xkb"]
+
+
+def _split_layout(layout: str | None) -> tuple[str, str]:
+    """``ch+de_nodeadkeys`` (gsettings) or ``de(nodeadkeys)`` (XKB) → (layout, variant)."""
+    name = (layout or "").strip().lower()
+    if "+" in name:
+        base, variant = name.split("+", 1)
+    else:
+        base, _, variant = name.partition("(")
+    return base, variant.rstrip(")")
+
+
+def _base_layout(layout: str | None) -> str:
+    return _split_layout(layout)[0]
+
+
+def is_qwertz(layout: str | None) -> bool:
+    """True for layouts that swap Y and Z, e.g. ``de``, ``ch+de_nodeadkeys``, ``de(nodeadkeys)``."""
+    return _base_layout(layout) in _QWERTZ_LAYOUTS
+
+
+def detect_layout() -> str | None:
+    """Return the active XKB layout, e.g. ``ch+de_nodeadkeys``; None if unknown.
+
+    Checks GNOME gsettings first (works on Wayland; the most recently used
+    source is the active one), then falls back to localectl.
+    """
+    for key in ("mru-sources", "sources"):
+        layouts = parse_input_sources(_run(["gsettings", "get", _INPUT_SOURCES_SCHEMA, key]))
+        if layouts:
+            return layouts[0]
+    for line in _run(["localectl", "status"]).splitlines():
+        # e.g. "X11 Layout: de,us"
+        if "layout" in line.lower() and ":" in line:
+            return line.split(":", 1)[1].split(",")[0].strip() or None
+    return None
+
+
+class KeyboardLayout:
+    """Current layout; read its properties on every use, the watcher may change them."""
+
+    def __init__(
+        self,
+        detect=detect_layout,
+        cache_file: str = LAYOUT_CACHE_FILE,
+        poll_interval_s: float = 60.0,
+    ):
+        self._detect = detect
+        self._cache_file = cache_file
+        self._poll_interval_s = poll_interval_s
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._monitor: subprocess.Popen | None = None
+        self.layout: str | None = self._load_cache()
+
+    @property
+    def yz_swap(self) -> bool:
+        return is_qwertz(self.layout)
+
+    @property
+    def typing_verified(self) -> bool:
+        """True if text may be typed as US QWERTY key codes (plus the Y/Z swap)."""
+        base, variant = _split_layout(self.layout)
+        return base in _VERIFIED_TYPING_LAYOUTS and variant in _VERIFIED_TYPING_VARIANTS
+
+    # ------------------------------------------------------------------ #
+    # Cache                                                                #
+    # ------------------------------------------------------------------ #
+
+    def _load_cache(self) -> str | None:
+        try:
+            with open(self._cache_file, encoding="utf-8") as f:
+                layout = json.load(f).get("layout")
+        except (OSError, ValueError, AttributeError):
+            return None
+        return layout if isinstance(layout, str) else None
+
+    def _save_cache(self) -> None:
+        try:
+            with open(self._cache_file, "w", encoding="utf-8") as f:
+                json.dump({"layout": self.layout}, f)
+        except OSError:
+            pass
+
+    def refresh(self) -> str | None:
+        """Detect the layout now (blocking); updates ``layout`` and the cache on a change."""
+        layout = self._detect()
+        changed, self.layout = layout != self.layout, layout
+        if changed:
+            kind = "QWERTZ, Y/Z getauscht" if self.yz_swap else "QWERTY"
+            if not self.typing_verified:
+                kind = "Text nur ueber die Zwischenablage"
+            print(f"[layout] Tastaturlayout: {layout or 'unbekannt'} ({kind})", flush=True)
+        if changed or not os.path.exists(self._cache_file):
+            self._save_cache()
+        return layout
+
+    # ------------------------------------------------------------------ #
+    # Watcher thread                                                       #
+    # ------------------------------------------------------------------ #
+
+    def start(self) -> None:
+        """Detect and watch in the background (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="keyboard-layout", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        monitor = self._monitor
+        if monitor is not None:
+            monitor.terminate()
+
+    def _watch(self) -> None:
+        while not self._stop.is_set():
+            self.refresh()
+            self._watch_input_sources()  # blocks while GNOME reports changes
+            if self._stop.wait(self._poll_interval_s):
+                return
+
+    def _watch_input_sources(self) -> None:
+        try:
+            self._monitor = subprocess.Popen(
+                ["gsettings", "monitor", _INPUT_SOURCES_SCHEMA],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        except OSError:
+            return
+        try:
+            for line in self._monitor.stdout:
+                # "mru-sources: [...]" on every input-source switch, "sources: [...]" on edits
+                if line.startswith(("mru-sources:", "sources:")):
+                    self.refresh()
+        finally:
+            self._monitor.stdout.close()
+            self._monitor.wait()
+            self._monitor = None
+
+
+_layout: KeyboardLayout | None = None
+_layout_lock = threading.Lock()
+
+
+def get_keyboard_layout() -> KeyboardLayout:
+    """The process-wide layout; its watcher is started on first use."""
+    global _layout
+    with _layout_lock:
+        if _layout is None:
+            _layout = KeyboardLayout()
+            _layout.start()
+        return _layout
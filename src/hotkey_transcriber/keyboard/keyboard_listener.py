@@ -168,6 +168,8 @@ elif sys.platform == 'linux':
     import evdev
     from evdev import ecodes
 
+    from hotkey_transcriber.keyboard.keyboard_controller import UINPUT_DEVICE_NAME
+
     # Modifier-name → set of evdev ecodes
     _EVDEV_MODIFIER_CODES = {
         "alt":   {ecodes.KEY_LEFTALT, ecodes.KEY_RIGHTALT},
@@ -197,6 +199,9 @@ elif sys.platform == 'linux':
         Score a device for how likely it is a usable keyboard.
         Higher = better.  Returns 0 for non-keyboards.
         """
+        if dev.name == UINPUT_DEVICE_NAME:
+            return 0  # our own virtual keyboard (uinput backend)
+
         caps = dev.capabilities()
         keys = set(caps.get(ecodes.EV_KEY, []))
         if not keys:
@@ -0,0 +1,166 @@
+"""
+Ydotool Socket - In-process client for the ydotoold daemon, no ydotool process per keystroke.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  YdotoolSocket(path)                    │
+    │  ┌───────────────────────────────────┐  │
+    │  │  send_keys([(code, 1|0), ...])    │  │
+    │  │  type_text("text")                │  │
+    │  │  → QWERTY table: char → code,     │  │
+    │  │    shift                          │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  AF_UNIX datagram socket          │  │
+    │  │  → one struct input_event per     │  │
+    │  │    datagram: EV_KEY, EV_SYN       │  │
+    │  │  → send failed: reconnect once    │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  ydotoold → /dev/uinput           │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+This is what the ydotool v1.x CLI does after its startup: it connects to
+the daemon's socket and writes raw input events, which ydotoold forwards
+unchanged to its uinput device.  Key codes are Linux KEY_* codes; like
+``ydotool type`` the text table assumes a US QWERTY layout.
+
+Usage:
+    from hotkey_transcriber.keyboard.ydotool_socket import YdotoolSocket
+
+    sock = YdotoolSocket()                      # raises OSError without ydotoold
+    sock.send_keys([(29, 1), (47, 1), (47, 0), (29, 0)])   # Ctrl+V
+    sock.type_text(" ")
+"""
+
+import os
+import socket
+import struct
+import time
+
+_EV_SYN = 0
+_EV_KEY = 1
+_SYN_REPORT = 0
+_KEY_LEFTSHIFT = 42
+
+# struct input_event { struct timeval time; __u16 type; __u16 code; __s32 value; }
+_INPUT_EVENT = struct.Struct("@llHHi")
+
+
+def _qwerty_table() -> dict[str, tuple[int, bool]]:
+    """Character → (KEY_* code, needs shift) for a US QWERTY layout."""
+    rows = {
+        "1234567890-=": 2,
+        "qwertyuiop[]": 16,
+        "asdfghjkl;'`": 30,
+        "zxcvbnm,./": 44,
+    }
+    shifted_rows = {
+        "!@#$%^&*()_+": 2,
+        "QWERTYUIOP{}": 16,
+        'ASDFGHJKL:"~': 30,
+        "ZXCVBNM<>?": 44,
+    }
+    table: dict[str, tuple[int, bool]] = {}
+    for chars, first in rows.items():
+        table.update({c: (first + i, False) for i, c in enumerate(chars)})
+    for chars, first in shifted_rows.items():
+        table.update({c: (first + i, True) for i, c in enumerate(chars)})
+    table.update(
+        {
+            " ": (57, False),
+            "\n": (28, False),
+            "\t": (15, False),
+            "\\": (43, False),
+            "|": (43, True),
+        }
+    )
+    return table
+
+
+_QWERTY = _qwerty_table()
+
+
+def qwerty_key_events(text: str) -> list[tuple[int, int]]:
+    """Key events that type *text*; raises ValueError for characters outside the table."""
+    events = []
+    for char in text:
+        try:
+            code, shift = _QWERTY[char]
+        except KeyError:
+            raise ValueError(f"Kein QWERTY-Keycode fuer {char!r}") from None
+        if shift:
+            events.append((_KEY_LEFTSHIFT, 1))
+        events += [(code, 1), (code, 0)]
+        if shift:
+            events.append((_KEY_LEFTSHIFT, 0))
+    return events
+
+
+def default_socket_path() -> str:
+    """``$YDOTOOL_SOCKET``, else the first existing default path of ydotoold."""
+    env = os.environ.get("YDOTOOL_SOCKET")
+    if env:
+        return env
+    candidates = []
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        candidates.append(os.path.join(os.environ["XDG_RUNTIME_DIR"], ".ydotool_socket"))
+    candidates += [f"/run/user/{os.getuid()}/.ydotool_socket", "/tmp/.ydotool_socket"]
+    return next((path for path in candidates if os.path.exists(path)), candidates[-1])
+
+
+class YdotoolSocket:
+    """Writes key events to a running ydotoold; the constructor raises OSError without one."""
+
+    def __init__(self, path: str | None = None):
+        self.path = path or default_socket_path()
+        self._sock: socket.socket | None = None
+        self._connect()
+
+    def _connect(self) -> None:
+        self.close()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+
+    @staticmethod
+    def _packets(events) -> list[bytes]:
+        packets = []
+        for code, value in events:
+            packets.append(_INPUT_EVENT.pack(0, 0, _EV_KEY, code, value))
+            packets.append(_INPUT_EVENT.pack(0, 0, _EV_SYN, _SYN_REPORT, 0))
+        return packets
+
+    def send_keys(self, events, delay_s: float = 0) -> None:
+        """Send ``(code, value)`` key events (1 = down, 0 = up), each followed by a SYN report.
+
+        With *delay_s* the events are spaced like ``ydotool key --key-delay``.
+        A failed send reconnects once (ydotoold may have been restarted).
+        """
+        packets = self._packets(events)
+        for i in range(0, len(packets), 2):
+            if delay_s and i:
+                time.sleep(delay_s)
+            self._send(packets[i : i + 2])
+
+    def _send(self, packets: list[bytes]) -> None:
+        try:
+            for packet in packets:
+                self._sock.send(packet)
+        except (OSError, AttributeError):
+            self._connect()
+            for packet in packets:
+                self._sock.send(packet)
+
+    def type_text(self, text: str, delay_s: float = 0) -> None:
+        self.send_keys(qwerty_key_events(text), delay_s)
+
+    def close(self) -> None:
+        sock, self._sock = self._sock, None
+        if sock is not None:
+            sock.close()
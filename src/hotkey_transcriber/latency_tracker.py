@@ -0,0 +1,188 @@
+"""
+Latency Tracker - Per-stage timestamps for every dictation, emitted as one JSON record.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  LatencyTracker                         │
+    │  ┌───────────────────────────────────┐  │
+    │  │  begin()  (key down / wake word)  │  │
+    │  │  → new DictationTrace, active     │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  mark_stage(stage)  (any thread)  │  │
+    │  │  → recorder, keyboard, backends   │  │
+    │  │  → perf_counter, first mark wins  │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  finish()                         │  │
+    │  │  → "[latency] {json}" log line    │  │
+    │  │  → LatencyStats (rolling p50/p95) │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+Usage:
+    from hotkey_transcriber.latency_tracker import get_latency_tracker, mark_stage
+
+    tracker = get_latency_tracker()
+    tracker.begin(mode="ptt")
+    mark_stage("model_start")
+    record = tracker.finish()
+    p50, p95 = tracker.stats.percentiles("model")
+"""
+
+import collections
+import json
+import threading
+import time
+
+STAGES = (
+    "key_down",
+    "stream_started",
+    "first_audio",
+    "key_up",
+    "stream_closed",
+    "model_start",
+    "inference_start",
+    "first_segment",
+    "inference_end",
+    "model_end",
+    "dots_erased",
+    "paste_done",
+    "clipboard_restored",
+)
+
+# Derived spans: name -> (from stage, to stage).
+SPANS = {
+    "stream_open": ("key_down", "stream_started"),
+    "first_audio": ("stream_started", "first_audio"),
+    "stream_close": ("key_up", "stream_closed"),
+    "queue": ("stream_closed", "model_start"),
+    "time_to_first_segment": ("model_start", "first_segment"),
+    "inference": ("inference_start", "inference_end"),
+    "model": ("model_start", "model_end"),
+    "dot_printer": ("model_end", "dots_erased"),
+    "paste": ("dots_erased", "paste_done"),
+    "clipboard": ("paste_done", "clipboard_restored"),
+    "key_up_to_text": ("key_up", "paste_done"),
+}
+
+
+class DictationTrace:
+    """Monotonic timestamps (``time.perf_counter``) of the stages of one dictation."""
+
+    def __init__(self, mode: str = "ptt", clock=time.perf_counter):
+        self.mode = mode
+        self._clock = clock
+        self.marks: dict[str, float] = {}
+        self.info: dict[str, object] = {}
+
+    def mark(self, stage: str, overwrite: bool = False) -> None:
+        """Record *stage* now.  The first mark wins unless *overwrite* is set."""
+        if overwrite or stage not in self.marks:
+            self.marks[stage] = self._clock()
+
+    def spans_ms(self) -> dict[str, float]:
+        spans = {}
+        for name, (start, end) in SPANS.items():
+            if start in self.marks and end in self.marks:
+                spans[name] = round((self.marks[end] - self.marks[start]) * 1000, 1)
+        return spans
+
+    def to_record(self) -> dict:
+        origin = self.marks.get("key_down", min(self.marks.values(), default=0.0))
+        stages = {
+            stage: round((self.marks[stage] - origin) * 1000, 1)
+            for stage in STAGES
+            if stage in self.marks
+        }
+        return {"mode": self.mode, **self.info, "stages_ms": stages, "spans_ms": self.spans_ms()}
+
+
+class LatencyStats:
+    """Rolling per-span samples over the last *window* dictations."""
+
+    def __init__(self, window: int = 100):
+        self._samples: dict[str, collections.deque] = collections.defaultdict(
+            lambda: collections.deque(maxlen=window)
+        )
+        self._lock = threading.Lock()
+
+    def add(self, spans_ms: dict[str, float]) -> None:
+        with self._lock:
+            for name, value in spans_ms.items():
+                self._samples[name].append(value)
+
+    def percentiles(self, name: str) -> tuple[float, float] | None:
+        """Return ``(p50, p95)`` of span *name*, or None without samples."""
+        with self._lock:
+            values = sorted(self._samples.get(name, ()))
+        if not values:
+            return None
+        return _nearest_rank(values, 50), _nearest_rank(values, 95)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            names = list(self._samples)
+        result = {}
+        for name in names:
+            pct = self.percentiles(name)
+            if pct is not None:
+                result[name] = {"p50": pct[0], "p95": pct[1]}
+        return result
+
+
+def _nearest_rank(sorted_values: list[float], pct: float) -> float:
+    index = max(0, -(-len(sorted_values) * pct // 100) - 1)
+    return sorted_values[int(index)]
+
+
+class LatencyTracker:
+    """Holds the active trace so stages can be marked from anywhere in the process."""
+
+    def __init__(self, window: int = 100, emit=print):
+        self._active: DictationTrace | None = None
+        self._emit = emit
+        self.stats = LatencyStats(window)
+        self.last_record: dict | None = None
+
+    def begin(self, mode: str = "ptt", started_at: float | None = None) -> DictationTrace:
+        """Start a new active trace; *started_at* backdates ``key_down`` (perf_counter)."""
+        trace = DictationTrace(mode)
+        trace.mark("key_down")
+        if started_at is not None:
+            trace.marks["key_down"] = started_at
+        self._active = trace
+        return trace
+
+    @property
+    def active(self) -> DictationTrace | None:
+        return self._active
+
+    def mark(self, stage: str, overwrite: bool = False) -> None:
+        trace = self._active
+        if trace is not None:
+            trace.mark(stage, overwrite)
+
+    def finish(self) -> dict | None:
+        """Close the active trace, log it as one JSON line and add it to the stats."""
+        trace, self._active = self._active, None
+        if trace is None:
+            return None
+        record = trace.to_record()
+        self.stats.add(record["spans_ms"])
+        self.last_record = record
+        if self._emit is not None:
+            self._emit(f"[latency] {json.dumps(record, separators=(',', ':'))}")
+        return record
+
+
+_tracker = LatencyTracker()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    return _tracker
+
+
+def mark_stage(stage: str, overwrite: bool = False) -> None:
+    """Mark *stage* on the active dictation trace (no-op when none is active)."""
+    _tracker.mark(stage, overwrite)
@@ -34,6 +34,8 @@ def _init_runtime(config: dict):
         compute_type=compute_type,
         backend=backend,
         engine=engine,
+        num_workers=config.get("transcription_workers", 1),
+        worker_standby=config.get("worker_standby_enabled", False),
     )
 
     recorder = load_speech_recorder(
@@ -52,6 +54,13 @@ def _init_runtime(config: dict):
         beam_size=config.get("beam_size", 1),
         best_of=config.get("best_of", 1),
         temperature=config.get("temperature", 0.0),
+        streaming_transcription=config.get("streaming_transcription_enabled", False),
+        warm_microphone=config.get("warm_microphone_enabled", False),
+        preroll_ms=config.get("preroll_ms", 400),
+        min_speech_ms=config.get("min_speech_ms", 250),
+        min_speech_ratio=config.get("min_speech_ratio", 0.01),
+        trim_padding_ms=config.get("trim_padding_ms", 200),
+        unicode_input=config.get("ibus_unicode_input_enabled", False),
     )
 
     hotkey = load_keyboard_listener(
@@ -91,6 +100,7 @@ def _init_runtime(config: dict):
         callback=lambda _name=None: None,
         model_name=ww_model,
         model_names=ww_model_names,
+        capture_hub=recorder.capture_hub,
     )
     if config.get("wake_word_enabled", False):
         ww_listener.start()
@@ -1,12 +1,8 @@
-import ctypes
-import ctypes.util
-import platform
-import queue
 import re
 import sys
 import threading
 import time
-from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
@@ -15,74 +11,18 @@ from hotkey_transcriber.actions.spoken_text_actions import (
     _URL_INSERT_BUILTINS,
     SpokenTextActionExecutor,
 )
+from hotkey_transcriber.audio.audio_capture_hub import AudioCaptureHub
+from hotkey_transcriber.audio.audio_ring_buffer import AudioRingBuffer
+from hotkey_transcriber.audio.audio_source import AudioSource, PortAudioSource
+from hotkey_transcriber.audio.speech_timeline import SpeechTimeline
+from hotkey_transcriber.audio.vad_worker import VadWorker
 from hotkey_transcriber.keyboard.keyboard_controller import KeyboardController, is_terminal_focused
+from hotkey_transcriber.latency_tracker import get_latency_tracker, mark_stage
+from hotkey_transcriber.transcription.streaming_transcriber import StreamingTranscriber
 
 _UNDO_ALIASES = frozenset({"undo", "andu", "undu", "ando", "andou"})
-
-
-def _linux_lib_dir() -> Path | None:
-    if platform.system().lower() != "linux":
-        return None
-    if platform.machine().lower() not in {"x86_64", "amd64"}:
-        return None
-
-    lib_dir = (
-        Path(__file__).resolve().parent
-        / "resources"
-        / "lib"
-        / "linux"
-        / "x86_64"
-    )
-    return lib_dir if lib_dir.is_dir() else None
-
-
-def _portaudio_fallback_path() -> str | None:
-    lib_dir = _linux_lib_dir()
-    if not lib_dir:
-        return None
-    candidate = lib_dir / "libportaudio.so.2.0.0"
-    return str(candidate) if candidate.is_file() else None
-
-
-def _preload_linux_audio_deps() -> None:
-    lib_dir = _linux_lib_dir()
-    if not lib_dir:
-        return
-
-    jack = lib_dir / "libjack.so.0.1.0"
-    if jack.is_file():
-        with suppress(OSError):
-            ctypes.CDLL(str(jack), mode=ctypes.RTLD_GLOBAL)
-
-
-def _import_sounddevice():
-    try:
-        import sounddevice as sd_mod
-        return sd_mod
-    except OSError as exc:
-        if "PortAudio library not found" not in str(exc):
-            raise
-
-        fallback = _portaudio_fallback_path()
-        if not fallback:
-            raise
-        _preload_linux_audio_deps()
-
-        original_find_library = ctypes.util.find_library
-
-        def _patched_find_library(name: str):
-            if name == "portaudio":
-                return fallback
-            return original_find_library(name)
-
-        ctypes.util.find_library = _patched_find_library
-        try:
-            import sounddevice as sd_mod
-            return sd_mod
-        finally:
-            ctypes.util.find_library = original_find_library
-
-sd = _import_sounddevice()
+# Longer recordings are split at VAD pauses and transcribed segment by segment.
+_MAX_SEGMENT_MS = 25_000
 
 
 # ---------------------------------------------------------------------------
@@ -156,6 +96,28 @@ class _SileroVAD:
         prob = out.item() if out.ndim == 0 else float(out.flat[0])
         return prob > self.threshold
 
+    def speech_flags(self, audio_f32: np.ndarray) -> np.ndarray:
+        """Classify a whole recording in one pass and return one bool per 512-sample frame.
+
+        Uses its own LSTM state and context, so the streaming state used by
+        is_speech() is left untouched.
+        """
+        audio = np.asarray(audio_f32, dtype=np.float32)
+        n_frames = -(-len(audio) // self.WINDOW_SIZE)
+        padded = np.zeros(self._CONTEXT_SIZE + n_frames * self.WINDOW_SIZE, dtype=np.float32)
+        padded[self._CONTEXT_SIZE : self._CONTEXT_SIZE + len(audio)] = audio
+
+        h = np.zeros((1, 1, 128), dtype=np.float32)
+        c = np.zeros((1, 1, 128), dtype=np.float32)
+        flags = np.zeros(n_frames, dtype=bool)
+        frame_len = self._CONTEXT_SIZE + self.WINDOW_SIZE
+        for i in range(n_frames):
+            start = i * self.WINDOW_SIZE
+            frame = padded[np.newaxis, start : start + frame_len]
+            out, h, c = self._session.run(None, {"input": frame, "h": h, "c": c})
+            flags[i] = float(out.flat[0]) > self.threshold
+        return flags
+
 
 def _load_vad() -> _SileroVAD | None:
     try:
@@ -190,6 +152,14 @@ class SpeechRecorder:
         beam_size: int = 1,
         best_of: int = 1,
         temperature: float = 0.0,
+        streaming_transcription: bool = False,
+        warm_microphone: bool = False,
+        preroll_ms: int = 400,
+        capture_hub: AudioCaptureHub | None = None,
+        audio_source: AudioSource | None = None,
+        min_speech_ms: int = 250,
+        min_speech_ratio: float = 0.01,
+        trim_padding_ms: int = 200,
     ):
         self.model = model
         self.keyb_c = keyboard_controller
@@ -207,21 +177,64 @@ class SpeechRecorder:
         self._running = False
         self._rec_mark_pasted = False
 
-        self._audio_q: queue.Queue[np.ndarray] = queue.Queue()
-        self._stream = None  # opened on demand in start(), closed in stop()
+        # Preallocated arena: the callback writes into it in place and the
+        # transcriber reads a zero-copy view.
+        self._audio_buf = AudioRingBuffer()
+        # One device stream shared with the wake word listener; the recorder
+        # only subscribes in start() and unsubscribes in stop().
+        self.capture_hub = capture_hub or AudioCaptureHub(
+            source=audio_source or PortAudioSource(), preroll_ms=preroll_ms
+        )
+        self._subscription = None
+        self.warm_microphone = warm_microphone
+        self.last_stream_open_ms: float | None = None
+        self.last_stream_close_ms: float | None = None
 
         self._transcribe_thread = None
         self._auto_stop = False
         self._silence_timeout_ms = silence_timeout_ms
         self._max_initial_wait_ms = self._normalize_initial_wait_ms(max_initial_wait_ms)
-        self._silence_start_time = None
-        self._start_time = None
-        self._speech_detected = False
         self._vad = _load_vad()
+        # Silero inference and the auto-stop state machine run on their own
+        # thread so the audio callback only copies samples.
+        self._vad_worker = (
+            VadWorker(self._vad, on_auto_stop=self._on_vad_auto_stop)
+            if self._vad is not None
+            else None
+        )
+        self._speech_timeline: SpeechTimeline | None = None
+        # Takes with less speech than this are dropped without calling the model.
+        self.min_speech_ms = min_speech_ms
+        self.min_speech_ratio = min_speech_ratio
+        # Margin kept around the speech when leading/trailing silence is cut.
+        self.trim_padding_ms = trim_padding_ms
+        self.last_trimmed_samples = 0
+        self._first_audio_seen = False
         self.on_transcription_finished = on_transcription_finished
         self.beam_size = beam_size
         self.best_of = best_of
         self.temperature = temperature
+        self.streaming_transcription = streaming_transcription
+        self._streamer: StreamingTranscriber | None = None
+        self._active_streamer: StreamingTranscriber | None = None
+        if warm_microphone:
+            self._open_warm_stream()
+
+    def _open_warm_stream(self) -> None:
+        hub = self.capture_hub
+        try:
+            hub.open()
+        except Exception as exc:
+            print(f"Warmes Mikrofon nicht verfuegbar ({exc}). Stream wird pro Aufnahme geoeffnet.")
+            self.warm_microphone = False
+            return
+        hub.keep_open = True
+        print(f"Warmes Mikrofon aktiv (Stream geoeffnet in {hub.open_ms:.1f} ms).")
+
+    def close(self) -> None:
+        """Release the microphone stream."""
+        self.capture_hub.keep_open = False
+        self.capture_hub.close()
 
     @staticmethod
     def _normalize_initial_wait_ms(value):
@@ -352,58 +365,24 @@ class SpeechRecorder:
         if not self._running:
             return
 
-        audio_chunk = indata.copy()
-        self._audio_q.put(audio_chunk)
+        self._audio_buf.write(indata)
+        if not self._first_audio_seen:
+            self._first_audio_seen = True
+            mark_stage("first_audio")
 
-        # Silero VAD auto-stop: feed 512-sample float32 mono chunks
-        if self._auto_stop and self._vad is not None:
-            try:
-                is_speech = self._vad.is_speech(audio_chunk[:, 0])
-            except Exception:
-                is_speech = True  # Fallback if VAD fails
-
-            now = time.time()
-
-            if is_speech:
-                self._speech_detected = True
-                self._silence_start_time = now
-            else:
-                if not self._speech_detected:
-                    if (
-                        self._max_initial_wait_ms is not None
-                        and self._start_time is not None
-                        and (now - self._start_time) * 1000 > self._max_initial_wait_ms
-                    ):
-                        self._auto_stop = False
-                        threading.Thread(target=self.stop, daemon=True).start()
-                    return
+        # Silero VAD auto-stop: hand 512-sample float32 mono chunks to the worker
+        if self._auto_stop and self._vad_worker is not None:
+            self._vad_worker.submit(indata[:, 0])
 
-                if self._silence_start_time is None:
-                    self._silence_start_time = now
-                elif (now - self._silence_start_time) * 1000 > self._silence_timeout_ms:
-                    self._auto_stop = False
-                    threading.Thread(target=self.stop, daemon=True).start()
+    def _on_vad_auto_stop(self):
+        """Called by the VAD worker (on its own thread) once auto-stop fires."""
+        self._auto_stop = False
+        self.stop()
 
     # ------------------------------------------------------------------ #
     # Helpers                                                              #
     # ------------------------------------------------------------------ #
 
-    def _flush_audio_queue(self):
-        while True:
-            try:
-                self._audio_q.get_nowait()
-            except queue.Empty:
-                break
-
-    def _drain_audio_queue(self):
-        chunks = []
-        while True:
-            try:
-                chunks.append(self._audio_q.get_nowait())
-            except queue.Empty:
-                break
-        return chunks
-
     def _run_dot_printer(self, stop_event):
         """Show 📝 + growing dots while transcription runs, then erase them.
 
@@ -414,7 +393,7 @@ class SpeechRecorder:
         In terminals the emoji is skipped (some TUIs need multiple backspaces
         to delete a single emoji, leaving artefacts).
         """
-        skip_emoji = self.keyb_c.backend_name == "ydotool" and is_terminal_focused()
+        skip_emoji = self.keyb_c.backend_name in ("ydotool", "uinput") and is_terminal_focused()
         if skip_emoji:
             count = 0
         else:
@@ -428,15 +407,141 @@ class SpeechRecorder:
         if count > 0:
             self.keyb_c.backspace(count)
 
+    def _streaming_transcriber(self) -> StreamingTranscriber | None:
+        """Return the (lazily created) streaming transcriber, or None if disabled."""
+        if not self.streaming_transcription:
+            return None
+        if self._streamer is None:
+            # Separate VAD instance: the auto-stop VAD keeps its own LSTM state
+            # on the VAD worker thread.
+            vad = _load_vad()
+            if vad is None:
+                self.streaming_transcription = False
+                return None
+            self._streamer = StreamingTranscriber(transcribe_fn=self._transcribe_audio, vad=vad)
+        return self._streamer
+
+    def _transcribe_audio(self, audio: np.ndarray, vad_filter: bool = True) -> str:
+        mark_stage("model_start")
+        seg_iterator, _ = self.model.transcribe(
+            audio,
+            language=self.language,
+            vad_filter=vad_filter,
+            beam_size=self.beam_size,
+            best_of=self.best_of,
+            temperature=self.temperature,
+            condition_on_previous_text=False,
+        )
+        texts = []
+        # faster-whisper decodes lazily: the first segment arrives before the rest.
+        for segment in seg_iterator:
+            mark_stage("first_segment")
+            texts.append(segment.text.strip())
+        mark_stage("model_end", overwrite=True)
+        return " ".join(texts).strip()
+
+    def _recording_timeline(self, audio: np.ndarray) -> SpeechTimeline | None:
+        """Run Silero over a finished recording (push-to-talk has no live timeline)."""
+        if self._vad is None:
+            return None
+        try:
+            return SpeechTimeline(self._vad.speech_flags(audio))
+        except Exception as exc:
+            print(f"VAD-Vorpruefung fehlgeschlagen: {exc}")
+            return None
+
+    def _contains_speech(self, timeline: SpeechTimeline | None) -> bool:
+        if timeline is None:
+            return True  # no VAD: let the model decide
+        return (
+            timeline.speech_ms >= self.min_speech_ms
+            and timeline.speech_ratio >= self.min_speech_ratio
+        )
+
+    def _trim_to_speech(self, audio: np.ndarray, timeline: SpeechTimeline) -> np.ndarray:
+        """Cut silence before, between and after the speech spans of *timeline*.
+
+        Leading and trailing silence is trimmed down to ``trim_padding_ms``.
+        """
+        spans = timeline.speech_spans(len(audio), edge_pad_ms=self.trim_padding_ms)
+        if not spans:
+            return audio[:0]
+        if len(spans) == 1:
+            start, end = spans[0]
+            return audio[start:end]
+        return np.concatenate([audio[start:end] for start, end in spans])
+
+    def _speech_segments(self, audio: np.ndarray, timeline: SpeechTimeline) -> list[np.ndarray]:
+        """Split *audio* at VAD pauses into segments of at most ~25 s, each trimmed to speech.
+
+        The number of removed samples is kept in ``last_trimmed_samples``.
+        """
+        bounds = [0, *timeline.split_points(len(audio), _MAX_SEGMENT_MS), len(audio)]
+        segments = []
+        for start, end in zip(bounds[:-1], bounds[1:], strict=True):
+            speech = self._trim_to_speech(audio[start:end], timeline.segment(start, end))
+            if len(speech):
+                segments.append(speech)
+        self.last_trimmed_samples = len(audio) - sum(len(s) for s in segments)
+        if self.last_trimmed_samples:
+            print(f"[vad] {self.last_trimmed_samples * 1000 // 16_000} ms Stille abgeschnitten.")
+        return segments
+
+    def _transcription_concurrency(self) -> int:
+        """How many transcribe() calls the backend can run at once (``max_concurrency``)."""
+        try:
+            return max(1, int(getattr(self.model, "max_concurrency", 1)))
+        except (TypeError, ValueError):
+            return 1
+
+    def _transcribe_recording(self, audio: np.ndarray, timeline: SpeechTimeline | None) -> str:
+        """Transcribe *audio*, reusing the VAD timeline when there is one.
+
+        Silero already classified every frame, so the audio is trimmed to the
+        speech spans here and faster-whisper's own VAD pass is skipped.  Long
+        recordings are cut at pauses and the segments are transcribed on a
+        pool bounded by the backend's concurrency; texts are joined in order.
+        """
+        self.last_trimmed_samples = 0
+        if timeline is None:
+            return self._transcribe_audio(audio)
+        segments = self._speech_segments(audio, timeline)
+        if len(segments) <= 1:
+            return self._transcribe_audio(segments[0], vad_filter=False) if segments else ""
+
+        workers = min(self._transcription_concurrency(), len(segments))
+        print(f"[vad] {len(segments)} Segmente, {workers} parallel.")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            texts = list(pool.map(lambda s: self._transcribe_audio(s, vad_filter=False), segments))
+        return " ".join(t for t in texts if t).strip()
+
     def _transcribe_and_paste(self):
         try:
+            streamer, self._active_streamer = self._active_streamer, None
+            timeline, self._speech_timeline = self._speech_timeline, None
             # stream.stop() in stop() already blocked until all callbacks finished,
-            # so the queue contains the complete recording at this point.
-            chunks = self._drain_audio_queue()
-            if not chunks:
+            # so the buffer contains the complete recording at this point.
+            if len(self._audio_buf) == 0:
+                if streamer is not None:
+                    streamer.finish()
                 self.keyb_c.load_clipboard()
                 return
 
+            audio = self._audio_buf.view()
+            # A streamer that already committed a window has heard speech.
+            if streamer is None or streamer.committed_windows == 0:
+                if timeline is None:
+                    timeline = self._recording_timeline(audio)
+                if not self._contains_speech(timeline):
+                    if streamer is not None:
+                        streamer.cancel()
+                    print(
+                        f"Keine Sprache erkannt ({timeline.speech_ms:.0f} ms). "
+                        "Transkription uebersprungen."
+                    )
+                    self.keyb_c.load_clipboard()
+                    return
+
             full = ""
             dot_stop = threading.Event()
             dot_thread = threading.Thread(
@@ -444,18 +549,10 @@ class SpeechRecorder:
             )
             dot_thread.start()
             try:
-                audio = np.concatenate(chunks, axis=0)[:, 0]
-                seg_iterator, _ = self.model.transcribe(
-                    audio,
-                    language=self.language,
-                    vad_filter=True,
-                    beam_size=self.beam_size,
-                    best_of=self.best_of,
-                    temperature=self.temperature,
-                    condition_on_previous_text=False,
-                )
-                segments = list(seg_iterator)
-                full = " ".join(s.text.strip() for s in segments).strip()
+                if streamer is not None:
+                    full = streamer.finish()
+                else:
+                    full = self._transcribe_recording(audio, timeline)
             except Exception as e:
                 print(f"Transkription fehlgeschlagen: {e}")
             finally:
@@ -463,6 +560,7 @@ class SpeechRecorder:
                 # before we paste the result – order matters for the text field.
                 dot_stop.set()
                 dot_thread.join()
+                mark_stage("dots_erased")
 
             action_text, _ = self._run_spoken_action(full)
             output_text, should_press_enter, cancel_current, undo_previous = (
@@ -478,32 +576,48 @@ class SpeechRecorder:
                 self.keyb_c.load_clipboard()
                 return
 
+            # One batch: text and space/Enter reach the window together,
+            # without keystrokes of other threads in between.
             inserted_char_count = 0
-            if output_text:
-                self.keyb_c.paste(output_text)
-                inserted_char_count += len(output_text)
-                if not should_press_enter:
-                    self.keyb_c.write(" ", end="", interval=0)  # direct keypress – clipboard strips trailing space on Windows
+            with self.keyb_c.transaction() as keys:
+                if output_text:
+                    keys.paste(output_text)
+                    inserted_char_count += len(output_text)
+                    if not should_press_enter:
+                        keys.write(" ", end="")  # direct keypress – clipboard strips trailing space on Windows
+                        inserted_char_count += 1
+                if should_press_enter:
+                    keys.press("enter")
                     inserted_char_count += 1
-            if should_press_enter:
-                self.keyb_c.press("enter")
-                inserted_char_count += 1
             if inserted_char_count > 0:
                 self._remember_speech_insert(inserted_char_count)
+            mark_stage("paste_done")
 
             self.keyb_c.load_clipboard()
         finally:
+            self._finish_latency_trace()
             if self.on_transcription_finished is not None:
                 try:
                     self.on_transcription_finished()
                 except Exception as exc:
                     print(f"Transkriptions-Abschluss-Callback fehlgeschlagen: {exc}")
 
+    def _finish_latency_trace(self) -> None:
+        """Emit the ``[latency]`` record of the dictation that just finished."""
+        tracker = get_latency_tracker()
+        trace = tracker.active
+        if trace is None:
+            return
+        trace.info["audio_ms"] = len(self._audio_buf) * 1000 // 16_000
+        trace.info["trimmed_ms"] = self.last_trimmed_samples * 1000 // 16_000
+        tracker.finish()
+
     # ------------------------------------------------------------------ #
     # Public API                                                           #
     # ------------------------------------------------------------------ #
 
     def start(self, auto_stop=False, silence_timeout_ms=1500, max_initial_wait_ms=None):
+        key_down = time.perf_counter()
         # Wait for a previous transcription to finish before inserting the new
         # REC marker. Without this, the first thread can paste its text *after*
         # the new marker, causing stop()'s backspace to delete transcribed text.
@@ -513,35 +627,19 @@ class SpeechRecorder:
         with self._lock:
             if self._running:
                 return
-            self._flush_audio_queue()
+            get_latency_tracker().begin(mode="auto" if auto_stop else "ptt", started_at=key_down)
+            self._audio_buf.clear()
+            self.last_trimmed_samples = 0
 
             self._auto_stop = auto_stop
             self._silence_timeout_ms = silence_timeout_ms
             self._max_initial_wait_ms = self._normalize_initial_wait_ms(max_initial_wait_ms)
-            self._silence_start_time = None
-            self._speech_detected = False
-
-            if self._vad is not None:
-                self._vad.reset()
-
-            # Silero VAD needs exactly 512 samples per chunk (~32 ms at 16 kHz).
-            # For normal PTT (no auto-stop) we use the configured chunk_ms.
-            blocksize = (
-                _SileroVAD.WINDOW_SIZE
-                if auto_stop and self._vad is not None
-                else int(16_000 * self.chunk_ms / 1000)
-            )
 
-            self._stream = sd.InputStream(
-                samplerate=16_000,
-                channels=1,
-                dtype="float32",
-                blocksize=blocksize,
-                callback=self._audio_callback,
-            )
-            self._stream.start()
-            self._start_time = time.time()
-            self._running = True
+            self._active_streamer = self._streaming_transcriber()
+            if self._active_streamer is not None:
+                self._active_streamer.start(self._audio_buf)
+
+            self._open_capture(auto_stop)
             self._active_rec_mark = self._recording_marker_text()
             self._rec_mark_pasted = bool(self._active_rec_mark)
 
@@ -551,27 +649,79 @@ class SpeechRecorder:
         else:
             self.keyb_c.paste(self._active_rec_mark)
 
+    def _open_capture(self, auto_stop: bool) -> None:
+        """Subscribe _audio_callback to the capture hub; caller holds self._lock."""
+        # Silero VAD needs exactly 512 samples per chunk (~32 ms at 16 kHz).
+        # For normal PTT (no auto-stop) we use the configured chunk_ms.
+        blocksize = (
+            _SileroVAD.WINDOW_SIZE
+            if auto_stop and self._vad is not None
+            else int(16_000 * self.chunk_ms / 1000)
+        )
+        # The pre-roll is only spliced on for push-to-talk: after a wake word it
+        # would contain the wake word itself.
+        preroll = self.warm_microphone and not auto_stop
+
+        t0 = time.perf_counter()
+        if auto_stop and self._vad_worker is not None:
+            self._vad_worker.start(self._silence_timeout_ms, self._max_initial_wait_ms)
+        # _running must be set first: subscribe() replays the pre-roll through
+        # _audio_callback synchronously.
+        self._first_audio_seen = False
+        self._running = True
+        try:
+            self._subscription = self.capture_hub.subscribe(
+                self._audio_callback, blocksize=blocksize, preroll=preroll
+            )
+        except Exception:
+            self._running = False
+            if self._vad_worker is not None:
+                self._vad_worker.stop()
+            raise
+        self.last_stream_open_ms = (time.perf_counter() - t0) * 1000
+        mark_stage("stream_started")
+
+    def _stop_vad_worker(self) -> SpeechTimeline | None:
+        """Drain the VAD worker, report its lag and return the recording's speech timeline."""
+        worker = self._vad_worker
+        if worker is None or not worker.is_running:
+            return None
+        worker.stop()
+        print(
+            f"[vad] max. Verzoegerung {worker.max_lag_ms:.1f} ms, "
+            f"{worker.overflows} Ueberlaeufe, {worker.frames_processed} Frames."
+        )
+        return worker.timeline()
+
     def stop(self):
         with self._lock:
             if not self._running:
                 return
+            mark_stage("key_up")
             self._running = False
             do_clear = self._rec_mark_pasted
             self._rec_mark_pasted = False
             active_rec_mark = self._active_rec_mark
             self._active_rec_mark = ""
-            stream = self._stream
-            self._stream = None
+            subscription = self._subscription
+            self._subscription = None
 
         if do_clear:
             self.keyb_c.backspace(len(active_rec_mark))
 
-        # stop() blocks until the last audio callback completes (≤ one
-        # chunk_ms = 30 ms), guaranteeing all audio is in the queue before
-        # the transcribe thread drains it.
-        if stream:
-            stream.stop()
-            stream.close()
+        # unsubscribe() blocks until a running audio callback completes,
+        # guaranteeing all audio is in the buffer before the transcribe
+        # thread reads it.
+        t0 = time.perf_counter()
+        if subscription is not None:
+            self.capture_hub.unsubscribe(subscription, clear_preroll=True)
+        self.last_stream_close_ms = (time.perf_counter() - t0) * 1000
+        mark_stage("stream_closed")
+        print(
+            f"[audio] Aufnahme gestartet in {self.last_stream_open_ms or 0.0:.1f} ms, "
+            f"beendet in {self.last_stream_close_ms:.1f} ms."
+        )
+        self._speech_timeline = self._stop_vad_worker()
 
         self._transcribe_thread = threading.Thread(
             target=self._transcribe_and_paste, daemon=True
@@ -113,13 +113,21 @@ def load_model(
     cache_dir=None,
     backend: str = "native",
     engine: str = "faster_whisper",
+    num_workers: int = 1,
+    worker_standby: bool = False,
 ):
-    """Download (if needed) and load a Whisper model. Returns a model object."""
+    """Download (if needed) and load a Whisper model. Returns a model object.
+
+    *num_workers* only applies to faster-whisper: it lets that many
+    transcribe() calls run in parallel and is exposed as ``max_concurrency``.
+    *worker_standby* keeps a second, pre-loaded server for the WSL and NPU
+    backends so a crashed server is replaced without waiting for a model load.
+    """
     if backend == "wsl_amd":
         try:
             from hotkey_transcriber.transcription.wsl_whisper_bridge import WslWhisperModel
 
-            return WslWhisperModel(model_name=size)
+            return WslWhisperModel(model_name=size, standby=worker_standby)
         except Exception as exc:
             print(f"WSL-Backend fehlgeschlagen ({exc}). Fallback auf CPU-Backend.")
             device = "cpu"
@@ -129,7 +137,7 @@ def load_model(
         from hotkey_transcriber.transcription.whisper_npu_backend import WhisperNpuModel
 
         print("Verwende ONNX/VitisAI NPU-Backend.", flush=True)
-        model = WhisperNpuModel(model_size=size)
+        model = WhisperNpuModel(model_size=size, standby=worker_standby)
         print(f"Whisper-Modell '{size}' auf NPU bereit (ONNX/VitisAI).", flush=True)
         return model
 
@@ -184,6 +192,7 @@ def load_model(
             compute_type=compute_type,
             download_root=cache_dir,
             local_files_only=True,
+            num_workers=num_workers,
         )
     except RuntimeError as exc:
         model_path = _repair_and_download(size=size, model_path=model_path, cache_dir=cache_dir)
@@ -197,7 +206,9 @@ def load_model(
             compute_type=compute_type,
             download_root=cache_dir,
             local_files_only=True,
+            num_workers=num_workers,
         )
+    model.max_concurrency = num_workers
 
     stop_event.set()
     spinner_thread.join()
@@ -222,6 +233,13 @@ def load_speech_recorder(
     beam_size: int = 1,
     best_of: int = 1,
     temperature: float = 0.0,
+    streaming_transcription: bool = False,
+    warm_microphone: bool = False,
+    preroll_ms: int = 400,
+    min_speech_ms: int = 250,
+    min_speech_ratio: float = 0.01,
+    trim_padding_ms: int = 200,
+    unicode_input: bool = False,
 ) -> SpeechRecorder:
     """Build and return a fully configured SpeechRecorder instance."""
     message = "Lade SpeechRecorder…"
@@ -229,7 +247,7 @@ def load_speech_recorder(
     spinner_thread = threading.Thread(target=_spinner, args=(message, stop_event), daemon=True)
     spinner_thread.start()
 
-    keyboard_controller = KeyboardController(wait=wait_on_keyboard)
+    keyboard_controller = KeyboardController(wait=wait_on_keyboard, unicode_input=unicode_input)
     spoken_text_action_executor = SpokenTextActionExecutor(
         actions=load_spoken_text_actions(spoken_text_actions),
         enabled=spoken_text_actions_enabled,
@@ -249,6 +267,12 @@ def load_speech_recorder(
         beam_size=beam_size,
         best_of=best_of,
         temperature=temperature,
+        streaming_transcription=streaming_transcription,
+        warm_microphone=warm_microphone,
+        preroll_ms=preroll_ms,
+        min_speech_ms=min_speech_ms,
+        min_speech_ratio=min_speech_ratio,
+        trim_padding_ms=trim_padding_ms,
     )
 
     stop_event.set()
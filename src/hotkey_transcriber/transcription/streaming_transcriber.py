@@ -0,0 +1,185 @@
+"""
+Streaming Transcriber - Transcribe VAD-delimited windows while the hotkey is still held.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  StreamingTranscriber                   │
+    │  ┌───────────────────────────────────┐  │
+    │  │  _run (background thread)         │  │
+    │  │  → follows the recorder buffer    │  │
+    │  │  → Silero VAD on 512-sample frames│  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  pause after speech → _commit     │  │
+    │  │  → transcribe_fn(window) → texts  │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  finish()                         │  │
+    │  │  → transcribe unfinished tail     │  │
+    │  │  → join all window texts          │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+Only the audio after the last committed pause has to be decoded once the
+recording stops, so the time-to-text no longer grows with dictation length.
+Windows are zero-copy views into the recorder's AudioRingBuffer.
+
+Usage:
+    from hotkey_transcriber.transcription.streaming_transcriber import StreamingTranscriber
+
+    streamer = StreamingTranscriber(transcribe_fn=recorder._transcribe_audio, vad=vad)
+    streamer.start(audio_buf)
+    # ... recording stopped, audio stream closed ...
+    text = streamer.finish()
+"""
+
+import threading
+
+import numpy as np
+
+from hotkey_transcriber.audio.audio_ring_buffer import AudioRingBuffer
+
+_SAMPLE_RATE = 16_000
+_POLL_INTERVAL_S = 0.02
+
+
+class StreamingTranscriber:
+    """Feed completed speech windows to the model while the user is still talking.
+
+    *transcribe_fn* takes a mono float32 array and returns the transcribed text.
+    *vad* must provide ``WINDOW_SIZE``, ``reset()`` and ``is_speech(frame)``
+    (see ``speech_recorder._SileroVAD``).  The instance is reusable: call
+    ``start()`` for every recording and ``finish()`` after the stream is closed.
+    """
+
+    def __init__(
+        self,
+        transcribe_fn,
+        vad,
+        min_window_ms: int = 3000,
+        min_pause_ms: int = 500,
+        max_window_ms: int = 25_000,
+    ):
+        self._transcribe_fn = transcribe_fn
+        self._vad = vad
+        self._window_size = vad.WINDOW_SIZE
+        self._min_window_samples = _SAMPLE_RATE * min_window_ms // 1000
+        self._min_pause_frames = max(1, _SAMPLE_RATE * min_pause_ms // 1000 // self._window_size)
+        self._max_window_samples = _SAMPLE_RATE * max_window_ms // 1000
+
+        self._audio_buf: AudioRingBuffer | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self._texts: list[str] = []
+        self._window_start = 0  # first sample of the current (uncommitted) window
+        self._analysed = 0  # samples that have passed through the VAD
+        self._speech_seen = False
+        self._silence_frames = 0
+        self._failed = False
+
+    @property
+    def committed_windows(self) -> int:
+        return len(self._texts)
+
+    def start(self, audio_buf: AudioRingBuffer) -> None:
+        """Start following *audio_buf* on a background thread."""
+        self._audio_buf = audio_buf
+        self._reset_state()
+        self._vad.reset()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def finish(self) -> str:
+        """Classify the remaining audio, transcribe the tail and return the full text.
+
+        Must only be called after the audio stream has been stopped, so the
+        buffer already contains the complete recording.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        tail = self._audio_buf.view(self._window_start)
+        if len(tail) and (self._speech_seen or self._failed or not self._texts):
+            text = self._transcribe_fn(tail)
+            if text:
+                self._texts.append(text)
+        return " ".join(self._texts).strip()
+
+    def cancel(self) -> None:
+        """Stop following the buffer and discard everything, without transcribing."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._reset_state()
+
+    # ------------------------------------------------------------------ #
+    # Worker thread                                                        #
+    # ------------------------------------------------------------------ #
+
+    def _run(self) -> None:
+        while True:
+            # Read the stop flag *before* checking for new audio, so the final
+            # pass after stop() still sees everything the callback wrote.
+            stopping = self._stop_event.is_set()
+            available = len(self._audio_buf)
+            while available - self._analysed >= self._window_size:
+                end = self._analysed + self._window_size
+                self._observe(self._audio_buf.view(self._analysed, end))
+                self._analysed = end
+            if stopping:
+                return
+            self._stop_event.wait(_POLL_INTERVAL_S)
+
+    def _observe(self, frame: np.ndarray) -> None:
+        try:
+            is_speech = self._vad.is_speech(frame)
+        except Exception:
+            is_speech = True  # Fallback if VAD fails
+
+        if is_speech:
+            self._speech_seen = True
+            self._silence_frames = 0
+        else:
+            self._silence_frames += 1
+
+        if self._failed:
+            return
+
+        analysed = self._analysed + len(frame)
+        window_samples = analysed - self._window_start
+
+        if not self._speech_seen:
+            # Only silence so far: keep the pending window from growing forever.
+            if window_samples > self._max_window_samples:
+                self._window_start = analysed - self._min_pause_frames * self._window_size
+            return
+
+        paused = self._silence_frames >= self._min_pause_frames
+        if (
+            paused and window_samples >= self._min_window_samples
+        ) or window_samples >= self._max_window_samples:
+            self._commit(analysed)
+
+    def _commit(self, cut: int) -> None:
+        window = self._audio_buf.view(self._window_start, cut)
+        self._speech_seen = False
+        self._silence_frames = 0
+
+        try:
+            text = self._transcribe_fn(window)
+        except Exception as exc:
+            # Keep the window pending and let finish() decode everything in one go.
+            print(f"Streaming-Transkription fehlgeschlagen: {exc}")
+            self._speech_seen = True
+            self._failed = True
+            return
+        self._window_start = cut
+        if text:
+            self._texts.append(text)
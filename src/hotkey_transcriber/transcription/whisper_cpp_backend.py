@@ -1,7 +1,7 @@
-import json
+import contextlib
+import io
 import os
 import subprocess
-import tempfile
 import wave
 from dataclasses import dataclass
 from pathlib import Path
@@ -9,6 +9,12 @@ from pathlib import Path
 import numpy as np
 from huggingface_hub import hf_hub_download
 
+from hotkey_transcriber.latency_tracker import mark_stage
+from hotkey_transcriber.transcription.whisper_cpp_server import (
+    WhisperCppServer,
+    WhisperCppServerError,
+)
+
 _MODEL_TO_HF_FILE = {
     # Full precision
     "tiny": ("ggerganov/whisper.cpp", "ggml-tiny.bin"),
@@ -42,7 +48,33 @@ class _Segment:
     text: str
 
 
+def _wav_bytes(audio_i16: np.ndarray) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(audio_i16.tobytes())
+    return buf.getvalue()
+
+
+def _parse_cli_output(stdout: bytes) -> str:
+    # whisper-cli prints one line per segment; join them like the JSON "text" field.
+    lines = stdout.decode("utf-8", errors="replace").splitlines()
+    return " ".join(line.strip() for line in lines if line.strip())
+
+
 class WhisperCppModel:
+    """whisper.cpp model, served by one persistent whisper-server process.
+
+    The server keeps the GGML model loaded in (GPU) memory, so a dictation
+    only pays for inference.  Builds without whisper-server fall back to one
+    whisper-cli run per call.
+    """
+
+    # One request at a time: parallel runs would fight over the GPU.
+    max_concurrency = 1
+
     def __init__(self, model_size: str):
         if model_size in _CT2_ONLY_MODELS or model_size not in _MODEL_TO_HF_FILE:
             raise ValueError(
@@ -51,6 +83,33 @@ class WhisperCppModel:
         self._model_size = model_size
         self._model_path = self._resolve_model_path(model_size)
         self._cli_path = self._resolve_cli_path()
+        self._server = self._start_server()
+
+    def _start_server(self) -> WhisperCppServer | None:
+        server_path = self._resolve_server_path()
+        if server_path is None:
+            print("[whisper.cpp] whisper-server nicht gefunden, verwende whisper-cli.", flush=True)
+            return None
+        # Flash attention stays off: it regresses non-English output (issue #3020)
+        # and the server flag applies to every language.
+        server = WhisperCppServer([server_path, "-m", self._model_path, "-nfa"])
+        try:
+            server.start()
+        except (OSError, WhisperCppServerError) as exc:
+            print(f"[whisper.cpp] Server-Start fehlgeschlagen ({exc}), verwende whisper-cli.")
+            server.close()
+            return None
+        return server
+
+    def _resolve_server_path(self) -> str | None:
+        explicit = os.getenv("HOTKEY_TRANSCRIBER_WHISPER_CPP_SERVER", "").strip()
+        cli = Path(self._cli_path)
+        candidates = [Path(explicit)] if explicit else []
+        candidates.append(cli.with_name(cli.name.replace("whisper-cli", "whisper-server")))
+        for candidate in candidates:
+            if candidate.is_file():
+                return str(candidate)
+        return None
 
     def _resolve_model_path(self, model_size: str) -> str:
         repo_id, file_name = _MODEL_TO_HF_FILE[model_size]
@@ -101,51 +160,54 @@ class WhisperCppModel:
         audio_f32 = np.asarray(audio, dtype=np.float32)
         audio_i16 = np.clip(audio_f32, -1.0, 1.0)
         audio_i16 = (audio_i16 * 32767.0).astype(np.int16)
+        lang = "auto" if not language else str(language)
+
+        if self._server is not None:
+            mark_stage("inference_start")
+            text = self._server.inference(
+                _wav_bytes(audio_i16),
+                language=lang,
+                beam_size=beam_size,
+                best_of=best_of,
+                temperature=temperature,
+            )
+            mark_stage("inference_end", overwrite=True)
+            return iter([_Segment(text=text)] if text else []), {"language": language}
+
+        # "-f -" reads the WAV from stdin and "-np" leaves only the transcript on
+        # stdout, so no temporary files are written or read.
+        cmd = [
+            self._cli_path,
+            "-m", self._model_path,
+            "-f", "-",
+            "-nt",
+            "-np",
+            "-bs", str(max(1, beam_size)),
+            "-bo", str(max(1, best_of)),
+            "-tp", str(float(temperature)),
+            "-nf",
+            "-l", lang,
+        ]
+        # Flash attention causes quality regressions for non-English (issue #3020).
+        if lang == "en":
+            cmd.append("-fa")
+        else:
+            cmd.append("-nfa")
+        mark_stage("inference_start")
+        proc = subprocess.run(cmd, input=_wav_bytes(audio_i16), capture_output=True)
+        mark_stage("inference_end", overwrite=True)
+        if proc.returncode != 0:
+            stderr = proc.stderr.decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"whisper.cpp fehlgeschlagen (exit={proc.returncode}): {stderr}")
+
+        text = _parse_cli_output(proc.stdout)
+        return iter([_Segment(text=text)] if text else []), {"language": language}
 
-        with tempfile.TemporaryDirectory(prefix="hotkey-transcriber-whispercpp-") as td:
-            wav_path = Path(td) / "input.wav"
-            out_prefix = Path(td) / "result"
-            out_json = Path(f"{out_prefix}.json")
-
-            with wave.open(str(wav_path), "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(16000)
-                wf.writeframes(audio_i16.tobytes())
-
-            lang = "auto" if not language else str(language)
-            cmd = [
-                self._cli_path,
-                "-m", self._model_path,
-                "-f", str(wav_path),
-                "-oj",
-                "-of", str(out_prefix),
-                "-nt",
-                "-np",
-                "-bs", str(max(1, beam_size)),
-                "-bo", str(max(1, best_of)),
-                "-tp", str(float(temperature)),
-                "-nf",
-                "-l", lang,
-            ]
-            # Flash attention causes quality regressions for non-English (issue #3020).
-            if lang == "en":
-                cmd.append("-fa")
-            else:
-                cmd.append("-nfa")
-            proc = subprocess.run(cmd, capture_output=True, text=True)
-            if proc.returncode != 0:
-                raise RuntimeError(
-                    f"whisper.cpp fehlgeschlagen (exit={proc.returncode}): {proc.stderr.strip()}"
-                )
-            if not out_json.is_file():
-                raise RuntimeError("whisper.cpp hat keine JSON-Ausgabe erzeugt.")
-
-            data = json.loads(out_json.read_text(encoding="utf-8"))
-            text = str(data.get("text", "")).strip()
-            if not text:
-                # Older whisper.cpp JSON format stores text per segment.
-                segs = data.get("transcription", [])
-                text = " ".join(str(s.get("text", "")).strip() for s in segs).strip()
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
 
-        return iter([_Segment(text=text)] if text else []), {"language": language}
+    def __del__(self):
+        with contextlib.suppress(Exception):
+            self.close()
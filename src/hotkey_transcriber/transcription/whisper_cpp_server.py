@@ -0,0 +1,223 @@
+"""
+Whisper.cpp Server - One long-lived whisper-server process that keeps the GGML model loaded.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  WhisperCppServer                       │
+    │  ┌───────────────────────────────────┐  │
+    │  │  start()                          │  │
+    │  │  → whisper-server -m model        │  │
+    │  │    --host 127.0.0.1 --port N      │  │
+    │  │  → poll GET /health until ready   │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  inference(wav_bytes, ...)        │  │
+    │  │  → POST /inference (multipart)    │  │
+    │  │  → {"text": ...}                  │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  process died / connection lost   │  │
+    │  │  → restart once, resend request   │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+The server only listens on the loopback interface.  Its log output (stderr)
+is drained on a thread; the last lines are attached to startup errors.
+
+Usage:
+    from hotkey_transcriber.transcription.whisper_cpp_server import WhisperCppServer
+
+    server = WhisperCppServer([server_path, "-m", model_path])
+    server.start()
+    text = server.inference(wav_bytes, language="de")
+"""
+
+import collections
+import json
+import socket
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+
+# The server is on loopback; http_proxy or a system proxy must not reroute these requests.
+_LOOPBACK_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+
+class WhisperCppServerError(RuntimeError):
+    pass
+
+
+def _free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+def _multipart(fields: dict[str, str], file_field: str, file_name: str, data: bytes):
+    boundary = uuid.uuid4().hex
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+            f"{value}\r\n".encode()
+        )
+    parts.append(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{file_field}"; '
+        f'filename="{file_name}"\r\nContent-Type: audio/wav\r\n\r\n'.encode()
+    )
+    parts.append(data)
+    parts.append(f"\r\n--{boundary}--\r\n".encode())
+    return b"".join(parts), f"multipart/form-data; boundary={boundary}"
+
+
+class WhisperCppServer:
+    """Owns a whisper-server process (*command* without ``--host``/``--port``)."""
+
+    def __init__(
+        self,
+        command: list[str],
+        host: str = "127.0.0.1",
+        startup_timeout_s: float = 300.0,
+        request_timeout_s: float = 600.0,
+    ):
+        self._command = list(command)
+        self._host = host
+        self._startup_timeout_s = startup_timeout_s
+        self._request_timeout_s = request_timeout_s
+        self._proc: subprocess.Popen | None = None
+        self._port: int | None = None
+        self._log_tail: collections.deque[str] = collections.deque(maxlen=20)
+        self._lock = threading.Lock()
+        self.restarts = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._host}:{self._port}"
+
+    def is_alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self) -> None:
+        """Spawn the server and block until ``/health`` reports the model as loaded."""
+        self._port = _free_port(self._host)
+        self._log_tail.clear()
+        self._proc = subprocess.Popen(
+            [*self._command, "--host", self._host, "--port", str(self._port)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        threading.Thread(target=self._drain_log, args=(self._proc,), daemon=True).start()
+
+        deadline = time.monotonic() + self._startup_timeout_s
+        while time.monotonic() < deadline:
+            if not self.is_alive():
+                raise WhisperCppServerError(
+                    f"whisper-server beendet (exit={self._proc.returncode}): {self._log()}"
+                )
+            if self.healthy():
+                return
+            time.sleep(0.05)
+        self.close()
+        raise WhisperCppServerError(
+            f"whisper-server nicht bereit nach {self._startup_timeout_s:.0f}s: {self._log()}"
+        )
+
+    def healthy(self) -> bool:
+        """True when the server answers and has its model loaded."""
+        try:
+            with _LOOPBACK_OPENER.open(f"{self.url}/health", timeout=2) as resp:
+                return resp.status == 200
+        except urllib.error.HTTPError as exc:
+            # 503 while the model loads; builds without /health answer 404 once listening.
+            return exc.code == 404
+        except OSError:
+            return False
+
+    def inference(
+        self,
+        wav_bytes: bytes,
+        language: str = "auto",
+        beam_size: int = 1,
+        best_of: int = 1,
+        temperature: float = 0.0,
+    ) -> str:
+        """Transcribe one in-memory WAV file; restarts a dead server once and retries."""
+        fields = {
+            "language": language,
+            "beam_size": str(max(1, beam_size)),
+            "best_of": str(max(1, best_of)),
+            "temperature": str(float(temperature)),
+            "temperature_inc": "0.0",
+            "no_timestamps": "true",
+            "response_format": "json",
+        }
+        body, content_type = _multipart(fields, "file", "input.wav", wav_bytes)
+        with self._lock:
+            if not self.is_alive():
+                self._restart()
+            try:
+                return self._post(body, content_type)
+            except (ConnectionError, urllib.error.URLError) as exc:
+                if isinstance(exc, urllib.error.HTTPError) or not self._exited():
+                    raise WhisperCppServerError(
+                        f"whisper-server Anfrage fehlgeschlagen: {exc}"
+                    ) from exc
+            self._restart()
+            try:
+                return self._post(body, content_type)
+            except (ConnectionError, urllib.error.URLError) as exc:
+                raise WhisperCppServerError(
+                    f"whisper-server Anfrage fehlgeschlagen: {exc}"
+                ) from exc
+
+    def _post(self, body: bytes, content_type: str) -> str:
+        request = urllib.request.Request(
+            f"{self.url}/inference",
+            data=body,
+            headers={"Content-Type": content_type},
+            method="POST",
+        )
+        with _LOOPBACK_OPENER.open(request, timeout=self._request_timeout_s) as resp:
+            data = json.loads(resp.read().decode("utf-8"))
+        if "error" in data:
+            raise WhisperCppServerError(f"whisper-server Fehler: {data['error']}")
+        return str(data.get("text", "")).strip()
+
+    def _exited(self, grace_s: float = 1.0) -> bool:
+        # A crash drops the connection slightly before the process is reaped.
+        try:
+            self._proc.wait(timeout=grace_s)
+        except subprocess.TimeoutExpired:
+            return False
+        return True
+
+    def _restart(self) -> None:
+        exit_code = self._proc.poll() if self._proc is not None else None
+        print(f"[whisper.cpp] Server neu gestartet (exit={exit_code}).", flush=True)
+        self.restarts += 1
+        self.close()
+        self.start()
+
+    def _drain_log(self, proc: subprocess.Popen) -> None:
+        for raw in proc.stderr:
+            line = raw.decode("utf-8", errors="replace").strip()
+            if line:
+                self._log_tail.append(line)
+
+    def _log(self) -> str:
+        return " | ".join(self._log_tail) or "keine Ausgabe"
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None or proc.poll() is not None:
+            return
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
@@ -2,23 +2,29 @@
 
 Runs inference in the ryzen-ai-1.7.0 conda environment via a persistent
 subprocess (tools/whisper_npu_server.py).  The main process downloads ONNX
-models, starts the server, and communicates via line-delimited JSON on
-stdin/stdout.  Audio is transferred through a temporary WAV file whose path
-is included in each request.
+models, starts the server, and communicates via worker_protocol frames on
+stdin/stdout.  Audio travels inline in the request frame as int16 PCM.
 """
 
-import json
+import contextlib
 import os
 import subprocess
-import tempfile
-import threading
-import wave
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
-import numpy as np
 from huggingface_hub import snapshot_download
 
+from hotkey_transcriber.latency_tracker import mark_stage
+from hotkey_transcriber.transcription.worker_client import WorkerClient, WorkerClosedError
+from hotkey_transcriber.transcription.worker_protocol import (
+    ERROR,
+    READY,
+    TRANSCRIBE,
+    pcm_from_audio,
+)
+from hotkey_transcriber.transcription.worker_supervisor import WorkerSupervisor
+
 # Maps model name → (amd_repo_id, encoder_filename, decoder_filename, openai_hf_id)
 # The AMD repos contain ONNX exports; the openai HF ID is used for tokenizer/feature extractor.
 _MODEL_TO_AMD_REPO: dict[str, tuple[str, str, str, str]] = {
@@ -30,6 +36,12 @@ _MODEL_TO_AMD_REPO: dict[str, tuple[str, str, str, str]] = {
     "large-v3-turbo": ("amd/whisper-large-turbo-onnx-npu", "encoder_model.onnx",     "decoder_model.onnx",     "openai/whisper-large-v3-turbo"),
 }
 
+# A model load includes the NPU compilation on first use, which can take minutes.
+_STARTUP_TIMEOUT_S = 600
+# Pings are answered while a decode runs; a decode that runs longer counts as hung, so the
+# supervisor restarts the server and replays the request once.
+_REQUEST_TIMEOUT_S = 300
+
 _CONDA_PYTHON_CANDIDATES = [
     Path(r"C:\ProgramData\miniconda3\envs\ryzen-ai-1.7.0\python.exe"),
     Path.home() / ".conda" / "envs" / "ryzen-ai-1.7.0" / "python.exe",
@@ -90,11 +102,16 @@ class WhisperNpuModel:
     """Whisper model running encoder on AMD NPU via VitisAI EP, decoder on CPU.
 
     Starts a persistent subprocess in the ryzen-ai-1.7.0 conda environment
-    that loads the ONNX models and processes inference requests via JSON lines.
+    that loads the ONNX models and processes inference requests via binary frames.
     The first startup may take several minutes while the NPU compiles the encoder.
+    A WorkerSupervisor restarts the server if it crashes or stops answering
+    heartbeats; with *standby* a second, pre-loaded server takes over at once.
     """
 
-    def __init__(self, model_size: str):
+    # The server process transcribes one request at a time.
+    max_concurrency = 1
+
+    def __init__(self, model_size: str, standby: bool = False):
         if model_size not in _MODEL_TO_AMD_REPO:
             supported = list(_MODEL_TO_AMD_REPO.keys())
             raise ValueError(
@@ -131,7 +148,7 @@ class WhisperNpuModel:
 
         print("[NPU] Starte NPU-Inference-Server (erste NPU-Kompilierung kann Minuten dauern)...", flush=True)
 
-        cmd = [
+        self._cmd = [
             str(conda_python),
             str(server_script),
             "--encoder", str(encoder_path),
@@ -141,79 +158,68 @@ class WhisperNpuModel:
             "--cache-dir", str(cache_dir),
         ]
 
-        self._proc = subprocess.Popen(
-            cmd,
+        # Only the first start draws the spinner; restarts and standby loads run in the background.
+        supervisor = WorkerSupervisor(self._spawn_worker, name="NPU", standby=standby)
+        supervisor.start(self._spawn_worker(show_spinner=True))
+        self.supervisor = supervisor
+        print("[NPU] NPU-Server bereit.", flush=True)
+
+    def _spawn_worker(self, show_spinner: bool = False) -> WorkerClient:
+        proc = subprocess.Popen(
+            self._cmd,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
+            stderr=subprocess.PIPE,
+            bufsize=0,
         )
 
-        # Block until server signals {"status": "ready"}.
-        # VitisAI EP writes verbose debug output to stdout during NPU compilation.
-        # Show a spinner with elapsed time on a background thread (independent of line rate).
-        # The reader thread keeps running after startup so transcribe() reads from the same queue
-        # (avoids race condition between reader thread and readline() competing on the same pipe).
-        import time
-        import queue
-
+        # Block until the server sends its "ready" frame; NPU compilation can take minutes.
+        # The server moves VitisAI's debug output from stdout to stderr, so stdout only carries frames.
+        # stderr is drained continuously (only its tail is kept, for error messages).
+        # With show_spinner, show a spinner with elapsed time while waiting.
         start_time = time.time()
-        self._line_queue: queue.Queue = queue.Queue()
-
-        def _reader():
-            for line in self._proc.stdout:
-                self._line_queue.put(line)
-            self._line_queue.put(None)  # Sentinel: pipe closed
-
-        reader_thread = threading.Thread(target=_reader, daemon=True)
-        reader_thread.start()
+        client = WorkerClient(proc, name="NPU", log_stderr=False)
 
         spinner_chars = ["|", "/", "-", "\\"]
         spinner_idx = 0
-        status = None
 
         while True:
-            # Update spinner every 0.1s regardless of line rate
+            # Update spinner every 0.1s until the server is ready
             try:
-                line = self._line_queue.get(timeout=0.1)
-            except queue.Empty:
+                status = client.wait_ready(timeout=0.1)
+                break
+            except TimeoutError:
                 elapsed = int(time.time() - start_time)
+                if elapsed >= _STARTUP_TIMEOUT_S:
+                    client.kill()
+                    if show_spinner:
+                        print()
+                    raise RuntimeError(
+                        f"[NPU] NPU-Server nicht bereit nach {_STARTUP_TIMEOUT_S}s."
+                    ) from None
+                if not show_spinner:
+                    continue
                 char = spinner_chars[spinner_idx % len(spinner_chars)]
                 spinner_idx += 1
                 print(f"\r{char} [NPU] Lade/Kompiliere Modell fuer NPU... {elapsed}s", end="", flush=True)
-                continue
-
-            if line is None:
+            except WorkerClosedError as exc:
                 # Pipe closed — server exited unexpectedly
-                self._proc.wait()
-                print()
+                proc.wait()
+                if show_spinner:
+                    print()
                 raise RuntimeError(
-                    f"[NPU] NPU-Server-Prozess unerwartet beendet (exit={self._proc.returncode})."
-                )
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                status = json.loads(line)
-                break  # Got valid JSON — done
-            except json.JSONDecodeError:
-                # VitisAI debug line — just keep spinning
-                elapsed = int(time.time() - start_time)
-                char = spinner_chars[spinner_idx % len(spinner_chars)]
-                spinner_idx += 1
-                print(f"\r{char} [NPU] Lade/Kompiliere Modell fuer NPU... {elapsed}s", end="", flush=True)
+                    f"[NPU] NPU-Server-Prozess unerwartet beendet (exit={proc.returncode}). {exc}"
+                ) from None
 
-        print(f"\r[NPU] Modell geladen ({int(time.time() - start_time)}s).                          ", flush=True)
+        if show_spinner:
+            print(f"\r[NPU] Modell geladen ({int(time.time() - start_time)}s).                          ", flush=True)
 
-        if status.get("status") != "ready":
-            self._proc.terminate()
+        if status.get("type") != READY:
+            client.kill()
             if "error" in status:
                 raise RuntimeError(f"[NPU] NPU-Server Fehler beim Start: {status['error']}")
             raise RuntimeError(f"[NPU] NPU-Server nicht bereit: {status}")
-
-        self._lock = threading.Lock()
-        print("[NPU] NPU-Server bereit.", flush=True)
+        return client
 
     def transcribe(
         self,
@@ -227,51 +233,31 @@ class WhisperNpuModel:
     ):
         del vad_filter, beam_size, best_of, temperature, condition_on_previous_text
 
-        audio_f32 = np.asarray(audio, dtype=np.float32)
-        audio_i16 = np.clip(audio_f32, -1.0, 1.0)
-        audio_i16 = (audio_i16 * 32767.0).astype(np.int16)
-
-        with tempfile.TemporaryDirectory(prefix="hotkey-transcriber-npu-") as td:
-            wav_path = Path(td) / "input.wav"
-
-            with wave.open(str(wav_path), "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(16000)
-                wf.writeframes(audio_i16.tobytes())
-
-            lang = "auto" if not language else str(language)
-            request = json.dumps({"wav_path": str(wav_path), "language": lang})
-
-            # Lock ensures requests are processed one at a time
-            with self._lock:
-                self._proc.stdin.write(request + "\n")
-                self._proc.stdin.flush()
-                # Read from the shared queue (reader thread owns the pipe; direct readline would race)
-                result = None
-                while True:
-                    response_line = self._line_queue.get()  # blocks until next line or sentinel
-                    if response_line is None:
-                        raise RuntimeError("[NPU] NPU-Server-Prozess unerwartet beendet.")
-                    response_line = response_line.strip()
-                    if not response_line:
-                        continue
-                    try:
-                        result = json.loads(response_line)
-                        break
-                    except json.JSONDecodeError:
-                        continue  # Skip debug output
-            # WAV temp dir cleaned up here (after server has already read and processed the file)
-
-        if "error" in result:
+        lang = "auto" if not language else str(language)
+        payload = pcm_from_audio(audio)
+
+        mark_stage("inference_start")
+        try:
+            result = self.supervisor.request(
+                {"type": TRANSCRIBE, "language": lang}, payload, timeout=_REQUEST_TIMEOUT_S
+            )
+        except WorkerClosedError as exc:
+            raise RuntimeError(f"[NPU] NPU-Server-Prozess unerwartet beendet. {exc}") from None
+        except TimeoutError as exc:
+            raise RuntimeError(f"[NPU] Transkription haengt: {exc}") from None
+        mark_stage("inference_end", overwrite=True)
+
+        if result.get("type") == ERROR:
             raise RuntimeError(f"[NPU] NPU-Server Fehler: {result['error']}")
 
         text = result.get("text", "").strip()
         return iter([_Segment(text=text)] if text else []), {"language": language}
 
+    def close(self) -> None:
+        supervisor, self.supervisor = getattr(self, "supervisor", None), None
+        if supervisor is not None:
+            supervisor.close()
+
     def __del__(self):
-        try:
-            if hasattr(self, "_proc") and self._proc.poll() is None:
-                self._proc.terminate()
-        except Exception:
-            pass
+        with contextlib.suppress(Exception):
+            self.close()
@@ -0,0 +1,181 @@
+"""
+Worker Client - App side of the worker protocol: one reader per pipe, replies routed by request id.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  WorkerClient(proc)                     │
+    │  ┌───────────────────────────────────┐  │
+    │  │  request(header, pcm, timeout)    │  │
+    │  │  → write frame (next request id)  │  │
+    │  │  → wait on the Future for that id │  │
+    │  │  → timeout: send cancel, forget   │  │
+    │  │    the id, raise TimeoutError     │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  stdout reader thread             │  │
+    │  │  → read_frame → Future[id]        │  │
+    │  │  → late / unknown ids dropped     │  │
+    │  │  → EOF: fail all pending Futures  │  │
+    │  └───────────────────────────────────┘  │
+    │  ┌───────────────────────────────────┐  │
+    │  │  stderr drain thread              │  │
+    │  │  → app log (optional) + tail      │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+A timed-out request never leaves a reader blocked mid-frame: the single
+reader keeps consuming the stream, and the late reply is discarded by id.
+
+Usage:
+    from hotkey_transcriber.transcription.worker_client import WorkerClient
+
+    client = WorkerClient(proc, name="WSL")
+    info = client.wait_ready(timeout=600)
+    reply = client.request({"type": "transcribe"}, pcm, timeout=300)
+"""
+
+import collections
+import contextlib
+import itertools
+import threading
+from concurrent.futures import Future
+
+from hotkey_transcriber.transcription.worker_protocol import (
+    CANCEL,
+    ProtocolError,
+    read_frame,
+    write_frame,
+)
+
+
+class WorkerClosedError(RuntimeError):
+    pass
+
+
+class WorkerClient:
+    """Multiplexes requests over a worker process started with binary stdin/stdout/stderr pipes.
+
+    With *log_stderr* every stderr line of the worker is printed to the app
+    log; otherwise only the last lines are kept for error messages.
+    """
+
+    def __init__(self, proc, name: str = "worker", log_stderr: bool = True):
+        self._proc = proc
+        self._name = name
+        self._log_stderr = log_stderr
+        self._ids = itertools.count(1)
+        self._pending: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._ready: Future = Future()
+        self._closed_error: WorkerClosedError | None = None
+        self.stderr_tail: collections.deque[str] = collections.deque(maxlen=20)
+        self._stderr_done = threading.Event()
+
+        threading.Thread(target=self._read_loop, daemon=True).start()
+        if proc.stderr is not None:
+            threading.Thread(target=self._drain_stderr, daemon=True).start()
+        else:
+            self._stderr_done.set()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed_error is not None
+
+    def wait_ready(self, timeout: float | None = None) -> dict:
+        """Header of the worker's ``ready`` frame; raises TimeoutError or WorkerClosedError."""
+        return self._ready.result(timeout)
+
+    def submit(self, header: dict, payload: bytes = b"") -> tuple[int, Future]:
+        """Send a request and return ``(request_id, Future[reply header])``."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed_error is not None:
+                raise self._closed_error
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+        try:
+            self._write(request_id, header, payload)
+        except OSError as exc:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            raise WorkerClosedError(f"{self._name}: Pipe geschlossen ({exc}).") from exc
+        return request_id, future
+
+    def request(self, header: dict, payload: bytes = b"", timeout: float | None = None) -> dict:
+        request_id, future = self.submit(header, payload)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            self.cancel(request_id)
+            raise TimeoutError(
+                f"{self._name}: Anfrage {request_id} nach {timeout}s abgebrochen."
+            ) from None
+
+    def cancel(self, request_id: int) -> None:
+        """Forget *request_id* and ask the worker to drop it; its reply is discarded."""
+        with self._lock:
+            future = self._pending.pop(request_id, None)
+        if future is not None:
+            future.cancel()
+        with contextlib.suppress(OSError):
+            self._write(request_id, {"type": CANCEL})
+
+    def _write(self, request_id: int, header: dict, payload: bytes = b"") -> None:
+        with self._write_lock:
+            write_frame(self._proc.stdin, request_id, header, payload)
+
+    def _read_loop(self) -> None:
+        reason = "Pipe geschlossen"
+        try:
+            while (frame := read_frame(self._proc.stdout)) is not None:
+                if frame.request_id == 0 and not self._ready.done():
+                    self._ready.set_result(frame.header)
+                    continue
+                with self._lock:
+                    future = self._pending.pop(frame.request_id, None)
+                if future is not None and not future.done():
+                    future.set_result(frame.header)
+        except (ProtocolError, OSError, ValueError) as exc:
+            reason = str(exc)
+        self._fail_pending(reason)
+
+    def _fail_pending(self, reason: str) -> None:
+        # Give the stderr drain a moment so the error carries the worker's last words.
+        self._stderr_done.wait(1.0)
+        tail = " | ".join(self.stderr_tail)
+        error = WorkerClosedError(
+            f"{self._name}: Prozess unerwartet beendet ({reason}). {tail}".strip()
+        )
+        with self._lock:
+            self._closed_error = error
+            pending, self._pending = self._pending, {}
+        if not self._ready.done():
+            self._ready.set_exception(error)
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def _drain_stderr(self) -> None:
+        try:
+            for raw in self._proc.stderr:
+                line = raw.decode("utf-8", errors="replace").rstrip()
+                if not line:
+                    continue
+                self.stderr_tail.append(line)
+                if self._log_stderr:
+                    print(f"[{self._name}] {line}", flush=True)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._stderr_done.set()
+
+    def kill(self) -> None:
+        """Kill the worker process; pending requests fail once its pipes close."""
+        with contextlib.suppress(OSError):
+            self._proc.kill()
+
+    def close(self) -> None:
+        """Close the worker's stdin; a worker reading frames then exits on its own."""
+        with contextlib.suppress(OSError), self._write_lock:
+            self._proc.stdin.close()
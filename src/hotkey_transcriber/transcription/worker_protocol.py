@@ -0,0 +1,238 @@
+"""
+Worker Protocol - Length-prefixed binary frames between the app and out-of-process inference workers.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  Frame                                  │
+    │  ┌───────────────────────────────────┐  │
+    │  │  magic "HTW1"      4 bytes        │  │
+    │  │  request_id        uint32 LE      │  │
+    │  │  header_len        uint32 LE      │  │
+    │  │  payload_len       uint32 LE      │  │
+    │  │  header            UTF-8 JSON     │  │
+    │  │  payload           int16 PCM      │  │
+    │  └───────────────────────────────────┘  │
+    │  ┌───────────────────────────────────┐  │
+    │  │  app → worker                     │  │
+    │  │  transcribe / ping / cancel /     │  │
+    │  │  shutdown                         │  │
+    │  │  worker → app                     │  │
+    │  │  ready / result / error / pong /  │  │
+    │  │  cancelled                        │  │
+    │  └───────────────────────────────────┘  │
+    │  ┌───────────────────────────────────┐  │
+    │  │  WorkerServer (in the worker)     │  │
+    │  │  → reader thread: ping, cancel    │  │
+    │  │  → main thread: transcribe        │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+Replies carry the request_id of their request, so a client may have several
+requests in flight.  A cancel frame carries the id of the request it
+cancels.  Audio travels inline as 16 kHz mono int16 PCM; no temporary WAV
+files are written.
+
+This module only needs the standard library (numpy is imported lazily for
+the PCM helpers): the WSL bridge copies it next to its server script, and
+tools/whisper_npu_server.py imports it from the source tree.
+
+Usage:
+    # worker
+    server = WorkerServer(handle_transcribe, info={"device": "cuda"})
+    server.serve()
+
+    # app
+    write_frame(proc.stdin, 1, {"type": "transcribe", "language": "de"}, pcm_from_audio(audio))
+    frame = read_frame(proc.stdout)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import struct
+import sys
+import threading
+import traceback
+from dataclasses import dataclass, field
+
+MAGIC = b"HTW1"
+_PREFIX = struct.Struct("<4sIII")
+_MAX_HEADER = 1 << 20
+_MAX_PAYLOAD = 1 << 30
+
+# app → worker
+TRANSCRIBE = "transcribe"
+PING = "ping"
+CANCEL = "cancel"
+SHUTDOWN = "shutdown"
+# worker → app
+READY = "ready"
+RESULT = "result"
+ERROR = "error"
+PONG = "pong"
+CANCELLED = "cancelled"
+
+
+class ProtocolError(RuntimeError):
+    pass
+
+
+@dataclass
+class Frame:
+    request_id: int
+    header: dict = field(default_factory=dict)
+    payload: bytes = b""
+
+    @property
+    def type(self) -> str:
+        return self.header.get("type", "")
+
+
+def encode_frame(request_id: int, header: dict, payload: bytes = b"") -> bytes:
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    return _PREFIX.pack(MAGIC, request_id, len(header_bytes), len(payload)) + header_bytes + payload
+
+
+def write_frame(stream, request_id: int, header: dict, payload: bytes = b"") -> None:
+    data = memoryview(encode_frame(request_id, header, payload))
+    while data:
+        # Unbuffered pipes (Popen(bufsize=0)) may take only part of a large PCM frame.
+        data = data[stream.write(data) :]
+    stream.flush()
+
+
+def _read_exact(stream, n: int) -> bytes:
+    chunks = []
+    while n > 0:
+        chunk = stream.read(n)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b"".join(chunks)
+
+
+def read_frame(stream) -> Frame | None:
+    """Read the next frame; None at a clean end of stream."""
+    prefix = _read_exact(stream, _PREFIX.size)
+    if not prefix:
+        return None
+    if len(prefix) < _PREFIX.size:
+        raise ProtocolError("Stream endete mitten im Frame-Kopf.")
+    magic, request_id, header_len, payload_len = _PREFIX.unpack(prefix)
+    if magic != MAGIC:
+        raise ProtocolError(f"Ungueltige Frame-Kennung: {magic!r}")
+    if header_len > _MAX_HEADER or payload_len > _MAX_PAYLOAD:
+        raise ProtocolError(f"Frame zu gross (header={header_len}, payload={payload_len}).")
+    body = _read_exact(stream, header_len + payload_len)
+    if len(body) < header_len + payload_len:
+        raise ProtocolError("Stream endete mitten im Frame.")
+    header = json.loads(body[:header_len].decode("utf-8")) if header_len else {}
+    return Frame(request_id, header, body[header_len:])
+
+
+def pcm_from_audio(audio) -> bytes:
+    """float32 samples in [-1, 1] → int16 little-endian PCM."""
+    import numpy as np
+
+    arr = np.clip(np.asarray(audio, dtype=np.float32).reshape(-1), -1.0, 1.0)
+    return (arr * 32767.0).astype("<i2").tobytes()
+
+
+def audio_from_pcm(payload: bytes):
+    """int16 little-endian PCM → float32 samples."""
+    import numpy as np
+
+    return np.frombuffer(payload, dtype="<i2").astype(np.float32) / 32767.0
+
+
+def claim_stdout():
+    """Return a private binary stdout and point fd 1 at stderr.
+
+    Native libraries (CTranslate2, VitisAI) print to fd 1; after this call
+    their output lands on stderr instead of corrupting the frame stream.
+    """
+    sys.stdout.flush()
+    out = os.fdopen(os.dup(1), "wb", buffering=0)
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    return out
+
+
+class WorkerServer:
+    """Frame loop of a worker process.
+
+    *handle(header, audio) -> dict* runs on the calling thread, one request at
+    a time; its dict is sent back as the ``result`` header.  Pings and
+    cancels are answered by the reader thread, so they work while a request
+    is being transcribed.  A request cancelled while running still finishes,
+    but its result is replaced by ``cancelled``.
+    """
+
+    def __init__(self, handle, info: dict | None = None, stdin=None, stdout=None):
+        self._handle = handle
+        self.info = dict(info or {})
+        self._in = stdin if stdin is not None else sys.stdin.buffer
+        self._out = stdout if stdout is not None else claim_stdout()
+        self._write_lock = threading.Lock()
+        self._pending: queue.Queue = queue.Queue()
+        self._cancelled: set[int] = set()
+        self._cancel_lock = threading.Lock()
+
+    def send(self, request_id: int, header: dict, payload: bytes = b"") -> None:
+        with self._write_lock:
+            write_frame(self._out, request_id, header, payload)
+
+    def serve(self) -> None:
+        """Announce ``ready`` and process requests until shutdown or end of input."""
+        self.send(0, {"type": READY, **self.info})
+        threading.Thread(target=self._read_loop, daemon=True).start()
+        while True:
+            frame = self._pending.get()
+            if frame is None:
+                return
+            if frame.type == SHUTDOWN:
+                self.send(frame.request_id, {"type": RESULT})
+                return
+            self._run(frame)
+
+    def _read_loop(self) -> None:
+        try:
+            while True:
+                frame = read_frame(self._in)
+                if frame is None:
+                    break
+                if frame.type == PING:
+                    self.send(frame.request_id, {"type": PONG, **self.info})
+                elif frame.type == CANCEL:
+                    with self._cancel_lock:
+                        self._cancelled.add(frame.request_id)
+                else:
+                    self._pending.put(frame)
+        except ProtocolError as exc:
+            print(f"[worker] {exc}", file=sys.stderr, flush=True)
+        self._pending.put(None)
+
+    def _take_cancelled(self, request_id: int) -> bool:
+        with self._cancel_lock:
+            if request_id in self._cancelled:
+                self._cancelled.discard(request_id)
+                return True
+            return False
+
+    def _run(self, frame: Frame) -> None:
+        if self._take_cancelled(frame.request_id):
+            self.send(frame.request_id, {"type": CANCELLED})
+            return
+        if frame.type != TRANSCRIBE:
+            self.send(frame.request_id, {"type": ERROR, "error": f"unsupported: {frame.type}"})
+            return
+        try:
+            reply = {"type": RESULT, **self._handle(frame.header, audio_from_pcm(frame.payload))}
+        except Exception as exc:
+            reply = {"type": ERROR, "error": str(exc), "trace": traceback.format_exc()}
+        if self._take_cancelled(frame.request_id):
+            reply = {"type": CANCELLED}
+        self.send(frame.request_id, reply)
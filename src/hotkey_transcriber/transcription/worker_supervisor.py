@@ -0,0 +1,264 @@
+"""
+Worker Supervisor - Keeps an out-of-process inference worker alive: heartbeats, restarts, replay.
+
+Architecture:
+    ┌─────────────────────────────────────────┐
+    │  WorkerSupervisor(spawn)                │
+    │  ┌───────────────────────────────────┐  │
+    │  │  request(header, pcm, timeout)    │  │
+    │  │  → active WorkerClient            │  │
+    │  │  → worker died / request timed    │  │
+    │  │    out: restart, replay once      │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  heartbeat thread                 │  │
+    │  │  → ping every interval            │  │
+    │  │  → no pong in time: kill, restart │  │
+    │  └──────────────┬────────────────────┘  │
+    │  ┌──────────────▼────────────────────┐  │
+    │  │  restart                          │  │
+    │  │  → standby ready: promote it      │  │
+    │  │  → else spawn with backoff        │  │
+    │  │  → count restarts and downtime    │  │
+    │  └───────────────────────────────────┘  │
+    └─────────────────────────────────────────┘
+
+*spawn* starts a worker process and returns its WorkerClient once the
+worker reported ``ready``.  With *standby* a second worker is kept loaded,
+so a crash costs a pointer swap instead of a model load (at the price of
+the memory of a second model).  Workers answer pings on their reader
+thread, so a heartbeat only catches a frozen or dead process; a handler
+that hangs is caught by the request timeout.
+
+Usage:
+    from hotkey_transcriber.transcription.worker_supervisor import WorkerSupervisor
+
+    supervisor = WorkerSupervisor(spawn_worker, name="WSL", standby=False)
+    supervisor.start()
+    reply = supervisor.request({"type": "transcribe"}, pcm, timeout=300)
+    print(supervisor.stats())
+"""
+
+import contextlib
+import threading
+import time
+
+from hotkey_transcriber.transcription.worker_client import WorkerClient, WorkerClosedError
+from hotkey_transcriber.transcription.worker_protocol import PING, SHUTDOWN
+
+
+class WorkerSupervisor:
+    """Owns the active (and optional standby) worker of one backend."""
+
+    def __init__(
+        self,
+        spawn,
+        name: str = "worker",
+        heartbeat_interval_s: float = 5.0,
+        heartbeat_timeout_s: float = 15.0,
+        backoff_s: tuple[float, ...] = (1.0, 2.0, 5.0, 15.0, 30.0),
+        max_spawn_attempts: int = 5,
+        standby: bool = False,
+        sleep=time.sleep,
+        clock=time.monotonic,
+    ):
+        self._spawn = spawn
+        self._name = name
+        self._heartbeat_interval_s = heartbeat_interval_s
+        self._heartbeat_timeout_s = heartbeat_timeout_s
+        self._backoff_s = backoff_s
+        self._max_spawn_attempts = max_spawn_attempts
+        self._standby_enabled = standby
+        self._sleep = sleep
+        self._clock = clock
+
+        self._active: WorkerClient | None = None
+        self._standby: WorkerClient | None = None
+        self._restart_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._heartbeat_thread: threading.Thread | None = None
+        self._standby_thread: threading.Thread | None = None
+
+        self.restarts = 0
+        self.downtime_s = 0.0
+        self.last_error: str | None = None
+        self._down_since: float | None = None
+
+    # ------------------------------------------------------------------ #
+    # Lifecycle                                                            #
+    # ------------------------------------------------------------------ #
+
+    def start(self, client: WorkerClient | None = None) -> None:
+        """Adopt *client* or spawn the first worker (blocking); start heartbeats and the standby."""
+        self._active = client if client is not None else self._spawn()
+        if self._standby_enabled:
+            self._fill_standby()
+        if self._heartbeat_interval_s:
+            self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
+            self._heartbeat_thread.start()
+
+    def close(self) -> None:
+        self._closed.set()
+        with self._state_lock:
+            clients = [c for c in (self._active, self._standby) if c is not None]
+            self._active = self._standby = None
+        for client in clients:
+            with contextlib.suppress(Exception):
+                client.request({"type": SHUTDOWN}, timeout=5)
+            client.close()
+            client.kill()
+
+    # ------------------------------------------------------------------ #
+    # Requests                                                             #
+    # ------------------------------------------------------------------ #
+
+    def request(self, header: dict, payload: bytes = b"", timeout: float | None = None) -> dict:
+        """Send a request; if the worker dies or hangs meanwhile, restart it and replay once.
+
+        A request that outlives *timeout* counts as hung even if the worker
+        still answers pings: its reader thread pongs while the handler is stuck.
+        """
+        client = self._current()
+        try:
+            return client.request(header, payload, timeout=timeout)
+        except (WorkerClosedError, TimeoutError) as exc:
+            self._recover(client, exc)
+        print(f"[{self._name}] Wiederhole Anfrage nach Neustart.", flush=True)
+        client = self._current()
+        try:
+            return client.request(header, payload, timeout=timeout)
+        except TimeoutError:
+            client.kill()  # later requests must not queue behind the hung replay
+            raise
+
+    def _current(self) -> WorkerClient:
+        if self._closed.is_set():
+            raise WorkerClosedError(f"{self._name}: Worker wurde beendet.")
+        with self._state_lock:
+            client = self._active
+        if client is None or client.closed:
+            client = self._recover(client, WorkerClosedError("Worker nicht verfuegbar"))
+        return client
+
+    def _responds(self, client: WorkerClient) -> bool:
+        try:
+            client.request({"type": PING}, timeout=self._heartbeat_timeout_s)
+            return True
+        except (TimeoutError, WorkerClosedError):
+            return False
+
+    # ------------------------------------------------------------------ #
+    # Restart                                                              #
+    # ------------------------------------------------------------------ #
+
+    def _recover(self, failed: WorkerClient | None, error: Exception) -> WorkerClient:
+        """Replace *failed* by a fresh worker; concurrent callers share one restart."""
+        with self._restart_lock:
+            with self._state_lock:
+                if self._active is not None and self._active is not failed:
+                    return self._active  # someone else already restarted it
+                self._active = None
+                if self._down_since is None:
+                    self._down_since = self._clock()
+                self.last_error = str(error)
+            if failed is not None:
+                failed.kill()
+            print(f"[{self._name}] Worker ausgefallen ({error}), starte neu...", flush=True)
+
+            client = self._take_standby() or self._spawn_with_backoff()
+            with self._state_lock:
+                self._active = client
+                self.restarts += 1
+                self.downtime_s += self._clock() - self._down_since
+                self._down_since = None
+            print(f"[{self._name}] Worker neu gestartet ({self.restarts}. Neustart).", flush=True)
+
+        if self._standby_enabled:
+            self._fill_standby()
+        return client
+
+    def _spawn_with_backoff(self) -> WorkerClient:
+        last_exc: Exception | None = None
+        for attempt in range(self._max_spawn_attempts):
+            if self._closed.is_set():
+                break
+            try:
+                return self._spawn()
+            except Exception as exc:
+                last_exc = exc
+                delay = self._backoff_s[min(attempt, len(self._backoff_s) - 1)]
+                print(
+                    f"[{self._name}] Neustart fehlgeschlagen ({exc}), naechster Versuch in {delay:g}s.",
+                    flush=True,
+                )
+                self._sleep(delay)
+        raise WorkerClosedError(f"{self._name}: Neustart fehlgeschlagen ({last_exc}).")
+
+    def _take_standby(self) -> WorkerClient | None:
+        with self._state_lock:
+            standby, self._standby = self._standby, None
+        if standby is None or standby.closed:
+            return None
+        print(f"[{self._name}] Wechsle auf vorgeladenen Standby-Worker.", flush=True)
+        return standby
+
+    def _fill_standby(self) -> None:
+        """Load a standby worker in the background (no-op while one is ready or loading)."""
+        if self._standby_thread is not None and self._standby_thread.is_alive():
+            return
+        with self._state_lock:
+            if self._standby is not None and not self._standby.closed:
+                return
+
+        def _load():
+            try:
+                client = self._spawn()
+            except Exception as exc:
+                print(f"[{self._name}] Standby-Worker konnte nicht starten: {exc}", flush=True)
+                return
+            with self._state_lock:
+                if self._closed.is_set():
+                    client.kill()
+                    return
+                self._standby = client
+
+        self._standby_thread = threading.Thread(target=_load, daemon=True)
+        self._standby_thread.start()
+
+    def _heartbeat_loop(self) -> None:
+        while not self._closed.wait(self._heartbeat_interval_s):
+            with self._state_lock:
+                client = self._active
+            if client is None:
+                continue
+            if client.closed or not self._responds(client):
+                if self._closed.is_set():
+                    return
+                with contextlib.suppress(WorkerClosedError):
+                    self._recover(client, TimeoutError("keine Antwort auf Heartbeat"))
+
+    # ------------------------------------------------------------------ #
+    # Status                                                               #
+    # ------------------------------------------------------------------ #
+
+    def stats(self) -> dict:
+        """Snapshot for the tray: state, restart count, total downtime, standby, last error."""
+        with self._state_lock:
+            downtime = self.downtime_s
+            if self._down_since is not None:
+                downtime += self._clock() - self._down_since
+                state = "restarting"
+            elif self._closed.is_set():
+                state = "stopped"
+            else:
+                state = "running"
+            standby_ready = self._standby is not None and not self._standby.closed
+        return {
+            "name": self._name,
+            "state": state,
+            "restarts": self.restarts,
+            "downtime_s": round(downtime, 1),
+            "standby": standby_ready if self._standby_enabled else None,
+            "last_error": self.last_error,
+        }
@@ -1,17 +1,23 @@
 """
-WSL Whisper Bridge - Run Whisper with HIP/ROCm inside WSL from Windows via JSON-over-stdin/stdout IPC.
+WSL Whisper Bridge - Run Whisper with HIP/ROCm inside WSL from Windows via framed stdin/stdout IPC.
 
 Architecture:
     ┌─────────────────────────────────────────┐
     │  WslWhisperBridge                       │
     │  ┌───────────────────────────────────┐  │
     │  │  WslWhisperModel                  │  │
-    │  │  → writes server script to disk   │  │
+    │  │  → writes server script and       │  │
+    │  │    worker_protocol.py to disk     │  │
     │  │  → spawns wsl.exe python process  │  │
     │  └──────────────┬────────────────────┘  │
     │  ┌──────────────▼────────────────────┐  │
-    │  │  JSON IPC (stdin/stdout)          │  │
+    │  │  worker_protocol frames           │  │
     │  │  → ping / transcribe / shutdown   │  │
+    │  │  → PCM inline, no temp WAV        │  │
+    │  │  → WorkerClient: one reader,      │  │
+    │  │    replies by id, stderr → log    │  │
+    │  │  → WorkerSupervisor: heartbeat,   │  │
+    │  │    restart + replay, standby      │  │
     │  └──────────────┬────────────────────┘  │
     │  ┌──────────────▼────────────────────┐  │
     │  │  SERVER_SCRIPT (runs in WSL)      │  │
@@ -29,24 +35,28 @@ Usage:
 
 import atexit
 import contextlib
-import json
 import os
 import shlex
 import subprocess
-import tempfile
-import threading
-import wave
 from pathlib import Path
 
-import numpy as np
+from hotkey_transcriber.latency_tracker import mark_stage
+from hotkey_transcriber.transcription import worker_protocol
+from hotkey_transcriber.transcription.worker_client import WorkerClient
+from hotkey_transcriber.transcription.worker_protocol import (
+    READY,
+    RESULT,
+    TRANSCRIBE,
+    pcm_from_audio,
+)
+from hotkey_transcriber.transcription.worker_supervisor import WorkerSupervisor
 
 SERVER_SCRIPT = r"""
 import argparse
-import json
 import os
 import shutil
-import sys
 
+from worker_protocol import WorkerServer, claim_stdout
 from faster_whisper import WhisperModel, download_model
 from huggingface_hub.errors import LocalEntryNotFoundError
 from huggingface_hub.utils import HfHubHTTPError
@@ -69,11 +79,6 @@ def detect_device():
     return "cpu"
 
 
-def emit(payload):
-    sys.stdout.write(json.dumps(payload, ensure_ascii=False) + "\n")
-    sys.stdout.flush()
-
-
 def _snapshot_has_model_bin(model_path):
     return os.path.isfile(os.path.join(model_path, "model.bin"))
 
@@ -107,6 +112,8 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--model", required=True)
     args = parser.parse_args()
+    # Frames own stdout from here on; library output goes to stderr.
+    out = claim_stdout()
 
     model_path = _resolve_model_path(args.model)
 
@@ -122,36 +129,19 @@ def main():
             )
         model = WhisperModel(model_path, device=device, compute_type=compute_type, local_files_only=True)
 
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
-            continue
+    def handle(req, audio):
+        segs, _ = model.transcribe(
+            audio,
+            language=req.get("language"),
+            vad_filter=req.get("vad_filter", True),
+            beam_size=req.get("beam_size", 1),
+            best_of=req.get("best_of", 1),
+            temperature=req.get("temperature", 0),
+            condition_on_previous_text=req.get("condition_on_previous_text", False),
+        )
+        return {"segments": [s.text for s in segs]}
 
-        try:
-            req = json.loads(line)
-            cmd = req.get("cmd")
-            if cmd == "ping":
-                emit({"ok": True, "device": device, "compute_type": compute_type})
-                continue
-            if cmd == "shutdown":
-                emit({"ok": True})
-                return
-            if cmd != "transcribe":
-                emit({"ok": False, "error": "unsupported_cmd"})
-                continue
-
-            segs, _ = model.transcribe(
-                req["audio_path"],
-                language=req.get("language"),
-                vad_filter=req.get("vad_filter", True),
-                beam_size=req.get("beam_size", 1),
-                best_of=req.get("best_of", 1),
-                temperature=req.get("temperature", 0),
-                condition_on_previous_text=req.get("condition_on_previous_text", False),
-            )
-            emit({"ok": True, "segments": [s.text for s in segs]})
-        except Exception as exc:
-            emit({"ok": False, "error": str(exc)})
+    WorkerServer(handle, info={"device": device, "compute_type": compute_type}, stdout=out).serve()
 
 
 if __name__ == "__main__":
@@ -190,19 +180,26 @@ def _run_wsl(script: str) -> str:
 class WslWhisperModel:
     """Proxy model that transcribes audio via a faster-whisper server running in WSL."""
 
-    def __init__(self, model_name: str):
+    # The server transcribes one request at a time on a single GPU model.
+    max_concurrency = 1
+
+    def __init__(self, model_name: str, standby: bool = False):
         self.model_name = model_name
-        self._io_lock = threading.Lock()
-        self._server = None
+        self.supervisor: WorkerSupervisor | None = None
 
         local_appdata = os.environ.get("LOCALAPPDATA", str(Path.home()))
         self._work_dir = Path(local_appdata) / "hotkey-transcriber"
         self._work_dir.mkdir(parents=True, exist_ok=True)
         self._script_path = self._work_dir / "wsl_backend_server.py"
         self._script_path.write_text(SERVER_SCRIPT, encoding="utf-8")
+        # The server imports the shared protocol module from its own directory.
+        protocol_src = Path(worker_protocol.__file__).read_text(encoding="utf-8")
+        (self._work_dir / "worker_protocol.py").write_text(protocol_src, encoding="utf-8")
 
         self._ensure_wsl_backend(force=False)
-        self._start_server()
+        supervisor = WorkerSupervisor(self._spawn_worker, name="WSL", standby=standby)
+        supervisor.start()
+        self.supervisor = supervisor
         atexit.register(self.close)
 
     def _ensure_wsl_backend(self, force: bool = False) -> None:
@@ -221,7 +218,7 @@ class WslWhisperModel:
         _run_wsl(setup_cmd)
         marker.write_text("ok\n", encoding="utf-8")
 
-    def _start_server(self) -> None:
+    def _spawn_worker(self) -> WorkerClient:
         script_wsl = _win_to_wsl_path(str(self._script_path))
         script_arg = shlex.quote(script_wsl)
         model_arg = shlex.quote(self.model_name)
@@ -241,19 +238,23 @@ class WslWhisperModel:
             f"exec python3 -u {script_arg} --model {model_arg}"
         )
 
-        self._server = subprocess.Popen(
+        proc = subprocess.Popen(
             ["wsl.exe", "-e", "bash", "-lc", cmd],
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            bufsize=1,
+            bufsize=0,
         )
 
-        reply = self._request({"cmd": "ping"}, timeout=600)
-        if not reply.get("ok"):
+        client = WorkerClient(proc, name="WSL")
+        # The server announces "ready" (with its device) once the model is loaded.
+        try:
+            reply = client.wait_ready(timeout=600)
+        except Exception:
+            client.kill()
+            raise
+        if reply.get("type") != READY:
+            client.kill()
             raise RuntimeError(f"WSL-Backend konnte nicht gestartet werden: {reply}")
 
         device = reply.get("device", "cpu")
@@ -263,37 +264,12 @@ class WslWhisperModel:
             print(
                 "Hinweis: WSL-Backend laeuft ohne HIP-Beschleunigung (ctranslate2 ohne HIP-Support)."
             )
+        return client
 
-    def _request(self, payload: dict, timeout: int = 120) -> dict:
-        if not self._server or not self._server.stdin or not self._server.stdout:
+    def _request(self, header: dict, payload: bytes = b"", timeout: int = 120) -> dict:
+        if not self.supervisor:
             raise RuntimeError("WSL backend process is not running.")
-
-        line = json.dumps(payload, ensure_ascii=False)
-
-        with self._io_lock:
-            self._server.stdin.write(line + "\n")
-            self._server.stdin.flush()
-
-            done = threading.Event()
-            holder: dict = {"line": None}
-
-            def reader():
-                holder["line"] = self._server.stdout.readline()
-                done.set()
-
-            t = threading.Thread(target=reader, daemon=True)
-            t.start()
-            if not done.wait(timeout):
-                raise TimeoutError("WSL backend request timed out.")
-
-            raw = (holder["line"] or "").strip()
-            if not raw:
-                err = ""
-                if self._server.stderr:
-                    err = self._server.stderr.read()
-                raise RuntimeError(f"WSL backend closed unexpectedly. {err}")
-
-            return json.loads(raw)
+        return self.supervisor.request(header, payload, timeout=timeout)
 
     def transcribe(
         self,
@@ -305,50 +281,27 @@ class WslWhisperModel:
         temperature=0,
         condition_on_previous_text=False,
     ):
-        with tempfile.NamedTemporaryFile(
-            suffix=".wav",
-            prefix="ht_",
-            dir=self._work_dir,
-            delete=False,
-        ) as tmp:
-            wav_path = Path(tmp.name)
-
-        try:
-            arr = np.asarray(audio).reshape(-1)
-            arr = np.clip(arr, -1.0, 1.0)
-            pcm = (arr * 32767.0).astype(np.int16)
-
-            with wave.open(str(wav_path), "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(16000)
-                wf.writeframes(pcm.tobytes())
-
-            req = {
-                "cmd": "transcribe",
-                "audio_path": _win_to_wsl_path(str(wav_path)),
-                "language": language,
-                "vad_filter": vad_filter,
-                "beam_size": beam_size,
-                "best_of": best_of,
-                "temperature": temperature,
-                "condition_on_previous_text": condition_on_previous_text,
-            }
-            reply = self._request(req, timeout=300)
-            if not reply.get("ok"):
-                raise RuntimeError(reply.get("error", "WSL transcribe failed."))
-
-            segments = [_Segment(text=t) for t in reply.get("segments", [])]
-            return iter(segments), {}
-        finally:
-            with contextlib.suppress(OSError):
-                wav_path.unlink(missing_ok=True)
+        req = {
+            "type": TRANSCRIBE,
+            "language": language,
+            "vad_filter": vad_filter,
+            "beam_size": beam_size,
+            "best_of": best_of,
+            "temperature": temperature,
+            "condition_on_previous_text": condition_on_previous_text,
+        }
+        mark_stage("inference_start")
+        reply = self._request(req, pcm_from_audio(audio), timeout=300)
+        mark_stage("inference_end", overwrite=True)
+        if reply.get("type") != RESULT:
+            raise RuntimeError(reply.get("error", "WSL transcribe failed."))
+
+        segments = [_Segment(text=t) for t in reply.get("segments", [])]
+        return iter(segments), {}
 
     def close(self) -> None:
-        if not self._server:
+        supervisor, self.supervisor = self.supervisor, None
+        if supervisor is None:
             return
         with contextlib.suppress(Exception):
-            self._request({"cmd": "shutdown"}, timeout=5)
-        with contextlib.suppress(Exception):
-            self._server.terminate()
-        self._server = None
+            supervisor.close()
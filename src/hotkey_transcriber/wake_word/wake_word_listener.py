@@ -5,8 +5,8 @@ Architecture:
     ┌─────────────────────────────────────────┐
     │  WakeWordListener                       │
     │  ┌───────────────────────────────────┐  │
-    │  │  Audio stream (sounddevice)       │  │
-    │  │  → 16kHz float32 blocks → queue   │  │
+    │  │  AudioCaptureHub subscription     │  │
+    │  │  → 16kHz float32 1280-blocks → q  │  │
     │  └──────────────┬────────────────────┘  │
     │  ┌──────────────▼────────────────────┐  │
     │  │  _listen_loop (background thread) │  │
@@ -22,7 +22,7 @@ Architecture:
 Usage:
     from hotkey_transcriber.wake_word.wake_word_listener import WakeWordListener, list_available_wake_word_models
 
-    listener = WakeWordListener(callback=my_fn, model_name="hey jarvis")
+    listener = WakeWordListener(callback=my_fn, model_name="hey jarvis", capture_hub=hub)
     listener.start()
     # ... later ...
     listener.stop()
@@ -35,9 +35,8 @@ from pathlib import Path
 
 import numpy as np
 
-from hotkey_transcriber.speech_recorder import _import_sounddevice
-
-sd = _import_sounddevice()
+from hotkey_transcriber.audio.audio_capture_hub import AudioCaptureHub
+from hotkey_transcriber.audio.audio_source import AudioSource, PortAudioSource
 
 try:
     import openwakeword
@@ -54,6 +53,7 @@ _CUSTOM_WAKEWORD_DIRS = [
     Path(__file__).resolve().parent.parent / "resources" / "wakewords",
 ]
 _WAKE_WORD_COOLDOWN_SECONDS = 1.0
+_WAKE_WORD_BLOCKSIZE = 1280  # 80 ms, the frame size openwakeword expects
 
 
 def _normalize_model_name(name: str) -> str:
@@ -79,7 +79,13 @@ class WakeWordListener:
     """Stream microphone audio and fire a callback when a wake word is detected."""
 
     def __init__(
-        self, callback, model_name: str = "hey jarvis", threshold: float = 0.5, model_names=None
+        self,
+        callback,
+        model_name: str = "hey jarvis",
+        threshold: float = 0.5,
+        model_names=None,
+        capture_hub: AudioCaptureHub | None = None,
+        audio_source: AudioSource | None = None,
     ):
         self.callback = callback
         self.model_name = model_name
@@ -90,7 +96,12 @@ class WakeWordListener:
         self._running = False
         self._paused = False
         self._audio_q: queue.Queue = queue.Queue()
-        self._stream = None
+        # Shared with the SpeechRecorder so pause()/resume() only switch the
+        # subscription instead of closing and reopening the device.
+        self._capture_hub = capture_hub or AudioCaptureHub(
+            source=audio_source or PortAudioSource()
+        )
+        self._subscription = None
         self._listen_thread: threading.Thread | None = None
         self._model = None
         self._cooldown_until = 0.0
@@ -220,20 +231,16 @@ class WakeWordListener:
         self._listen_thread.start()
 
     def _open_stream(self) -> None:
-        self._stream = sd.InputStream(
-            samplerate=16000,
-            channels=1,
-            dtype="float32",
-            blocksize=1280,
-            callback=self._audio_callback,
+        if self._subscription is not None:
+            return
+        self._subscription = self._capture_hub.subscribe(
+            self._audio_callback, blocksize=_WAKE_WORD_BLOCKSIZE
         )
-        self._stream.start()
 
     def _close_stream(self) -> None:
-        if self._stream:
-            self._stream.stop()
-            self._stream.close()
-            self._stream = None
+        subscription, self._subscription = self._subscription, None
+        if subscription is not None:
+            self._capture_hub.unsubscribe(subscription)
 
     def stop(self) -> None:
         with self._lock:
@@ -250,12 +257,12 @@ class WakeWordListener:
             self._listen_thread.join(timeout=2.0)
 
     def pause(self) -> None:
-        """Pause listening and release the microphone."""
+        """Pause listening and hand the microphone over to other subscribers."""
         self._paused = True
         self._close_stream()
 
     def resume(self) -> None:
-        """Resume listening and re-open the microphone stream."""
+        """Resume listening on the shared microphone stream."""
         self._flush_queue()
         if self._model is not None:
             self._model.reset()
@@ -0,0 +1,157 @@
+"""Tests for audio/audio_capture_hub.py — fan-out, re-blocking, pre-roll and lifecycle."""
+
+import numpy as np
+
+from hotkey_transcriber.audio.audio_capture_hub import AudioCaptureHub
+from hotkey_transcriber.audio.audio_source import AudioSource
+
+
+class _FakeStream:
+    def __init__(self, callback, **kwargs):
+        self.callback = callback
+        self.kwargs = kwargs
+        self.started = False
+        self.closed = False
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.started = False
+
+    def close(self):
+        self.closed = True
+
+    def feed(self, samples):
+        block = np.asarray(samples, dtype=np.float32)[:, np.newaxis]
+        self.callback(block, len(block), None, None)
+
+
+class _Sink:
+    def __init__(self):
+        self.blocks = []
+
+    def __call__(self, indata, frames, time_info, status):
+        self.blocks.append(indata[:, 0].copy())
+
+    @property
+    def samples(self):
+        return np.concatenate(self.blocks) if self.blocks else np.zeros(0)
+
+
+class _FakeSource(AudioSource):
+    def __init__(self):
+        self.streams = []
+
+    def open_stream(self, **stream_kwargs):
+        stream = _FakeStream(**stream_kwargs)
+        self.streams.append(stream)
+        return stream
+
+
+def _make_hub(**kwargs):
+    source = _FakeSource()
+    return AudioCaptureHub(source=source, **kwargs), source.streams
+
+
+def test_first_subscriber_opens_single_stream():
+    hub, streams = _make_hub()
+
+    hub.subscribe(_Sink(), blocksize=1280)
+    hub.subscribe(_Sink(), blocksize=512)
+
+    assert len(streams) == 1
+    assert streams[0].started
+    assert hub.open_ms is not None
+
+
+def test_subscribers_receive_their_own_block_sizes():
+    hub, streams = _make_hub(blocksize=4)
+    wake_word, vad, raw = _Sink(), _Sink(), _Sink()
+    hub.subscribe(wake_word, blocksize=10)
+    hub.subscribe(vad, blocksize=4)
+    hub.subscribe(raw)
+
+    for start in range(0, 24, 4):
+        streams[0].feed(np.arange(start, start + 4))
+
+    assert [len(b) for b in wake_word.blocks] == [10, 10]
+    assert [len(b) for b in vad.blocks] == [4] * 6
+    np.testing.assert_array_equal(wake_word.samples, np.arange(20))
+    np.testing.assert_array_equal(vad.samples, np.arange(24))
+    np.testing.assert_array_equal(raw.samples, np.arange(24))
+
+
+def test_switching_subscribers_keeps_stream_open_without_gap():
+    hub, streams = _make_hub(blocksize=2)
+    wake_word, recorder = _Sink(), _Sink()
+    ww_sub = hub.subscribe(wake_word)
+    streams[0].feed([1, 2])
+
+    hub.unsubscribe(ww_sub)
+    hub.subscribe(recorder)
+    streams[0].feed([3, 4])
+
+    assert len(streams) == 1
+    assert not streams[0].closed
+    np.testing.assert_array_equal(wake_word.samples, [1, 2])
+    np.testing.assert_array_equal(recorder.samples, [3, 4])
+
+
+def test_preroll_is_replayed_before_live_audio():
+    hub, streams = _make_hub(preroll_ms=1, blocksize=4)  # 16 samples pre-roll
+    hub.subscribe(_Sink())
+    streams[0].feed(np.arange(20))
+    recorder = _Sink()
+
+    hub.subscribe(recorder, blocksize=4, preroll=True)
+    streams[0].feed([100, 101, 102, 103])
+
+    np.testing.assert_array_equal(
+        recorder.samples, np.concatenate([np.arange(4, 20), [100, 101, 102, 103]])
+    )
+
+
+def test_unsubscribe_with_clear_preroll_drops_buffered_audio():
+    hub, streams = _make_hub(preroll_ms=1, keep_open=True)
+    sub = hub.subscribe(_Sink())
+    streams[0].feed([1, 2, 3])
+
+    hub.unsubscribe(sub, clear_preroll=True)
+    late = _Sink()
+    hub.subscribe(late, preroll=True)
+
+    assert late.blocks == []
+
+
+def test_last_unsubscribe_closes_after_linger_unless_keep_open():
+    hub, streams = _make_hub(linger_s=0.05)
+    sub = hub.subscribe(_Sink())
+
+    hub.unsubscribe(sub)
+    timer = hub._linger_timer
+    assert not streams[0].closed
+    timer.join()
+
+    assert streams[0].closed
+    assert not hub.is_open
+
+    warm, warm_streams = _make_hub(linger_s=0.01, keep_open=True)
+    warm.unsubscribe(warm.subscribe(_Sink()))
+
+    assert warm._linger_timer is None
+    assert warm.is_open
+
+
+def test_failing_subscriber_does_not_starve_others():
+    hub, streams = _make_hub()
+
+    def _broken(*_args):
+        raise RuntimeError("boom")
+
+    good = _Sink()
+    hub.subscribe(_broken)
+    hub.subscribe(good)
+    streams[0].feed([1, 2])
+
+    np.testing.assert_array_equal(good.samples, [1, 2])
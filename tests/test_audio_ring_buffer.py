@@ -0,0 +1,85 @@
+"""Tests for audio/audio_ring_buffer.py — arena writes, growth, views and pre-roll ring."""
+
+import numpy as np
+
+from hotkey_transcriber.audio.audio_ring_buffer import AudioRingBuffer, PrerollBuffer
+
+
+def test_write_keeps_first_channel_only():
+    buf = AudioRingBuffer(initial_seconds=1)
+    block = np.array([[0.1, 9.0], [0.2, 9.0]], dtype=np.float32)
+
+    buf.write(block)
+
+    np.testing.assert_array_equal(buf.view(), np.array([0.1, 0.2], dtype=np.float32))
+
+
+def test_view_is_zero_copy():
+    buf = AudioRingBuffer(initial_seconds=1)
+    buf.write(np.ones((4, 1), dtype=np.float32))
+
+    first = buf.view()
+    second = buf.view()
+
+    assert np.shares_memory(first, second)
+
+
+def test_grows_beyond_initial_capacity_and_keeps_data():
+    buf = AudioRingBuffer(initial_seconds=0.001, sample_rate=16_000)  # 16 samples
+    data = np.arange(100, dtype=np.float32)
+
+    for i in range(0, 100, 7):
+        buf.write(data[i : i + 7])
+
+    assert len(buf) == 100
+    assert buf.capacity >= 100
+    np.testing.assert_array_equal(buf.view(), data)
+
+
+def test_view_taken_before_growth_stays_valid():
+    buf = AudioRingBuffer(initial_seconds=0.001, sample_rate=16_000)
+    buf.write(np.full(10, 0.5, dtype=np.float32))
+    early = buf.view()
+
+    buf.write(np.zeros(100, dtype=np.float32))
+
+    np.testing.assert_array_equal(early, np.full(10, 0.5, dtype=np.float32))
+
+
+def test_clear_resets_length_but_keeps_allocation():
+    buf = AudioRingBuffer(initial_seconds=1)
+    buf.write(np.ones(10, dtype=np.float32))
+    capacity = buf.capacity
+
+    buf.clear()
+
+    assert len(buf) == 0
+    assert buf.capacity == capacity
+    assert len(buf.view()) == 0
+
+
+def test_view_range_is_clamped():
+    buf = AudioRingBuffer(initial_seconds=1)
+    buf.write(np.arange(5, dtype=np.float32))
+
+    np.testing.assert_array_equal(buf.view(2, 100), np.array([2, 3, 4], dtype=np.float32))
+    assert len(buf.view(10)) == 0
+
+
+def test_preroll_keeps_most_recent_samples_in_order():
+    preroll = PrerollBuffer(capacity=5)
+
+    preroll.write(np.arange(3, dtype=np.float32))
+    preroll.write(np.arange(3, 7, dtype=np.float32))
+
+    np.testing.assert_array_equal(preroll.snapshot(), np.array([2, 3, 4, 5, 6], dtype=np.float32))
+
+
+def test_preroll_partial_fill_and_oversized_block():
+    preroll = PrerollBuffer(capacity=4)
+    preroll.write(np.array([1.0, 2.0], dtype=np.float32))
+    np.testing.assert_array_equal(preroll.snapshot(), np.array([1, 2], dtype=np.float32))
+
+    preroll.write(np.arange(10, dtype=np.float32)[:, np.newaxis])
+
+    np.testing.assert_array_equal(preroll.snapshot(), np.array([6, 7, 8, 9], dtype=np.float32))
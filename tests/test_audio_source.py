@@ -0,0 +1,135 @@
+"""Tests for audio/audio_source.py — file replay, synthetic input and lazy PortAudio."""
+
+import subprocess
+import sys
+import threading
+import wave
+
+import numpy as np
+
+from hotkey_transcriber.audio.audio_source import (
+    FileAudioSource,
+    PortAudioSource,
+    SyntheticAudioSource,
+    load_wav,
+)
+
+
+class _Sink:
+    def __init__(self):
+        self.blocks = []
+        self.lock = threading.Lock()
+
+    def __call__(self, indata, frames, time_info, status):
+        assert indata.shape == (frames, 1)
+        assert indata.dtype == np.float32
+        with self.lock:
+            self.blocks.append(indata[:, 0].copy())
+
+    @property
+    def samples(self):
+        with self.lock:
+            return np.concatenate(self.blocks) if self.blocks else np.zeros(0, np.float32)
+
+
+def _open(source, sink, blocksize=256):
+    stream = source.open_stream(
+        samplerate=16_000, channels=1, dtype="float32", blocksize=blocksize, callback=sink
+    )
+    stream.start()
+    return stream
+
+
+def test_file_source_replays_clips_in_order_as_fast_as_possible():
+    source = FileAudioSource(realtime=False)
+    sink = _Sink()
+    stream = _open(source, sink)
+
+    first = source.play(np.arange(300, dtype=np.float32))
+    second = source.play(np.full(100, -1.0, dtype=np.float32))
+    assert first.wait(1.0) and second.wait(1.0)
+    stream.stop()
+
+    samples = sink.samples
+    assert np.array_equal(samples[:256], np.arange(256, dtype=np.float32))
+    # Each block is padded, clips never share a block.
+    assert np.array_equal(samples[256:300], np.arange(256, 300, dtype=np.float32))
+    assert np.all(samples[300:512] == 0)
+    assert np.all(samples[512:612] == -1.0)
+
+
+def test_file_source_clip_queued_before_open_is_played():
+    source = FileAudioSource(realtime=False)
+    done = source.play(np.ones(512, dtype=np.float32))
+    sink = _Sink()
+    stream = _open(source, sink)
+
+    assert done.wait(1.0)
+    stream.stop()
+    assert len(sink.samples) == 512
+
+
+def test_file_source_idle_silence_keeps_delivering():
+    source = FileAudioSource(realtime=False, idle_silence=True)
+    sink = _Sink()
+    stream = _open(source, sink, blocksize=160)
+
+    threading.Event().wait(0.05)
+    stream.stop()
+
+    assert len(sink.samples) >= 160
+    assert np.all(sink.samples == 0)
+
+
+def test_synthetic_source_stops_after_duration():
+    source = SyntheticAudioSource("tone", realtime=False, duration_s=0.1)
+    sink = _Sink()
+    stream = _open(source, sink)
+
+    assert source.finished.wait(1.0)
+    stream.stop()
+
+    samples = sink.samples
+    assert len(samples) == 1792  # 1600 samples, last block zero padded
+    assert np.max(np.abs(samples[:1600])) > 0.25
+
+
+def test_synthetic_source_accepts_callable():
+    source = SyntheticAudioSource(
+        lambda n, offset: np.full(n, offset, np.float32), realtime=False, duration_s=0.032
+    )
+    sink = _Sink()
+    stream = _open(source, sink)
+    assert source.finished.wait(1.0)
+    stream.stop()
+
+    assert sink.samples[0] == 0 and sink.samples[256] == 256
+
+
+def test_load_wav_downmixes_and_resamples(tmp_path):
+    stereo = np.tile(np.array([0.5, -0.5], dtype=np.float32), 8000)
+    with wave.open(str(tmp_path / "a.wav"), "wb") as wf:
+        wf.setnchannels(2)
+        wf.setsampwidth(2)
+        wf.setframerate(8000)
+        wf.writeframes((stereo * 32767).astype(np.int16).tobytes())
+
+    audio = load_wav(tmp_path / "a.wav")
+
+    assert audio.dtype == np.float32
+    assert len(audio) == 16_000
+    assert np.allclose(audio, 0.0, atol=1e-3)
+
+
+def test_recorder_import_does_not_load_sounddevice():
+    code = (
+        "import sys; import hotkey_transcriber.speech_recorder; "
+        "import hotkey_transcriber.audio.audio_source as s; s.PortAudioSource(); "
+        "print('sounddevice' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert out.strip().splitlines()[-1] == "False"
+    assert PortAudioSource().device is None
@@ -0,0 +1,40 @@
+"""Tests for tools/dictation_benchmark.py — keyboard stub, stand-in backend and report."""
+
+import numpy as np
+
+from tools.dictation_benchmark import RecordingKeyboard, StandInServerModel, summarize
+
+
+def test_recording_keyboard_keeps_text_after_last_erase():
+    keyboard = RecordingKeyboard()
+    keyboard.write("REC")
+    keyboard.backspace(3)
+    keyboard.paste("📝")
+    keyboard.write(".")
+    keyboard.backspace(2)
+    keyboard.paste("hallo welt")
+    keyboard.write(" ")
+
+    assert keyboard.transcript() == "hallo welt"
+
+
+def test_stand_in_server_returns_one_segment():
+    model = StandInServerModel(overhead_s=0.0, rtf=0.0)
+
+    segments, info = model.transcribe(np.zeros(16_000, dtype=np.float32), language="de")
+
+    assert [s.text for s in segments] == ["1.0s"]  # all samples survive the framed round trip
+    assert info["language"] == "de"
+
+
+def test_summarize_reports_percentiles_and_mean_rtf():
+    runs = [
+        {"audio_s": 2.0, "time_to_text_ms": float(ms), "rtf": 0.1} for ms in (100, 200, 300, 400)
+    ]
+
+    summary = summarize(runs)
+
+    assert summary["runs"] == 4
+    assert summary["rtf_mean"] == 0.1
+    assert summary["time_to_text_p50_ms"] == 200.0
+    assert summary["time_to_text_p95_ms"] == 400.0
@@ -0,0 +1,108 @@
+"""Tests for keyboard/focus_tracker.py — cached focus from AT-SPI events and the query fallback."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from hotkey_transcriber.keyboard.focus_tracker import FocusTracker
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def queries():
+    return []
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+def _tracker(queries, clock, answer="kitty"):
+    def query():
+        queries.append(clock.now)
+        return answer
+
+    tracker = FocusTracker(query=query, heartbeat_s=5.0, clock=clock)
+    tracker._beat()  # as if the AT-SPI listener were running
+    return tracker
+
+
+def test_events_answer_lookups_without_querying(queries, clock):
+    tracker = _tracker(queries, clock)
+
+    tracker.on_activate("gnome-terminal-server")
+    assert tracker.is_terminal()
+    tracker.on_activate("firefox")
+    assert not tracker.is_terminal()
+    assert tracker.focused_app() == "firefox"
+
+    assert queries == []
+
+
+def test_deactivate_clears_only_the_app_that_lost_focus(queries, clock):
+    tracker = _tracker(queries, clock)
+
+    tracker.on_activate("konsole")
+    tracker.on_deactivate("firefox")  # late event of the previous window
+    assert tracker.focused_app() == "konsole"
+    tracker.on_deactivate("konsole")
+    assert tracker.focused_app() is None
+
+    assert queries == []
+
+
+def test_cache_stays_valid_while_the_listener_beats(queries, clock):
+    tracker = _tracker(queries, clock)
+    tracker.on_activate("firefox")
+
+    for minute in range(1, 11):  # ten minutes in one window, no focus events
+        clock.now = minute * 60.0
+        tracker._beat()
+        assert tracker.focused_app() == "firefox"
+
+    assert queries == []
+
+
+def test_missed_heartbeats_fall_back_to_a_direct_query(queries, clock):
+    tracker = _tracker(queries, clock)
+    tracker.on_activate("firefox")
+
+    clock.now = 14.0
+    assert not tracker.is_terminal()
+    clock.now = 15.0  # three heartbeats missed: the listener loop is stuck
+    assert tracker.is_terminal()  # the query answers "kitty"
+
+    assert queries == [15.0]
+
+
+def test_every_lookup_queries_without_a_listener(queries, clock):
+    tracker = _tracker(queries, clock)
+    tracker._heartbeat_at = None
+
+    tracker.on_activate("firefox")
+    assert tracker.focused_app() == "kitty"
+    assert tracker.focused_app() == "kitty"
+
+    assert queries == [0.0, 0.0]
+
+
+def test_atspi_events_are_mapped_to_the_source_application(queries, clock):
+    tracker = _tracker(queries, clock)
+
+    def event(type_, app_name):
+        app = SimpleNamespace(get_name=lambda: app_name)
+        return SimpleNamespace(type=type_, source=SimpleNamespace(get_application=lambda: app))
+
+    tracker._on_event(event("window:activate", "alacritty"))
+    assert tracker.is_terminal()
+    tracker._on_event(event("window:deactivate", "alacritty"))
+    assert not tracker.is_terminal()
+    assert queries == []
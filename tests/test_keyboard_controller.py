@@ -0,0 +1,268 @@
+"""Tests for keyboard/keyboard_controller.py — the uinput backend and how text is routed to it."""
+
+import os
+import sys
+import types
+
+import pytest
+
+from hotkey_transcriber.keyboard import keyboard_controller
+from hotkey_transcriber.keyboard.keyboard_controller import KeyboardController, _UinputBackend
+from hotkey_transcriber.keyboard.keyboard_layout import KeyboardLayout
+from hotkey_transcriber.keyboard.ydotool_socket import qwerty_key_events
+
+CTRL, SHIFT, U, V, Y, Z = 29, 42, 22, 47, 21, 44
+
+
+class _FakeUInput:
+    """Stands in for evdev.UInput; records (code, value) and checks the SYN after each event."""
+
+    def __init__(self):
+        self.events = []
+        self._unsynced = False
+
+    def write(self, type_, code, value):
+        assert type_ == 1 and not self._unsynced
+        self.events.append((code, value))
+        self._unsynced = True
+
+    def syn(self):
+        self._unsynced = False
+
+    def close(self):
+        pass
+
+
+def _layout(name):
+    layout = KeyboardLayout(cache_file=os.devnull)
+    layout.layout = name
+    return layout
+
+
+@pytest.fixture(autouse=True)
+def _no_host_lookups(monkeypatch):
+    # evdev is only needed for ecodes.EV_KEY; the layout watcher would shell out.
+    ecodes = types.SimpleNamespace(EV_KEY=1)
+    monkeypatch.setitem(sys.modules, "evdev", types.SimpleNamespace(ecodes=ecodes))
+    monkeypatch.setattr(keyboard_controller, "get_keyboard_layout", lambda: _layout("us"))
+    monkeypatch.setattr(keyboard_controller, "is_terminal_focused", lambda: False)
+    monkeypatch.setattr(keyboard_controller, "get_focus_tracker", lambda: None)
+
+
+def _backend(**kwargs):
+    device = _FakeUInput()
+    return _UinputBackend(device=device, **kwargs), device
+
+
+def test_uinput_sends_hotkeys_and_text_as_key_events():
+    backend, device = _backend(unicode_input=False)
+
+    backend.hotkey("ctrl", "v")
+    backend.write("Hi 2.")
+
+    assert device.events == [(CTRL, 1), (V, 1), (V, 0), (CTRL, 0)] + qwerty_key_events("Hi 2.")
+
+
+def test_uinput_swaps_y_and_z_on_qwertz(monkeypatch):
+    monkeypatch.setattr(keyboard_controller, "get_keyboard_layout", lambda: _layout("de"))
+    backend, device = _backend(unicode_input=False)
+
+    backend.write("zy")
+    backend.hotkey("ctrl", "z")
+
+    assert device.events == [(Y, 1), (Y, 0), (Z, 1), (Z, 0), (CTRL, 1), (Y, 1), (Y, 0), (CTRL, 0)]
+
+
+def test_uinput_enters_other_characters_via_ibus_unicode_input():
+    backend, device = _backend(unicode_input=True)
+
+    backend.write("ü")
+
+    ctrl_shift_u = [(CTRL, 1), (SHIFT, 1), (U, 1), (U, 0), (SHIFT, 0), (CTRL, 0)]
+    assert device.events == ctrl_shift_u + qwerty_key_events("fc ")
+
+
+def test_uinput_refuses_layout_dependent_characters_without_ibus():
+    backend, _ = _backend(unicode_input=False)
+
+    assert backend.can_type("Hallo Welt, 42.")
+    assert not backend.can_type("Grüße")
+    assert not backend.can_type("a-b")
+    with pytest.raises(ValueError):
+        backend.write("ü")
+
+
+def test_uinput_does_not_use_ibus_unicode_input_by_default():
+    backend, _ = _backend()
+
+    assert not backend.can_type("📝")
+
+
+@pytest.mark.parametrize("name", ["fr", "us(dvorak)", "de+neo", "cz", "hu"])
+def test_uinput_types_only_whitespace_on_unverified_layouts(monkeypatch, name):
+    monkeypatch.setattr(keyboard_controller, "get_keyboard_layout", lambda: _layout(name))
+    backend, _ = _backend(unicode_input=True)
+
+    assert backend.can_type(" \n")
+    assert not backend.can_type("Hallo 42.")
+    with pytest.raises(ValueError):
+        backend.write("a")
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    backend, device = _backend(unicode_input=False)
+    monkeypatch.setattr(
+        keyboard_controller, "_load_input_backend", lambda **kwargs: ("uinput", backend, None)
+    )
+    clipboard = []
+    monkeypatch.setattr(keyboard_controller.pyperclip, "copy", clipboard.append)
+    keyb = KeyboardController(wait=0)
+    keyb.device, keyb.clipboard = device, clipboard
+    return keyb
+
+
+def test_short_text_is_typed_without_the_clipboard(controller):
+    controller.paste("Hallo Welt.")
+
+    assert controller.clipboard == []
+    assert controller.device.events == qwerty_key_events("Hallo Welt.")
+
+
+def test_long_or_untypeable_text_is_pasted(controller):
+    long_text = "a" * (keyboard_controller._MAX_TYPED_CHARS + 1)
+
+    controller.paste(long_text)
+    controller.write("📝")
+
+    assert controller.clipboard == [long_text, "📝"]
+    ctrl_v = [(CTRL, 1), (V, 1), (V, 0), (CTRL, 0)]
+    assert controller.device.events == ctrl_v * 2
+
+
+def test_text_is_pasted_when_the_layout_switches_to_azerty(controller):
+    controller.backend._layout.layout = "fr"
+
+    controller.paste("Hallo Welt.")
+
+    assert controller.clipboard == ["Hallo Welt."]
+    assert controller.device.events == [(CTRL, 1), (V, 1), (V, 0), (CTRL, 0)]
+
+
+def test_terminal_gets_ctrl_shift_v(controller, monkeypatch):
+    monkeypatch.setattr(keyboard_controller, "is_terminal_focused", lambda: True)
+
+    controller.paste("Grüße")
+
+    assert controller.device.events[:3] == [(CTRL, 1), (SHIFT, 1), (V, 1)]
+
+
+@pytest.fixture
+def timeline(controller, monkeypatch):
+    """Key batches and sleeps in the order they happen."""
+    sent = []
+    send_keys = controller.backend.send_keys
+
+    def record(events, interval=0):
+        sent.append(("keys", events))
+        send_keys(events)
+
+    monkeypatch.setattr(controller.backend, "send_keys", record)
+    monkeypatch.setattr(keyboard_controller.time, "sleep", lambda s: sent.append(("sleep", s)))
+    controller.wait = 0.05
+    return sent
+
+
+def test_transaction_sends_one_batch_with_one_settle_delay(controller, timeline):
+    with controller.transaction() as keys:
+        keys.paste("Hallo Welt")
+        keys.write(" ", end="")
+        keys.press("enter")
+        assert timeline == []  # nothing is sent before the block ends
+
+    assert timeline == [
+        ("keys", qwerty_key_events("Hallo Welt ") + [(28, 1), (28, 0)]),
+        ("sleep", 0.05),
+    ]
+    assert controller.clipboard == []
+
+
+def test_transaction_waits_after_a_clipboard_paste_before_further_keys(controller, timeline):
+    long_text = "a" * (keyboard_controller._MAX_TYPED_CHARS + 1)
+
+    with controller.transaction() as keys:
+        keys.backspace(2)
+        keys.paste(long_text)
+        keys.write(" ", end="")
+        keys.press("enter")
+
+    ctrl_v = [(CTRL, 1), (V, 1), (V, 0), (CTRL, 0)]
+    assert timeline == [
+        ("sleep", 0.05),  # clipboard owner settles
+        ("keys", [(14, 1), (14, 0)] * 2 + ctrl_v),
+        ("sleep", 0.05),  # the app reads the clipboard before the space and Enter arrive
+        ("keys", qwerty_key_events(" ") + [(28, 1), (28, 0)]),
+        ("sleep", 0.05),
+    ]
+    assert controller.clipboard == [long_text]
+
+
+def test_transaction_splits_batches_when_the_clipboard_changes(controller, timeline):
+    with controller.transaction() as keys:
+        keys.paste("Grüße")
+        keys.paste("Tschüss")
+
+    ctrl_v = [(CTRL, 1), (V, 1), (V, 0), (CTRL, 0)]
+    assert timeline == [("sleep", 0.05), ("keys", ctrl_v), ("sleep", 0.05)] * 2
+    assert controller.clipboard == ["Grüße", "Tschüss"]
+
+
+def test_transaction_sends_nothing_when_the_block_raises(controller, timeline):
+    with pytest.raises(RuntimeError), controller.transaction() as keys:
+        keys.paste("hallo")
+        raise RuntimeError("abgebrochen")
+
+    assert timeline == []
+
+
+def test_transaction_holds_the_lock_while_sending(controller):
+    seen_locked = []
+    write = controller.device.write
+
+    def write_and_check(type_, code, value):
+        seen_locked.append(controller.lock.locked())
+        write(type_, code, value)
+
+    controller.device.write = write_and_check
+    with controller.transaction() as keys:
+        keys.write("ok")
+
+    assert seen_locked and all(seen_locked)
+
+
+def test_transaction_runs_operations_in_order_on_other_backends(monkeypatch):
+    calls = []
+    pyautogui = types.SimpleNamespace(
+        press=lambda key, presses=1, interval=0: calls.append(("press", key, presses)),
+        write=lambda text, interval=0: calls.append(("write", text)),
+        keyUp=lambda key: None,
+        hotkey=lambda *keys: calls.append(("hotkey", *keys)),
+    )
+    monkeypatch.setattr(
+        keyboard_controller, "_load_input_backend", lambda **kwargs: ("pyautogui", pyautogui, None)
+    )
+    monkeypatch.setattr(keyboard_controller.pyperclip, "copy", lambda text: None)
+    keyb = KeyboardController(wait=0)
+
+    with keyb.transaction() as keys:
+        keys.backspace(3)
+        keys.paste("hallo")
+        keys.write(" ")
+        keys.press("enter")
+
+    assert calls == [
+        ("press", "backspace", 3),
+        ("hotkey", "ctrl", "v"),
+        ("write", " "),
+        ("press", "enter", 1),
+    ]
@@ -0,0 +1,114 @@
+"""Tests for keyboard/keyboard_layout.py — layout parsing, the disk cache and live switches."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from hotkey_transcriber.keyboard import keyboard_controller, keyboard_layout
+from hotkey_transcriber.keyboard.keyboard_layout import (
+    KeyboardLayout,
+    detect_layout,
+    is_qwertz,
+    parse_input_sources,
+)
+from hotkey_transcriber.keyboard.ydotool_socket import qwerty_key_events
+
+
+def test_parse_gsettings_input_sources():
+    value = "[('xkb', 'ch+de_nodeadkeys'), ('ibus', 'anthy'), ('xkb', 'us')]\n"
+
+    assert parse_input_sources(value) == ["ch+de_nodeadkeys", "us"]
+    assert parse_input_sources("@a(ss) []") == []
+    assert parse_input_sources("No such schema “org.gnome.desktop.input-sources”") == []
+
+
+@pytest.mark.parametrize(
+    ("layout", "expected"),
+    [
+        ("de", True),
+        ("ch+de_nodeadkeys", True),
+        ("de(nodeadkeys)", True),
+        ("us", False),
+        ("us+altgr-intl", False),
+        ("dvorak", False),
+    ],
+)
+def test_qwertz_layouts(layout, expected):
+    assert is_qwertz(layout) is expected
+
+
+def test_most_recently_used_source_wins(monkeypatch):
+    answers = {
+        "mru-sources": "[('xkb', 'us'), ('xkb', 'de')]",
+        "sources": "[('xkb', 'de'), ('xkb', 'us')]",
+    }
+    monkeypatch.setattr(keyboard_layout, "_run", lambda args: answers.get(args[-1], ""))
+
+    assert detect_layout() == "us"
+
+
+def test_localectl_is_the_fallback(monkeypatch):
+    answers = {"status": "   System Locale: LANG=de_CH.UTF-8\n       X11 Layout: ch,us\n"}
+    monkeypatch.setattr(keyboard_layout, "_run", lambda args: answers.get(args[-1], ""))
+
+    assert detect_layout() == "ch"
+
+
+def test_cached_value_is_used_until_detection_ran(tmp_path):
+    cache = tmp_path / "keyboard_layout.json"
+    cache.write_text(json.dumps({"layout": "de"}), encoding="utf-8")
+    detections = []
+
+    layout = KeyboardLayout(detect=lambda: detections.append(1) or "us", cache_file=str(cache))
+
+    assert layout.yz_swap is True and detections == []
+    assert layout.refresh() == "us"
+    assert layout.yz_swap is False
+    assert json.loads(cache.read_text(encoding="utf-8")) == {"layout": "us"}
+
+
+def test_missing_or_broken_cache_means_unknown_layout(tmp_path):
+    broken = tmp_path / "broken.json"
+    broken.write_text("{", encoding="utf-8")
+
+    for cache in (tmp_path / "missing.json", broken):
+        layout = KeyboardLayout(cache_file=str(cache))
+        assert layout.layout is None
+        assert not layout.yz_swap and not layout.typing_verified
+
+
+@pytest.mark.parametrize(
+    ("name", "verified"),
+    [
+        ("us", True),
+        ("de(nodeadkeys)", True),
+        ("ch+fr", True),
+        ("at", True),
+        ("us(dvorak)", False),
+        ("us+colemak", False),
+        ("de+neo", False),
+        ("fr", False),
+        ("cz", False),
+        ("hu", False),
+        (None, False),
+    ],
+)
+def test_typing_is_verified_only_for_known_key_tables(name, verified):
+    layout = KeyboardLayout(cache_file="/nonexistent/keyboard_layout.json")
+    layout.layout = name
+
+    assert layout.typing_verified is verified
+
+
+def test_switching_the_layout_takes_effect_on_the_next_keystroke(tmp_path, monkeypatch):
+    state = SimpleNamespace(name="us")
+    layout = KeyboardLayout(detect=lambda: state.name, cache_file=str(tmp_path / "l.json"))
+    monkeypatch.setattr(keyboard_controller, "get_keyboard_layout", lambda: layout)
+    monkeypatch.setattr(keyboard_controller, "_connect_ydotool_socket", lambda: None)
+    backend = keyboard_controller._YdotoolBackend(None)
+
+    assert backend.text_events("z") == qwerty_key_events("z")
+    state.name = "de"
+    layout.refresh()  # what the watcher does on "mru-sources: ..."
+    assert backend.text_events("z") == qwerty_key_events("y")
@@ -0,0 +1,86 @@
+"""Tests for latency_tracker.py — stage marks, JSON record and rolling percentiles."""
+
+import json
+
+from hotkey_transcriber.latency_tracker import DictationTrace, LatencyStats, LatencyTracker
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_first_mark_wins_unless_overwritten():
+    clock = _Clock()
+    trace = DictationTrace(clock=clock)
+    trace.mark("model_start")
+    trace.mark("model_end")
+    clock.now += 1.0
+    trace.mark("model_start")
+    trace.mark("model_end", overwrite=True)
+
+    assert trace.marks["model_start"] == 100.0
+    assert trace.marks["model_end"] == 101.0
+
+
+def test_record_is_relative_to_key_down_and_has_spans():
+    clock = _Clock()
+    trace = DictationTrace(mode="ptt", clock=clock)
+    for stage, t in [
+        ("key_down", 0.0),
+        ("stream_started", 0.005),
+        ("key_up", 2.0),
+        ("model_start", 2.01),
+        ("model_end", 2.51),
+        ("paste_done", 2.6),
+    ]:
+        clock.now = 100.0 + t
+        trace.mark(stage)
+
+    record = trace.to_record()
+
+    assert record["mode"] == "ptt"
+    assert record["stages_ms"]["key_up"] == 2000.0
+    assert record["spans_ms"]["stream_open"] == 5.0
+    assert record["spans_ms"]["model"] == 500.0
+    assert record["spans_ms"]["key_up_to_text"] == 600.0
+    assert "clipboard" not in record["spans_ms"]
+
+
+def test_tracker_emits_one_json_line_per_dictation():
+    lines = []
+    tracker = LatencyTracker(emit=lines.append)
+    tracker.begin(mode="auto")
+    tracker.mark("key_up")
+    tracker.active.info["audio_ms"] = 1234
+    tracker.finish()
+
+    assert len(lines) == 1
+    assert lines[0].startswith("[latency] ")
+    record = json.loads(lines[0][len("[latency] ") :])
+    assert record["mode"] == "auto"
+    assert record["audio_ms"] == 1234
+    assert tracker.active is None
+
+
+def test_marks_without_active_trace_are_ignored():
+    tracker = LatencyTracker(emit=None)
+
+    tracker.mark("key_up")
+
+    assert tracker.finish() is None
+
+
+def test_rolling_percentiles_use_last_window():
+    stats = LatencyStats(window=20)
+    for value in range(1, 101):
+        stats.add({"model": float(value)})
+
+    p50, p95 = stats.percentiles("model")
+
+    assert (p50, p95) == (90.0, 99.0)
+    assert stats.summary()["model"] == {"p50": 90.0, "p95": 99.0}
+    assert stats.percentiles("paste") is None
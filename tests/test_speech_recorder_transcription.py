@@ -0,0 +1,232 @@
+"""Tests for the transcription stage of SpeechRecorder (VAD reuse, pre-check, trimming)."""
+
+import contextlib
+import threading
+import time
+
+import numpy as np
+
+from hotkey_transcriber.audio.audio_ring_buffer import AudioRingBuffer
+from hotkey_transcriber.audio.speech_timeline import SpeechTimeline
+from hotkey_transcriber.speech_recorder import SpeechRecorder
+
+_FRAME = 512
+
+
+class _Segment:
+    def __init__(self, text):
+        self.text = text
+
+
+class _ModelStub:
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append((np.array(audio), kwargs))
+        return iter([_Segment(" hallo ")]), None
+
+
+def _build_recorder():
+    recorder = SpeechRecorder.__new__(SpeechRecorder)
+    recorder.model = _ModelStub()
+    recorder.language = "de"
+    recorder.beam_size = 1
+    recorder.best_of = 1
+    recorder.temperature = 0.0
+    recorder.trim_padding_ms = 200
+    recorder.last_trimmed_samples = 0
+    return recorder
+
+
+def _audio(n_frames):
+    return np.arange(n_frames * _FRAME, dtype=np.float32)
+
+
+def test_without_timeline_model_runs_its_own_vad():
+    recorder = _build_recorder()
+
+    text = recorder._transcribe_recording(_audio(4), None)
+
+    assert text == "hallo"
+    audio, kwargs = recorder.model.calls[0]
+    assert len(audio) == 4 * _FRAME
+    assert kwargs["vad_filter"] is True
+
+
+def test_timeline_spans_are_cut_out_and_model_vad_is_disabled():
+    recorder = _build_recorder()
+    flags = [False] * 100 + [True] * 10 + [False] * 100
+    audio = _audio(len(flags))
+
+    recorder._transcribe_recording(audio, SpeechTimeline(flags))
+
+    passed, kwargs = recorder.model.calls[0]
+    assert kwargs["vad_filter"] is False
+    start, end = SpeechTimeline(flags).speech_spans(len(audio), edge_pad_ms=200)[0]
+    assert np.array_equal(passed, audio[start:end])
+    assert len(passed) < len(audio)
+
+
+def test_leading_and_trailing_silence_is_trimmed_to_padding():
+    recorder = _build_recorder()
+    flags = [False] * 100 + [True] * 10 + [False] * 100
+    audio = _audio(len(flags))
+
+    recorder._transcribe_recording(audio, SpeechTimeline(flags))
+
+    passed, _ = recorder.model.calls[0]
+    pad = 16_000 * 200 // 1000
+    assert len(passed) == 10 * _FRAME + 2 * pad
+    assert passed[0] == audio[100 * _FRAME - pad]
+    assert recorder.last_trimmed_samples == len(audio) - len(passed)
+
+
+def test_long_pause_between_speech_is_removed_but_padded():
+    recorder = _build_recorder()
+    flags = [True] * 10 + [False] * 200 + [True] * 10
+    audio = _audio(len(flags))
+
+    recorder._transcribe_recording(audio, SpeechTimeline(flags))
+
+    passed, _ = recorder.model.calls[0]
+    inner_pad = 16_000 * 400 // 1000
+    assert len(passed) == 20 * _FRAME + 2 * inner_pad
+
+
+def test_timeline_without_speech_skips_model():
+    recorder = _build_recorder()
+
+    text = recorder._transcribe_recording(_audio(10), SpeechTimeline([False] * 10))
+
+    assert text == ""
+    assert recorder.model.calls == []
+
+
+class _FlagsVAD:
+    def __init__(self, flags):
+        self.flags = flags
+
+    def speech_flags(self, audio):
+        return np.array(self.flags, dtype=bool)
+
+
+class _KeyboardStub:
+    backend_name = "pyautogui"
+
+    def __init__(self):
+        self.pasted = []
+        self.clipboard_restored = 0
+
+    def paste(self, text, end=""):
+        if text != "📝":
+            self.pasted.append(text)
+
+    def backspace(self, count):
+        pass
+
+    def write(self, text, end="", interval=0):
+        pass
+
+    def load_clipboard(self):
+        self.clipboard_restored += 1
+
+    @contextlib.contextmanager
+    def transaction(self):
+        yield self
+
+    def press(self, key, presses=1):
+        pass
+
+
+def _build_pipeline(flags, **kwargs):
+    recorder = _build_recorder()
+    recorder.keyb_c = _KeyboardStub()
+    recorder._vad = _FlagsVAD(flags)
+    recorder._audio_buf = AudioRingBuffer(initial_seconds=1)
+    recorder._audio_buf.write(_audio(len(flags)))
+    recorder._active_streamer = None
+    recorder._speech_timeline = None
+    recorder.min_speech_ms = kwargs.get("min_speech_ms", 250)
+    recorder.min_speech_ratio = kwargs.get("min_speech_ratio", 0.01)
+    recorder.spoken_text_action_executor = None
+    recorder.spoken_enter_enabled = False
+    recorder.spoken_undo_enabled = False
+    recorder.finished = 0
+
+    def _finished():
+        recorder.finished += 1
+
+    recorder.on_transcription_finished = _finished
+    return recorder
+
+
+def test_take_without_speech_skips_model_and_restores_clipboard():
+    recorder = _build_pipeline([False] * 60 + [True] * 2 + [False] * 60)
+
+    recorder._transcribe_and_paste()
+
+    assert recorder.model.calls == []
+    assert recorder.keyb_c.pasted == []
+    assert recorder.keyb_c.clipboard_restored == 1
+    assert recorder.finished == 1
+
+
+def test_take_with_speech_is_transcribed_without_model_vad():
+    recorder = _build_pipeline([False] * 20 + [True] * 30 + [False] * 20)
+
+    recorder._transcribe_and_paste()
+
+    assert len(recorder.model.calls) == 1
+    assert recorder.model.calls[0][1]["vad_filter"] is False
+    assert recorder.keyb_c.pasted == ["hallo"]
+    assert recorder.finished == 1
+
+
+class _ConcurrentModelStub(_ModelStub):
+    max_concurrency = 4
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def transcribe(self, audio, **kwargs):
+        with self.lock:
+            self.calls.append((np.array(audio), kwargs))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        # First sample identifies the segment, so the join order is checkable.
+        return iter([_Segment(f"s{int(audio[0])}")]), None
+
+
+def test_long_recording_is_split_and_joined_in_order():
+    recorder = _build_recorder()
+    recorder.model = _ConcurrentModelStub()
+    # Three ~20 s speech blocks separated by 3 s pauses.
+    block, pause = [True] * 625, [False] * 94
+    flags = block + pause + block + pause + block
+    audio = _audio(len(flags))
+
+    text = recorder._transcribe_recording(audio, SpeechTimeline(flags))
+
+    starts = [int(call[0][0]) for call in recorder.model.calls]
+    assert len(starts) == 3
+    assert text == " ".join(f"s{s}" for s in sorted(starts))
+    assert recorder.model.peak > 1
+
+
+def test_split_respects_backend_concurrency():
+    recorder = _build_recorder()
+    recorder.model = _ConcurrentModelStub()
+    recorder.model.max_concurrency = 1
+    block, pause = [True] * 625, [False] * 94
+    flags = block + pause + block + pause + block
+
+    recorder._transcribe_recording(_audio(len(flags)), SpeechTimeline(flags))
+
+    assert recorder.model.peak == 1
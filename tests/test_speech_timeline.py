@@ -0,0 +1,83 @@
+"""Tests for audio/speech_timeline.py — speech spans from per-frame VAD flags."""
+
+from hotkey_transcriber.audio.speech_timeline import SpeechTimeline
+
+_FRAME = 512
+
+
+def _timeline(pattern):
+    return SpeechTimeline([c == "S" for c in pattern])
+
+
+def test_no_speech_has_no_spans():
+    timeline = _timeline("....")
+
+    assert timeline.speech_spans() == []
+    assert timeline.speech_ratio == 0.0
+
+
+def test_single_run_is_padded_and_clipped():
+    timeline = _timeline("..SS..")
+
+    spans = timeline.speech_spans(6 * _FRAME, pad_ms=32, min_silence_ms=0)
+
+    assert spans == [(1 * _FRAME, 5 * _FRAME)]
+
+
+def test_padding_is_clipped_to_recording_length():
+    timeline = _timeline("SS")
+
+    assert timeline.speech_spans(2 * _FRAME - 100, pad_ms=400) == [(0, 2 * _FRAME - 100)]
+
+
+def test_short_gap_is_merged_long_gap_splits():
+    pattern = "SS" + "." * 3 + "SS" + "." * 40 + "SS"
+    timeline = _timeline(pattern)
+
+    spans = timeline.speech_spans(pad_ms=0, min_silence_ms=500)
+
+    assert spans == [(0, 7 * _FRAME), (47 * _FRAME, 49 * _FRAME)]
+
+
+def test_edge_padding_only_applies_to_outer_edges():
+    pattern = "." * 20 + "SS" + "." * 100 + "SS" + "." * 20
+    timeline = _timeline(pattern)
+
+    spans = timeline.speech_spans(pad_ms=64, min_silence_ms=500, edge_pad_ms=32)
+
+    assert spans == [(19 * _FRAME, 24 * _FRAME), (120 * _FRAME, 125 * _FRAME)]
+
+
+def test_speech_ratio_and_duration():
+    timeline = _timeline("SS..")
+
+    assert timeline.speech_ratio == 0.5
+    assert timeline.speech_ms == 64.0
+
+
+def test_short_recording_is_not_split():
+    timeline = _timeline("S" * 100)
+
+    assert timeline.split_points(max_segment_ms=25_000) == []
+
+
+def test_long_recording_is_cut_in_the_longest_pause():
+    # 1 frame = 32 ms; a 10-frame pause at frames 400..410 and a 2-frame one at 300..302.
+    flags = ["S"] * 1000
+    flags[300:302] = ".."
+    flags[400:410] = "." * 10
+    timeline = _timeline("".join(flags))
+
+    cuts = timeline.split_points(max_segment_ms=25_000, min_segment_ms=5_000)
+
+    assert cuts[0] == 405 * _FRAME
+    bounds = zip([0, *cuts], [*cuts, 1000 * _FRAME], strict=True)
+    assert all(b - a <= 781 * _FRAME for a, b in bounds)
+
+
+def test_recording_without_pause_is_cut_hard_at_max_length():
+    timeline = _timeline("S" * 1000)
+
+    cuts = timeline.split_points(max_segment_ms=3_200, min_segment_ms=1_000)
+
+    assert cuts == [i * 100 * _FRAME for i in range(1, 10)]
@@ -0,0 +1,99 @@
+"""Tests for transcription/streaming_transcriber.py — window commits and tail handling."""
+
+import numpy as np
+
+from hotkey_transcriber.audio.audio_ring_buffer import AudioRingBuffer
+from hotkey_transcriber.transcription.streaming_transcriber import StreamingTranscriber
+
+_SR = 16_000
+
+
+class _EnergyVAD:
+    WINDOW_SIZE = 512
+
+    def reset(self):
+        pass
+
+    def is_speech(self, frame):
+        return float(np.abs(frame).mean()) > 0.1
+
+
+class _RecordingTranscriber:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, audio):
+        self.calls.append(len(audio))
+        return f"w{len(self.calls)}"
+
+
+def _tone(ms):
+    return np.full(_SR * ms // 1000, 0.5, dtype=np.float32)
+
+
+def _silence(ms):
+    return np.zeros(_SR * ms // 1000, dtype=np.float32)
+
+
+def _run(signal, chunk=480, **kwargs):
+    transcribe = _RecordingTranscriber()
+    streamer = StreamingTranscriber(transcribe_fn=transcribe, vad=_EnergyVAD(), **kwargs)
+    audio_buf = AudioRingBuffer(initial_seconds=1)
+    streamer.start(audio_buf)
+    for i in range(0, len(signal), chunk):
+        audio_buf.write(signal[i : i + chunk, np.newaxis])
+    return streamer.finish(), transcribe.calls
+
+
+def test_short_recording_is_transcribed_once_at_finish():
+    text, calls = _run(_tone(1000))
+
+    assert text == "w1"
+    assert len(calls) == 1
+
+
+def test_pause_after_long_speech_commits_window_before_finish():
+    signal = np.concatenate([_tone(4000), _silence(800), _tone(1000)])
+
+    text, calls = _run(signal, min_window_ms=3000, min_pause_ms=500)
+
+    assert text == "w1 w2"
+    assert len(calls) == 2
+    assert sum(calls) == len(signal)
+
+
+def test_pause_before_min_window_does_not_commit():
+    signal = np.concatenate([_tone(1000), _silence(800), _tone(1000)])
+
+    text, calls = _run(signal, min_window_ms=3000, min_pause_ms=500)
+
+    assert text == "w1"
+    assert calls == [len(signal)]
+
+
+def test_trailing_silence_after_commit_is_not_transcribed():
+    signal = np.concatenate([_tone(4000), _silence(2000)])
+
+    text, calls = _run(signal, min_window_ms=3000, min_pause_ms=500)
+
+    assert text == "w1"
+    assert len(calls) == 1
+
+
+def test_failed_window_is_retried_with_tail():
+    transcribe_calls = []
+
+    def _flaky(audio):
+        transcribe_calls.append(len(audio))
+        if len(transcribe_calls) == 1:
+            raise RuntimeError("boom")
+        return "ok"
+
+    streamer = StreamingTranscriber(transcribe_fn=_flaky, vad=_EnergyVAD())
+    audio_buf = AudioRingBuffer(initial_seconds=1)
+    streamer.start(audio_buf)
+    signal = np.concatenate([_tone(4000), _silence(800), _tone(1000)])
+    audio_buf.write(signal[:, np.newaxis])
+
+    assert streamer.finish() == "ok"
+    assert transcribe_calls[-1] == len(signal)
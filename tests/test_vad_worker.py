@@ -0,0 +1,120 @@
+"""Tests for audio/vad_worker.py — auto-stop state machine off the audio thread."""
+
+import threading
+
+import numpy as np
+
+from hotkey_transcriber.audio.vad_worker import VadWorker
+
+_FRAME_S = 0.032
+
+
+class _EnergyVAD:
+    def __init__(self):
+        self.resets = 0
+
+    def reset(self):
+        self.resets += 1
+
+    def is_speech(self, frame):
+        return float(np.abs(frame).mean()) > 0.1
+
+
+def _speech():
+    return np.full(512, 0.5, dtype=np.float32)
+
+
+def _silence():
+    return np.zeros(512, dtype=np.float32)
+
+
+def _worker():
+    fired = threading.Event()
+    return VadWorker(_EnergyVAD(), on_auto_stop=fired.set), fired
+
+
+def _feed(worker, frames, t0=1000.0):
+    for i, frame in enumerate(frames):
+        worker.submit(frame, capture_time=t0 + i * _FRAME_S)
+
+
+def test_silence_after_speech_triggers_auto_stop():
+    worker, fired = _worker()
+    worker.start(silence_timeout_ms=300, max_initial_wait_ms=None, start_time=1000.0)
+
+    _feed(worker, [_speech()] * 5 + [_silence()] * 15)
+    worker.stop()
+
+    assert fired.wait(1.0)
+    assert worker.speech_detected
+
+
+def test_short_pause_does_not_trigger_auto_stop():
+    worker, fired = _worker()
+    worker.start(silence_timeout_ms=300, max_initial_wait_ms=None, start_time=1000.0)
+
+    _feed(worker, [_speech()] * 5 + [_silence()] * 5 + [_speech()] * 5)
+    worker.stop()
+
+    assert not fired.wait(0.05)
+    assert worker.frames_processed == 15
+
+
+def test_initial_wait_without_speech_triggers_auto_stop():
+    worker, fired = _worker()
+    worker.start(silence_timeout_ms=300, max_initial_wait_ms=500, start_time=1000.0)
+
+    _feed(worker, [_silence()] * 20)
+    worker.stop()
+
+    assert fired.wait(1.0)
+    assert not worker.speech_detected
+
+
+def test_silence_without_speech_and_no_initial_wait_keeps_running():
+    worker, fired = _worker()
+    worker.start(silence_timeout_ms=300, max_initial_wait_ms=None, start_time=1000.0)
+
+    _feed(worker, [_silence()] * 50)
+    worker.stop()
+
+    assert not fired.wait(0.05)
+
+
+def test_failing_vad_counts_as_speech():
+    class _BrokenVAD(_EnergyVAD):
+        def is_speech(self, frame):
+            raise RuntimeError("onnx")
+
+    fired = threading.Event()
+    worker = VadWorker(_BrokenVAD(), on_auto_stop=fired.set)
+    worker.start(silence_timeout_ms=100, max_initial_wait_ms=100, start_time=1000.0)
+
+    _feed(worker, [_silence()] * 20)
+    worker.stop()
+
+    assert not fired.wait(0.05)
+    assert worker.speech_detected
+
+
+def test_full_queue_counts_overflows_and_drops_oldest():
+    worker = VadWorker(_EnergyVAD(), on_auto_stop=lambda: None, max_pending_frames=4)
+
+    _feed(worker, [_silence()] * 6)
+
+    assert worker.overflows == 2
+    assert len(worker._frames) == 4
+
+
+def test_start_resets_vad_and_stats():
+    worker, _ = _worker()
+    worker.start(silence_timeout_ms=300, max_initial_wait_ms=None)
+    _feed(worker, [_speech()] * 3)
+    worker.stop()
+
+    worker.start(silence_timeout_ms=300, max_initial_wait_ms=None)
+    worker.stop()
+
+    assert worker._vad.resets == 2
+    assert worker.frames_processed == 0
+    assert not worker.speech_detected
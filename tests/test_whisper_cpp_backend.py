@@ -0,0 +1,66 @@
+"""Tests for transcription/whisper_cpp_backend.py — whisper-cli fallback over stdin/stdout."""
+
+import os
+import sys
+import textwrap
+
+import numpy as np
+import pytest
+
+pytest.importorskip("huggingface_hub")
+
+from hotkey_transcriber.transcription.whisper_cpp_backend import (  # noqa: E402
+    WhisperCppModel,
+    _parse_cli_output,
+)
+
+# Reads the WAV from stdin like "whisper-cli -f -" and prints two segments.
+_STAND_IN_CLI = textwrap.dedent(f"""\
+    #!{sys.executable}
+    import io, sys, wave
+    args = sys.argv[1:]
+    assert args[args.index("-f") + 1] == "-"
+    with wave.open(io.BytesIO(sys.stdin.buffer.read())) as wf:
+        n, rate = wf.getnframes(), wf.getframerate()
+    lang = args[args.index("-l") + 1]
+    if lang == "xx":
+        print("error: unknown language 'xx'", file=sys.stderr)
+        sys.exit(1)
+    print(f" {{n}} samples at {{rate}} Hz")
+    print(f" language {{lang}} ")
+    """)
+
+
+@pytest.fixture
+def cli_model(tmp_path):
+    cli = tmp_path / "whisper-cli"
+    cli.write_text(_STAND_IN_CLI, encoding="utf-8")
+    os.chmod(cli, 0o755)
+    model = WhisperCppModel.__new__(WhisperCppModel)
+    model._cli_path = str(cli)
+    model._model_path = "ggml-base.bin"
+    model._server = None
+    return model
+
+
+def test_parse_cli_output_joins_segment_lines():
+    assert _parse_cli_output(b" Hallo Welt.\n\n Wie geht's?\n") == "Hallo Welt. Wie geht's?"
+    assert _parse_cli_output(b"\n") == ""
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="stand-in CLI uses a shebang")
+def test_cli_fallback_pipes_wav_and_reads_stdout(cli_model, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    before = set(tmp_path.iterdir())
+
+    segments, info = cli_model.transcribe(np.zeros(3200, dtype=np.float32), language="de")
+
+    assert [s.text for s in segments] == ["3200 samples at 16000 Hz language de"]
+    assert info == {"language": "de"}
+    assert set(tmp_path.iterdir()) == before
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="stand-in CLI uses a shebang")
+def test_cli_fallback_raises_with_stderr(cli_model):
+    with pytest.raises(RuntimeError, match="unknown language"):
+        cli_model.transcribe(np.zeros(160, dtype=np.float32), language="xx")
@@ -0,0 +1,157 @@
+"""Tests for transcription/whisper_cpp_server.py against a stand-in whisper-server."""
+
+import io
+import sys
+import textwrap
+import wave
+
+import numpy as np
+import pytest
+
+from hotkey_transcriber.transcription.whisper_cpp_server import (
+    WhisperCppServer,
+    WhisperCppServerError,
+)
+
+# Speaks the subset of the whisper-server HTTP API the client uses; the
+# "transcript" reports the sample count and the form fields it received.
+_STAND_IN = textwrap.dedent("""
+    import argparse, io, json, time, wave
+    from email.parser import BytesParser
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    p = argparse.ArgumentParser()
+    p.add_argument("-m")
+    p.add_argument("--host")
+    p.add_argument("--port", type=int)
+    p.add_argument("--load-s", type=float, default=0.0)
+    args, _ = p.parse_known_args()
+    loaded_at = time.monotonic() + args.load_s
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *a):
+            pass
+
+        def _json(self, code, data):
+            body = json.dumps(data).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path != "/health":
+                return self._json(404, {})
+            ready = time.monotonic() >= loaded_at
+            self._json(200 if ready else 503, {"status": "ok" if ready else "loading"})
+
+        def do_POST(self):
+            raw = self.rfile.read(int(self.headers["Content-Length"]))
+            msg = BytesParser().parsebytes(
+                b"Content-Type: " + self.headers["Content-Type"].encode() + b"\\r\\n\\r\\n" + raw
+            )
+            fields, n = {}, 0
+            for part in msg.get_payload():
+                name = part.get_param("name", header="content-disposition")
+                data = part.get_payload(decode=True)
+                if name == "file":
+                    with wave.open(io.BytesIO(data)) as wf:
+                        n = wf.getnframes()
+                else:
+                    fields[name] = data.decode()
+            if fields.get("language") == "crash":
+                import os
+                os._exit(3)
+            self._json(200, {"text": f" {n} {fields['language']} {fields['beam_size']} "})
+
+    print("whisper_init_from_file: loading model", flush=True)
+    HTTPServer((args.host, args.port), Handler).serve_forever()
+    """)
+
+
+def _wav(n_samples: int) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(np.zeros(n_samples, dtype=np.int16).tobytes())
+    return buf.getvalue()
+
+
+@pytest.fixture
+def stand_in(tmp_path):
+    script = tmp_path / "whisper_server_stand_in.py"
+    script.write_text(_STAND_IN, encoding="utf-8")
+    servers = []
+
+    def _make(*extra):
+        server = WhisperCppServer(
+            [sys.executable, str(script), "-m", "model.bin", *extra], startup_timeout_s=10
+        )
+        servers.append(server)
+        return server
+
+    yield _make
+    for server in servers:
+        server.close()
+
+
+def test_inference_sends_wav_and_fields(stand_in):
+    server = stand_in()
+    server.start()
+
+    assert server.inference(_wav(1600), language="de", beam_size=5) == "1600 de 5"
+    assert server.inference(_wav(320)) == "320 auto 1"
+
+
+def test_start_waits_until_model_is_loaded(stand_in):
+    server = stand_in("--load-s", "0.3")
+    server.start()
+
+    assert server.healthy()
+
+
+def test_loopback_requests_bypass_configured_proxies(stand_in, monkeypatch):
+    for name in ("http_proxy", "HTTP_PROXY"):
+        monkeypatch.setenv(name, "http://127.0.0.1:9")  # nothing listens on the discard port
+    for name in ("no_proxy", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    server = stand_in()
+    server.start()
+
+    assert server.healthy()
+    assert server.inference(_wav(16), language="de") == "16 de 1"
+
+
+def test_dead_server_is_restarted_on_next_request(stand_in):
+    server = stand_in()
+    server.start()
+    server._proc.kill()
+    server._proc.wait()
+
+    assert server.inference(_wav(16), language="de") == "16 de 1"
+    assert server.restarts == 1
+
+
+def test_crash_during_request_restarts_and_retries(stand_in):
+    server = stand_in()
+    server.start()
+
+    with pytest.raises(WhisperCppServerError):
+        # The retry crashes as well, which is surfaced instead of looping.
+        server.inference(_wav(16), language="crash")
+    assert server.restarts == 1
+    assert server.inference(_wav(16), language="en") == "16 en 1"
+
+
+def test_start_reports_log_tail_when_server_exits(tmp_path):
+    script = tmp_path / "broken.py"
+    script.write_text(
+        "import sys\nprint('error: failed to load model', file=sys.stderr)\nsys.exit(2)\n"
+    )
+    server = WhisperCppServer([sys.executable, str(script)], startup_timeout_s=10)
+
+    with pytest.raises(WhisperCppServerError, match="exit=2"):
+        server.start()
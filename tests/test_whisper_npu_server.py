@@ -0,0 +1,264 @@
+"""Tests for tools/whisper_npu_server.py — decoder loops against fake ONNX sessions."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from tools.whisper_npu_server import (
+    MAX_NEW_TOKENS,
+    MAX_NEW_TOKENS_NO_CACHE,
+    SAMPLE_RATE,
+    DecoderIO,
+    LogMelFrontEnd,
+    WhisperVocab,
+    _bytes_to_unicode,
+    greedy_decode,
+    split_windows,
+    transcribe_windows,
+)
+
+SOT, EOT, TRANSCRIBE, NOTIMESTAMPS, DE = 500, 501, 502, 503, 504
+VOCAB = 512
+HEADS, HEAD_DIM = 2, 4
+
+
+class _Tokenizer:
+    eos_token_id = EOT
+    _special = {
+        "<|startoftranscript|>": SOT,
+        "<|transcribe|>": TRANSCRIBE,
+        "<|notimestamps|>": NOTIMESTAMPS,
+        "<|de|>": DE,
+    }
+
+    def convert_tokens_to_ids(self, token):
+        return self._special[token]
+
+    def decode(self, ids, skip_special_tokens=False):
+        return " ".join(str(i) for i in ids if not (skip_special_tokens and i >= SOT))
+
+
+def _tensor(name, type_, shape):
+    return SimpleNamespace(name=name, type=type_, shape=shape)
+
+
+def _logits(rows, token):
+    logits = np.zeros([1, rows, VOCAB], dtype=np.float32)
+    logits[0, -1, token] = 1.0
+    return logits
+
+
+class _CachedDecoder:
+    """Optimum-style merged decoder that emits tokens 1, 2, 3, ... and then EOT."""
+
+    def __init__(self, answer_len):
+        self.answer_len = answer_len
+        self.calls = []
+        layers = ("decoder.key", "decoder.value", "encoder.key", "encoder.value")
+        self._past = [f"past_key_values.0.{kind}" for kind in layers]
+
+    def get_inputs(self):
+        past_shape = ["batch_size", HEADS, "past_sequence_length", HEAD_DIM]
+        return [
+            _tensor("input_ids", "tensor(int64)", ["batch_size", "decoder_sequence_length"]),
+            _tensor("encoder_hidden_states", "tensor(float16)", ["batch_size", 1500, 8]),
+            *[_tensor(name, "tensor(float16)", past_shape) for name in self._past],
+            _tensor("use_cache_branch", "tensor(bool)", [1]),
+        ]
+
+    def get_outputs(self):
+        return [_tensor("logits", "tensor(float)", [])] + [
+            _tensor(name.replace("past_key_values", "present"), "tensor(float16)", [])
+            for name in self._past
+        ]
+
+    def run(self, names, feed):
+        self.calls.append(feed)
+        tokens = feed["input_ids"]
+        past_len = feed["past_key_values.0.decoder.key"].shape[2]
+        assert bool(feed["use_cache_branch"][0]) == (past_len > 0)
+        generated = past_len + tokens.shape[1] - 4
+        token = generated + 1 if generated < self.answer_len else EOT
+        present = np.zeros([1, HEADS, past_len + tokens.shape[1], HEAD_DIM], dtype=np.float16)
+        return [_logits(tokens.shape[1], token)] + [present] * (len(names) - 1)
+
+
+class _FullDecoder:
+    """Decoder without a KV cache; *static_len* mimics AMD's fixed [1, 448] exports."""
+
+    def __init__(self, answer_len, static_len=None):
+        self.answer_len = answer_len
+        self.static_len = static_len
+        self.calls = []
+
+    def get_inputs(self):
+        seq = self.static_len or "sequence"
+        return [
+            _tensor("x", "tensor(int64)", [1, seq]),
+            _tensor("xa", "tensor(float)", [1, 1500, 8]),
+        ]
+
+    def get_outputs(self):
+        return [_tensor("logits", "tensor(float)", [])]
+
+    def run(self, names, feed):
+        self.calls.append(feed)
+        tokens = feed["x"][0]
+        real = int(np.count_nonzero(tokens))
+        token = real - 3 if real - 4 < self.answer_len else EOT
+        logits = np.zeros([1, len(tokens), VOCAB], dtype=np.float32)
+        logits[0, real - 1 if self.static_len else -1, token] = 1.0
+        return [logits]
+
+
+def _enc_hidden():
+    return np.ones([1, 1500, 8], dtype=np.float32)
+
+
+def test_cached_decoder_feeds_one_token_per_step():
+    decoder = _CachedDecoder(answer_len=3)
+
+    text = greedy_decode(decoder, _enc_hidden(), _Tokenizer(), "de")
+
+    assert text == "1 2 3"
+    assert [call["input_ids"].shape[1] for call in decoder.calls] == [4, 1, 1, 1]
+    past_lengths = [call["past_key_values.0.decoder.key"].shape[2] for call in decoder.calls]
+    assert past_lengths == [0, 4, 5, 6]
+
+
+def test_encoder_states_are_cast_once():
+    decoder = _CachedDecoder(answer_len=2)
+
+    greedy_decode(decoder, _enc_hidden(), _Tokenizer(), "auto")
+
+    states = [call["encoder_hidden_states"] for call in decoder.calls]
+    assert states[0].dtype == np.float16
+    assert all(s is states[0] for s in states)
+
+
+def test_cached_decoder_allows_long_transcripts():
+    decoder = _CachedDecoder(answer_len=1000)
+
+    text = greedy_decode(decoder, _enc_hidden(), _Tokenizer(), "de")
+
+    assert len(text.split()) == MAX_NEW_TOKENS > MAX_NEW_TOKENS_NO_CACHE
+
+
+def test_static_shape_decoder_falls_back_to_padded_full_sequence():
+    decoder = _FullDecoder(answer_len=2, static_len=448)
+
+    text = greedy_decode(decoder, _enc_hidden(), _Tokenizer(), "de")
+
+    assert not DecoderIO(decoder).uses_cache
+    assert text == "1 2"
+    assert {call["x"].shape for call in decoder.calls} == {(1, 448)}
+
+
+def test_dynamic_decoder_without_cache_keeps_short_cap():
+    decoder = _FullDecoder(answer_len=1000)
+
+    text = greedy_decode(decoder, _enc_hidden(), _Tokenizer(), "de")
+
+    assert len(text.split()) == MAX_NEW_TOKENS_NO_CACHE
+    assert decoder.calls[-1]["x"].shape == (1, 4 + MAX_NEW_TOKENS_NO_CACHE - 1)
+
+
+def _speech(seconds, pauses=()):
+    """A tone with silent gaps at the given (start_s, end_s) pairs."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    audio = (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+    for start, end in pauses:
+        audio[int(start * SAMPLE_RATE) : int(end * SAMPLE_RATE)] = 0.0
+    return audio
+
+
+def test_short_audio_is_one_window():
+    assert split_windows(_speech(12)) == [(0, 12 * SAMPLE_RATE)]
+
+
+def test_long_audio_is_cut_in_pauses_before_each_window_limit():
+    audio = _speech(70, pauses=[(24, 25), (50, 51)])
+
+    windows = split_windows(audio)
+
+    assert len(windows) == 3
+    assert windows[0][0] == 0 and windows[-1][1] == len(audio)
+    assert all(end - start <= 30 * SAMPLE_RATE for start, end in windows)
+    cuts = [start / SAMPLE_RATE for start, _ in windows[1:]]
+    assert 24 <= cuts[0] <= 25 and 50 <= cuts[1] <= 51
+
+
+def test_audio_without_pauses_is_cut_at_the_window_limit():
+    windows = split_windows(_speech(45))
+
+    assert [end - start for start, end in windows][0] <= 30 * SAMPLE_RATE
+    assert windows[1][1] == 45 * SAMPLE_RATE
+
+
+def test_next_window_is_encoded_while_the_previous_one_decodes():
+    audio = _speech(70, pauses=[(24, 25), (50, 51)])
+    encoded = []
+    second_encoded = threading.Event()
+
+    def encode(window):
+        encoded.append(len(window))
+        if len(encoded) == 2:
+            second_encoded.set()
+        return len(encoded)
+
+    def decode(window_no):
+        if window_no == 1:
+            # Only finishes if window 2 is encoded concurrently.
+            assert second_encoded.wait(5)
+        return "" if window_no == 2 else f"teil{window_no}"
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        text = transcribe_windows(audio, encode, decode, pool)
+
+    assert text == "teil1 teil3"
+    assert sum(encoded) == len(audio)
+
+
+@pytest.mark.parametrize("n_mels", [80, 128])
+def test_log_mel_matches_transformers_feature_extractor(n_mels):
+    transformers = pytest.importorskip("transformers")
+    rng = np.random.default_rng(0)
+    audio = np.concatenate([0.1 * rng.standard_normal(3 * SAMPLE_RATE), _speech(4)])
+    audio = audio.astype(np.float32)
+
+    expected = transformers.WhisperFeatureExtractor(feature_size=n_mels)(
+        audio, sampling_rate=SAMPLE_RATE, return_tensors="np"
+    ).input_features
+
+    np.testing.assert_allclose(LogMelFrontEnd(n_mels=n_mels)(audio), expected, atol=1e-4)
+
+
+def test_log_mel_pads_and_cuts_to_one_window():
+    front_end = LogMelFrontEnd()
+
+    short = front_end(_speech(2))
+    long = front_end(_speech(40))
+
+    assert short.shape == long.shape == (1, 80, 3000)
+    assert short.dtype == np.float32
+    np.testing.assert_allclose(long, front_end(_speech(40)[: 30 * SAMPLE_RATE]))
+
+
+def test_vocab_decodes_byte_level_tokens_and_skips_special_tokens():
+    to_char = _bytes_to_unicode()
+
+    def piece(text):
+        return "".join(to_char[b] for b in text.encode("utf-8"))
+
+    vocab = {piece(" Grü"): 0, piece("ße"): 1, piece(" €"): 2}
+    added = {"<|endoftext|>": 3, "<|startoftranscript|>": 4, "<|de|>": 5}
+    tokens = WhisperVocab(vocab, added)
+
+    ids = [4, 5, 0, 1, 2, 3]
+    assert tokens.eos_token_id == 3
+    assert tokens.convert_tokens_to_ids("<|de|>") == 5
+    assert tokens.decode(ids, skip_special_tokens=True) == " Grüße €"
+    assert tokens.decode(ids).startswith("<|startoftranscript|><|de|> Grü")
@@ -0,0 +1,120 @@
+"""Tests for transcription/worker_client.py against a dummy worker process."""
+
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from hotkey_transcriber.transcription import worker_protocol as wp
+from hotkey_transcriber.transcription.worker_client import WorkerClient, WorkerClosedError
+
+# Replies with the sample count after sleeping "sleep" seconds; "chatter" writes
+# that many KiB to stderr first, "crash" exits in the middle of a request.
+_DUMMY_WORKER = textwrap.dedent("""
+    import os, sys, time
+    sys.path.insert(0, {protocol_dir!r})
+    from worker_protocol import WorkerServer, claim_stdout
+
+    out = claim_stdout()
+
+    def handle(req, audio):
+        sys.stderr.write("x" * 1023 * req.get("chatter", 0) + "\\n")
+        time.sleep(req.get("sleep", 0))
+        if req.get("crash"):
+            print("fatal: out of memory", file=sys.stderr, flush=True)
+            os._exit(3)
+        return {{"samples": len(audio)}}
+
+    WorkerServer(handle, info={{"device": "dummy"}}, stdout=out).serve()
+    """)
+
+
+@pytest.fixture
+def worker(tmp_path):
+    script = tmp_path / "dummy_worker.py"
+    script.write_text(
+        _DUMMY_WORKER.format(protocol_dir=str(Path(wp.__file__).parent)), encoding="utf-8"
+    )
+    procs = []
+
+    def _start():
+        proc = subprocess.Popen(
+            [sys.executable, str(script)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+        )
+        procs.append(proc)
+        client = WorkerClient(proc, name="dummy", log_stderr=False)
+        assert client.wait_ready(timeout=10)["device"] == "dummy"
+        return client
+
+    yield _start
+    for proc in procs:
+        proc.kill()
+        proc.wait()
+
+
+def _pcm(n):
+    return wp.pcm_from_audio(np.zeros(n, dtype=np.float32))
+
+
+def test_requests_in_flight_are_matched_by_id(worker):
+    client = worker()
+
+    _, slow = client.submit({"type": wp.TRANSCRIBE, "sleep": 0.2}, _pcm(100))
+    _, fast = client.submit({"type": wp.TRANSCRIBE}, _pcm(7))
+    pong = client.request({"type": wp.PING}, timeout=5)
+
+    assert pong["type"] == "pong"
+    assert slow.result(5)["samples"] == 100
+    assert fast.result(5)["samples"] == 7
+
+
+def test_timeout_cancels_without_corrupting_the_stream(worker):
+    client = worker()
+
+    with pytest.raises(TimeoutError):
+        client.request({"type": wp.TRANSCRIBE, "sleep": 0.5}, _pcm(1), timeout=0.05)
+
+    # The late reply of the timed-out request must not be mistaken for this one.
+    assert client.request({"type": wp.TRANSCRIBE}, _pcm(3), timeout=5)["samples"] == 3
+
+
+def test_chatty_stderr_is_drained(worker):
+    client = worker()
+
+    # 256 KiB on stderr would fill the pipe (64 KiB) and block the worker without the drain.
+    reply = client.request({"type": wp.TRANSCRIBE, "chatter": 256}, _pcm(5), timeout=10)
+
+    assert reply["samples"] == 5
+
+
+def test_crash_fails_pending_requests_with_stderr_tail(worker):
+    client = worker()
+    _, crashing = client.submit({"type": wp.TRANSCRIBE, "crash": True}, _pcm(1))
+    _, queued = client.submit({"type": wp.TRANSCRIBE}, _pcm(1))
+
+    with pytest.raises(WorkerClosedError, match="out of memory"):
+        crashing.result(10)
+    with pytest.raises(WorkerClosedError):
+        queued.result(5)
+
+    assert client.closed
+    with pytest.raises(WorkerClosedError):
+        client.submit({"type": wp.PING})
+
+
+def test_close_lets_the_worker_exit(worker):
+    client = worker()
+    client.close()
+
+    deadline = time.monotonic() + 5
+    while not client.closed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.closed
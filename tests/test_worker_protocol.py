@@ -0,0 +1,160 @@
+"""Tests for transcription/worker_protocol.py — frames, PCM payloads and the worker loop."""
+
+import io
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from hotkey_transcriber.transcription import worker_protocol as wp
+
+
+def test_frame_roundtrip_keeps_id_header_and_payload():
+    stream = io.BytesIO(
+        wp.encode_frame(7, {"type": wp.TRANSCRIBE, "language": "de"}, b"\x01\x02")
+        + wp.encode_frame(8, {"type": wp.PING})
+    )
+
+    first, second = wp.read_frame(stream), wp.read_frame(stream)
+
+    assert (first.request_id, first.type, first.header["language"]) == (7, "transcribe", "de")
+    assert first.payload == b"\x01\x02"
+    assert (second.request_id, second.type, second.payload) == (8, "ping", b"")
+    assert wp.read_frame(stream) is None
+
+
+def test_bad_magic_and_truncated_frames_raise():
+    with pytest.raises(wp.ProtocolError):
+        wp.read_frame(io.BytesIO(b'{"text": "hallo"}\n' + b"\0" * 16))
+    with pytest.raises(wp.ProtocolError):
+        wp.read_frame(io.BytesIO(wp.encode_frame(1, {"type": wp.RESULT}, b"abcd")[:-2]))
+
+
+class _ShortWriter(io.BytesIO):
+    """Accepts at most 1000 bytes per write, like a raw pipe with a full buffer."""
+
+    def write(self, data):
+        return super().write(bytes(data[:1000]))
+
+
+def test_write_frame_finishes_short_writes():
+    stream = _ShortWriter()
+    payload = wp.pcm_from_audio(np.linspace(-1, 1, 16000, dtype=np.float32))
+
+    wp.write_frame(stream, 3, {"type": wp.TRANSCRIBE}, payload)
+    wp.write_frame(stream, 4, {"type": wp.PING})
+    stream.seek(0)
+
+    first, second = wp.read_frame(stream), wp.read_frame(stream)
+    assert (first.request_id, first.payload) == (3, payload)
+    assert (second.request_id, second.type) == (4, "ping")
+
+
+def test_pcm_roundtrip():
+    audio = np.array([0.0, 0.5, -0.5, 1.0, -1.2], dtype=np.float32)
+
+    restored = wp.audio_from_pcm(wp.pcm_from_audio(audio))
+
+    assert restored.dtype == np.float32
+    assert np.allclose(restored, np.clip(audio, -1, 1), atol=1e-4)
+
+
+class _Pipes:
+    """In-process worker: the test writes requests and reads replies over os.pipe."""
+
+    def __init__(self, handle):
+        req_r, self._req_w = os.pipe()
+        rep_r, rep_w = os.pipe()
+        self.requests = os.fdopen(self._req_w, "wb", buffering=0)
+        self.replies = os.fdopen(rep_r, "rb")
+        self.server = wp.WorkerServer(
+            handle,
+            info={"device": "test"},
+            stdin=os.fdopen(req_r, "rb"),
+            stdout=os.fdopen(rep_w, "wb", buffering=0),
+        )
+        self.thread = threading.Thread(target=self.server.serve, daemon=True)
+        self.thread.start()
+
+    def send(self, request_id, header, payload=b""):
+        wp.write_frame(self.requests, request_id, header, payload)
+
+    def reply(self):
+        return wp.read_frame(self.replies)
+
+
+def test_worker_server_answers_ping_while_transcribing_and_honours_cancel():
+    release = threading.Event()
+
+    def handle(req, audio):
+        release.wait(5)
+        return {"text": f"{len(audio)} {req['language']}"}
+
+    worker = _Pipes(handle)
+    assert worker.reply().header == {"type": "ready", "device": "test"}
+
+    worker.send(1, {"type": wp.TRANSCRIBE, "language": "de"}, wp.pcm_from_audio(np.zeros(160)))
+    worker.send(2, {"type": wp.TRANSCRIBE, "language": "en"}, b"")
+    worker.send(2, {"type": wp.CANCEL})
+    worker.send(3, {"type": wp.PING})
+    pong = worker.reply()
+    assert (pong.request_id, pong.type, pong.header["device"]) == (3, "pong", "test")
+
+    release.set()
+    first, second = worker.reply(), worker.reply()
+    assert (first.request_id, first.header["text"]) == (1, "160 de")
+    assert (second.request_id, second.type) == (2, "cancelled")
+
+    worker.send(4, {"type": wp.SHUTDOWN})
+    assert worker.reply().request_id == 4
+    worker.thread.join(1)
+    assert not worker.thread.is_alive()
+
+
+def test_worker_server_reports_handler_errors():
+    def handle(req, audio):
+        raise ValueError("kaputt")
+
+    worker = _Pipes(handle)
+    worker.reply()
+    worker.send(5, {"type": wp.TRANSCRIBE})
+
+    reply = worker.reply()
+
+    assert (reply.request_id, reply.type, reply.header["error"]) == (5, "error", "kaputt")
+    worker.requests.close()
+    worker.thread.join(1)
+    assert not worker.thread.is_alive()
+
+
+def test_claim_stdout_keeps_stray_prints_out_of_the_frame_stream(tmp_path):
+    protocol_dir = Path(wp.__file__).parent
+    script = tmp_path / "worker.py"
+    script.write_text(textwrap.dedent(f"""
+        import os, sys
+        sys.path.insert(0, {str(protocol_dir)!r})
+        from worker_protocol import WorkerServer, claim_stdout
+        out = claim_stdout()
+        print("library chatter")
+        os.write(1, b"native chatter\\n")
+        WorkerServer(lambda req, audio: {{"text": "ok"}}, stdout=out).serve()
+    """))
+    proc = subprocess.Popen(
+        [sys.executable, str(script)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    wp.write_frame(proc.stdin, 1, {"type": wp.TRANSCRIBE})
+    wp.write_frame(proc.stdin, 2, {"type": wp.SHUTDOWN})
+
+    out, err = proc.communicate(timeout=10)
+    stream = io.BytesIO(out)
+
+    assert [wp.read_frame(stream).type for _ in range(3)] == ["ready", "result", "result"]
+    assert b"library chatter" in err and b"native chatter" in err
@@ -0,0 +1,243 @@
+"""Tests for transcription/worker_supervisor.py with dummy worker processes (Linux)."""
+
+import signal
+import subprocess
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from hotkey_transcriber.transcription import worker_protocol as wp
+from hotkey_transcriber.transcription.worker_client import WorkerClient, WorkerClosedError
+from hotkey_transcriber.transcription.worker_supervisor import WorkerSupervisor
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="uses SIGSTOP")
+
+# A worker whose pid matches "crash_pid" exits mid-request; one matching
+# "hang_pid" stops itself, so it answers neither the request nor pings; one
+# matching "block_pid" blocks in the handler but keeps answering pings.
+_DUMMY_WORKER = textwrap.dedent("""
+    import os, signal, sys, time
+    sys.path.insert(0, {protocol_dir!r})
+    from worker_protocol import WorkerServer, claim_stdout
+
+    out = claim_stdout()
+
+    def handle(req, audio):
+        if req.get("crash_pid") in (os.getpid(), -1):
+            os._exit(3)
+        if req.get("hang_pid") == os.getpid():
+            os.kill(os.getpid(), signal.SIGSTOP)
+        if req.get("block_pid") in (os.getpid(), -1):
+            time.sleep(3600)
+        return {{"pid": os.getpid(), "samples": len(audio)}}
+
+    WorkerServer(handle, stdout=out).serve()
+    """)
+
+
+class _Spawner:
+    def __init__(self, script: Path, failures: int = 0):
+        self.script = script
+        self.failures = failures
+        self.procs: list[subprocess.Popen] = []
+
+    def __call__(self) -> WorkerClient:
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("GPU belegt")
+        proc = subprocess.Popen(
+            [sys.executable, str(self.script)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+        )
+        self.procs.append(proc)
+        client = WorkerClient(proc, name="dummy", log_stderr=False)
+        client.wait_ready(timeout=10)
+        return client
+
+
+@pytest.fixture
+def spawner(tmp_path):
+    script = tmp_path / "dummy_worker.py"
+    script.write_text(
+        _DUMMY_WORKER.format(protocol_dir=str(Path(wp.__file__).parent)), encoding="utf-8"
+    )
+    spawners = []
+
+    def _make(failures=0):
+        spawner = _Spawner(script, failures)
+        spawners.append(spawner)
+        return spawner
+
+    yield _make
+    for spawner in spawners:
+        for proc in spawner.procs:
+            if proc.poll() is None:
+                proc.send_signal(signal.SIGCONT)
+                proc.kill()
+            proc.wait()
+
+
+def _supervisor(spawn, **kwargs):
+    kwargs.setdefault("heartbeat_interval_s", 0)
+    kwargs.setdefault("sleep", lambda s: None)
+    supervisor = WorkerSupervisor(spawn, name="dummy", **kwargs)
+    supervisor.start()
+    return supervisor
+
+
+def _transcribe(supervisor, timeout=10, **header):
+    return supervisor.request({"type": wp.TRANSCRIBE, **header}, b"\0\0" * 4, timeout=timeout)
+
+
+def test_crash_restarts_worker_and_replays_request(spawner):
+    spawn = spawner()
+    supervisor = _supervisor(spawn)
+    first_pid = _transcribe(supervisor)["pid"]
+
+    reply = _transcribe(supervisor, crash_pid=first_pid)
+    stats = supervisor.stats()
+    supervisor.close()
+
+    assert reply["pid"] != first_pid and reply["samples"] == 4
+    assert (stats["restarts"], stats["state"]) == (1, "running")
+    assert "beendet" in stats["last_error"]
+    assert len(spawn.procs) == 2
+
+
+def test_request_failing_on_every_worker_is_replayed_only_once(spawner):
+    spawn = spawner()
+    supervisor = _supervisor(spawn)
+
+    with pytest.raises(WorkerClosedError):
+        _transcribe(supervisor, crash_pid=-1)
+    assert _transcribe(supervisor)["samples"] == 4
+    supervisor.close()
+
+    # One restart for the replay; the worker lost to the replay is replaced on the next request.
+    assert supervisor.restarts == 2
+
+
+def test_heartbeat_detects_hung_worker(spawner):
+    spawn = spawner()
+    supervisor = _supervisor(spawn, heartbeat_interval_s=0.05, heartbeat_timeout_s=0.2)
+    first_pid = _transcribe(supervisor)["pid"]
+
+    # Freeze the worker behind the supervisor's back; only the heartbeat can notice.
+    spawn.procs[0].send_signal(signal.SIGSTOP)
+
+    deadline = time.monotonic() + 5
+    while supervisor.restarts == 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    reply = _transcribe(supervisor)
+    supervisor.close()
+
+    assert supervisor.restarts == 1
+    assert reply["pid"] != first_pid
+    assert "Heartbeat" in supervisor.last_error
+
+
+def test_hung_request_is_replayed_on_a_fresh_worker(spawner):
+    spawn = spawner()
+    supervisor = _supervisor(spawn, heartbeat_timeout_s=0.2)
+    first_pid = _transcribe(supervisor)["pid"]
+
+    reply = _transcribe(supervisor, timeout=0.3, hang_pid=first_pid)
+    supervisor.close()
+
+    assert reply["pid"] != first_pid
+    assert supervisor.restarts == 1
+
+
+def test_handler_hang_is_restarted_although_the_worker_pongs(spawner):
+    spawn = spawner()
+    supervisor = _supervisor(spawn, heartbeat_timeout_s=0.2)
+    first_pid = _transcribe(supervisor)["pid"]
+
+    reply = _transcribe(supervisor, timeout=0.3, block_pid=first_pid)
+    stats = supervisor.stats()
+    supervisor.close()
+
+    assert reply["pid"] != first_pid and reply["samples"] == 4
+    assert (stats["restarts"], stats["state"]) == (1, "running")
+    assert spawn.procs[0].wait(timeout=5) is not None
+
+
+def test_hung_replay_is_killed_so_the_next_request_gets_a_fresh_worker(spawner):
+    spawn = spawner()
+    supervisor = _supervisor(spawn)
+
+    with pytest.raises(TimeoutError):
+        _transcribe(supervisor, timeout=0.3, block_pid=-1)
+    reply = _transcribe(supervisor)
+    supervisor.close()
+
+    assert reply["pid"] == spawn.procs[2].pid
+    assert supervisor.restarts == 2
+
+
+def test_start_adopts_a_worker_spawned_by_the_caller(spawner):
+    spawn = spawner()
+    first = spawn()
+    supervisor = WorkerSupervisor(spawn, name="dummy", heartbeat_interval_s=0)
+    supervisor.start(first)
+
+    reply = _transcribe(supervisor)
+    supervisor.close()
+
+    assert reply["pid"] == spawn.procs[0].pid
+    assert len(spawn.procs) == 1
+
+
+def test_standby_worker_takes_over(spawner):
+    spawn = spawner()
+    supervisor = _supervisor(spawn, standby=True)
+    deadline = time.monotonic() + 10
+    while not supervisor.stats()["standby"] and time.monotonic() < deadline:
+        time.sleep(0.02)
+    standby_pid = spawn.procs[1].pid
+    first_pid = _transcribe(supervisor)["pid"]
+
+    reply = _transcribe(supervisor, crash_pid=first_pid)
+
+    assert reply["pid"] == standby_pid
+    deadline = time.monotonic() + 10
+    while not supervisor.stats()["standby"] and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert supervisor.stats()["standby"] is True  # a new standby was loaded
+    supervisor.close()
+    assert len(spawn.procs) == 3
+
+
+def test_failed_spawns_back_off(spawner):
+    spawn = spawner()
+    delays = []
+    supervisor = _supervisor(spawn, sleep=delays.append, backoff_s=(1.0, 2.0))
+    first_pid = _transcribe(supervisor)["pid"]
+    spawn.failures = 3
+
+    reply = _transcribe(supervisor, crash_pid=first_pid)
+    supervisor.close()
+
+    assert delays == [1.0, 2.0, 2.0]
+    assert reply["samples"] == 4
+
+
+def test_gives_up_after_max_attempts_and_recovers_later(spawner):
+    spawn = spawner()
+    supervisor = _supervisor(spawn, max_spawn_attempts=2)
+    first_pid = _transcribe(supervisor)["pid"]
+    spawn.failures = 2
+
+    with pytest.raises(WorkerClosedError, match="Neustart fehlgeschlagen"):
+        _transcribe(supervisor, crash_pid=first_pid)
+    assert supervisor.stats()["state"] == "restarting"
+
+    assert _transcribe(supervisor)["samples"] == 4
+    assert supervisor.stats()["state"] == "running"
+    supervisor.close()
@@ -0,0 +1,157 @@
+"""Tests for keyboard/ydotool_socket.py and the ydotool backend, against a stand-in ydotoold."""
+
+import socket
+import struct
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from hotkey_transcriber.keyboard import keyboard_controller
+from hotkey_transcriber.keyboard.ydotool_socket import (
+    YdotoolSocket,
+    default_socket_path,
+    qwerty_key_events,
+)
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="AF_UNIX datagram sockets")
+
+_EVENT = struct.Struct("@llHHi")
+
+
+class _FakeDaemon:
+    """Bound datagram socket in place of ydotoold; a thread collects (type, code, value)."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.bind(self.path)
+        self._sock.settimeout(0.05)
+        self._received = []
+        self._closed = threading.Event()
+        # Datagram queues are short: like ydotoold, read continuously or senders block.
+        self._thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._thread.start()
+
+    def _read_loop(self):
+        while not self._closed.is_set():
+            try:
+                data = self._sock.recv(_EVENT.size)
+            except TimeoutError:
+                continue
+            except OSError:
+                return
+            _, _, type_, code, value = _EVENT.unpack(data)
+            self._received.append((type_, code, value))
+
+    def events(self):
+        # Wait until the stream has been quiet for a moment.
+        seen = -1
+        while seen != len(self._received):
+            seen = len(self._received)
+            time.sleep(0.1)
+        return list(self._received)
+
+    def key_events(self):
+        events = self.events()
+        # Every key event is followed by a SYN report, as in ydotool's uinput_emit.
+        assert events[1::2] == [(0, 0, 0)] * (len(events) // 2)
+        return [(code, value) for _, code, value in events[0::2]]
+
+    def close(self):
+        self._closed.set()
+        self._thread.join()
+        self._sock.close()
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    fake = _FakeDaemon(tmp_path / ".ydotool_socket")
+    yield fake
+    fake.close()
+
+
+def test_send_keys_writes_input_events(daemon):
+    sock = YdotoolSocket(daemon.path)
+
+    sock.send_keys([(29, 1), (47, 1), (47, 0), (29, 0)])
+
+    assert daemon.key_events() == [(29, 1), (47, 1), (47, 0), (29, 0)]
+
+
+def test_type_text_uses_qwerty_codes_with_shift():
+    assert qwerty_key_events("a.") == [(30, 1), (30, 0), (52, 1), (52, 0)]
+    assert qwerty_key_events("R") == [(42, 1), (19, 1), (19, 0), (42, 0)]
+    with pytest.raises(ValueError):
+        qwerty_key_events("ü")
+
+
+def test_missing_daemon_raises_oserror(tmp_path):
+    with pytest.raises(OSError):
+        YdotoolSocket(str(tmp_path / "missing"))
+
+
+def test_reconnects_after_daemon_restart(tmp_path):
+    path = tmp_path / ".ydotool_socket"
+    first = _FakeDaemon(path)
+    sock = YdotoolSocket(first.path)
+    first.close()
+    path.unlink()
+    second = _FakeDaemon(path)
+
+    sock.send_keys([(57, 1), (57, 0)])
+
+    assert second.key_events() == [(57, 1), (57, 0)]
+    second.close()
+
+
+def test_socket_path_from_environment(monkeypatch):
+    monkeypatch.setenv("YDOTOOL_SOCKET", "/tmp/custom.sock")
+
+    assert default_socket_path() == "/tmp/custom.sock"
+
+
+@pytest.fixture
+def backend(daemon, monkeypatch):
+    layout = SimpleNamespace(yz_swap=True)
+    monkeypatch.setattr(keyboard_controller, "get_keyboard_layout", lambda: layout)
+    cli_calls = []
+    monkeypatch.setattr(
+        keyboard_controller._YdotoolBackend,
+        "_run",
+        staticmethod(lambda args, timeout: cli_calls.append(args)),
+    )
+    ydotool = keyboard_controller._YdotoolBackend(YdotoolSocket(daemon.path))
+    ydotool.cli_calls = cli_calls
+    return ydotool
+
+
+def test_backend_sends_keys_without_spawning_ydotool(backend, daemon):
+    backend.hotkey("ctrl", "z")
+    backend.press("backspace", presses=2)
+    backend.write("REC")
+
+    # QWERTZ: KEY_Y is sent for "z" in hotkeys, and "z"/"y" are pre-swapped for type.
+    ctrl_z = [(29, 1), (21, 1), (21, 0), (29, 0)]
+    backspaces = [(14, 1), (14, 0)] * 2
+    assert daemon.key_events() == ctrl_z + backspaces + qwerty_key_events("REC")
+    assert backend.cli_calls == []
+
+
+def test_backend_falls_back_to_cli_for_characters_outside_the_table(backend, daemon):
+    backend.write("📝")
+
+    assert daemon.events() == []
+    assert backend.cli_calls == [["ydotool", "type", "--key-delay", "0", "--", "📝"]]
+
+
+def test_backend_falls_back_to_cli_when_the_daemon_is_gone(backend, daemon, tmp_path):
+    daemon.close()
+    (tmp_path / ".ydotool_socket").unlink()
+
+    backend.hotkey("ctrl", "v")
+
+    assert not backend.uses_socket
+    assert backend.cli_calls == [["ydotool", "key", "29:1", "47:1", "47:0", "29:0"]]
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""Offline dictation benchmark.
+
+Replays a directory of WAV files through SpeechRecorder, with a
+FileAudioSource instead of the microphone and a recording stub instead of
+KeyboardController, and
+writes a JSON report per backend/model:
+
+  real-time factor, time-to-text (key up -> paste), model time,
+  peak RSS and CPU time.
+
+Backends:
+  faster_whisper:<size>   faster-whisper (--device / --compute-type)
+  whisper_cpp:<size>      whisper.cpp CLI
+  stub-npu / stub-wsl     stand-ins for the NPU / WSL servers (int16 PCM through
+                          a worker_protocol frame and back, plus a fixed
+                          overhead and a simulated real-time factor)
+
+Every backend runs in its own subprocess so peak RSS is not shared.
+
+Usage:
+  python tools/dictation_benchmark.py --wav-dir bench/ \\
+      --backend faster_whisper:base --backend stub-npu --output report.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from hotkey_transcriber.audio.audio_source import FileAudioSource, load_wav
+from hotkey_transcriber.transcription.worker_protocol import (
+    TRANSCRIBE,
+    audio_from_pcm,
+    encode_frame,
+    pcm_from_audio,
+    read_frame,
+)
+
+_SAMPLE_RATE = 16_000
+
+# name -> (per-call overhead in s, simulated real-time factor)
+_STAND_INS = {
+    "stub-npu": (0.15, 0.08),
+    "stub-wsl": (0.05, 0.12),
+}
+
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--wav-dir", required=True, help="Directory with *.wav files to replay")
+    p.add_argument(
+        "--backend",
+        action="append",
+        required=True,
+        help="faster_whisper:<size>, whisper_cpp:<size>, stub-npu or stub-wsl (repeatable)",
+    )
+    p.add_argument("--device", default="cpu")
+    p.add_argument("--compute-type", default="int8")
+    p.add_argument("--language", default="de")
+    p.add_argument("--realtime", action="store_true", help="Replay at microphone speed")
+    p.add_argument("--auto-stop", action="store_true", help="Let Silero VAD end each take")
+    p.add_argument("--repeat", type=int, default=1, help="Replays per file")
+    p.add_argument("--output", help="Report path (default: stdout)")
+    p.add_argument("--single-backend-report", help=argparse.SUPPRESS)
+    return p.parse_args(argv)
+
+
+# ---------------------------------------------------------------------- #
+# Keyboard and backends                                                    #
+# ---------------------------------------------------------------------- #
+
+
+class RecordingKeyboard:
+    """KeyboardController stand-in that records what would have been typed."""
+
+    backend_name = "benchmark"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.typed: list[str] = []
+
+    def transcript(self) -> str:
+        """Text typed after the last backspace (REC marker and dot printer are erased)."""
+        return "".join(self.typed).strip()
+
+    def save_clipboard(self):
+        pass
+
+    def load_clipboard(self):
+        from hotkey_transcriber.latency_tracker import mark_stage
+
+        mark_stage("clipboard_restored")
+
+    def paste(self, text, end=""):
+        self.typed.append(text)
+
+    def write(self, text, end="", interval=0):
+        self.typed.append(text)
+
+    def press(self, key):
+        pass
+
+    def backspace(self, count):
+        self.typed.clear()
+
+    def undo(self):
+        pass
+
+    @contextlib.contextmanager
+    def transaction(self):
+        yield self
+
+
+class _Segment:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class StandInServerModel:
+    """Simulates an out-of-process backend: framed PCM round trip, fixed overhead, given RTF."""
+
+    max_concurrency = 1
+
+    def __init__(self, overhead_s: float, rtf: float):
+        self.overhead_s = overhead_s
+        self.rtf = rtf
+
+    def transcribe(self, audio, language=None, **kwargs):
+        # What the NPU/WSL clients and workers do per request: encode, frame, parse, decode.
+        header = {"type": TRANSCRIBE, "language": language or "auto"}
+        frame = read_frame(io.BytesIO(encode_frame(1, header, pcm_from_audio(audio))))
+        audio = audio_from_pcm(frame.payload)
+        time.sleep(self.overhead_s + self.rtf * len(audio) / _SAMPLE_RATE)
+        return iter([_Segment(f"{len(audio) / _SAMPLE_RATE:.1f}s")]), {"language": language}
+
+
+def load_backend(spec: str, device: str, compute_type: str):
+    if spec in _STAND_INS:
+        return StandInServerModel(*_STAND_INS[spec])
+    engine, _, size = spec.partition(":")
+    if engine not in ("faster_whisper", "whisper_cpp") or not size:
+        raise ValueError(f"Unbekanntes Backend: {spec}")
+    from hotkey_transcriber.transcription.model_and_recorder_factory import load_model
+
+    return load_model(size=size, device=device, compute_type=compute_type, engine=engine)
+
+
+# ---------------------------------------------------------------------- #
+# Measurement                                                              #
+# ---------------------------------------------------------------------- #
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    values = sorted(values)
+    return values[max(0, -(-len(values) * pct // 100) - 1)]
+
+
+def summarize(runs: list[dict]) -> dict:
+    ttt = [r["time_to_text_ms"] for r in runs if r["time_to_text_ms"] is not None]
+    rtf = [r["rtf"] for r in runs if r["rtf"] is not None]
+    return {
+        "runs": len(runs),
+        "audio_s": round(sum(r["audio_s"] for r in runs), 2),
+        "rtf_mean": round(sum(rtf) / len(rtf), 4) if rtf else None,
+        "time_to_text_p50_ms": _percentile(ttt, 50),
+        "time_to_text_p95_ms": _percentile(ttt, 95),
+    }
+
+
+def run_backend(spec: str, wav_files: list[Path], args) -> dict:
+    """Replay every file through a fresh SpeechRecorder on backend *spec*."""
+    from hotkey_transcriber.audio.audio_capture_hub import AudioCaptureHub
+    from hotkey_transcriber.latency_tracker import get_latency_tracker
+    from hotkey_transcriber.speech_recorder import SpeechRecorder
+
+    t_load = time.perf_counter()
+    model = load_backend(spec, args.device, args.compute_type)
+    load_s = time.perf_counter() - t_load
+
+    # Auto-stop needs the silence after each take, like a real microphone.
+    source = FileAudioSource(realtime=args.realtime, idle_silence=args.auto_stop)
+    hub = AudioCaptureHub(source=source, keep_open=True)
+    keyboard = RecordingKeyboard()
+    finished = threading.Event()
+    recorder = SpeechRecorder(
+        model=model,
+        keyboard_controller=keyboard,
+        channels=1,
+        chunk_ms=30,
+        language=args.language,
+        rec_mark="",
+        capture_hub=hub,
+        on_transcription_finished=finished.set,
+    )
+    tracker = get_latency_tracker()
+
+    runs = []
+    cpu0 = time.process_time()
+    wall0 = time.perf_counter()
+    for path in wav_files:
+        audio = load_wav(path)
+        for _ in range(args.repeat):
+            finished.clear()
+            keyboard.typed.clear()
+            recorder.start(auto_stop=args.auto_stop, silence_timeout_ms=1500)
+            source.play(audio).wait()
+            if not args.auto_stop:
+                recorder.stop()
+            finished.wait()
+            spans = (tracker.last_record or {}).get("spans_ms", {})
+            audio_s = len(audio) / _SAMPLE_RATE
+            model_ms = spans.get("model")
+            runs.append(
+                {
+                    "file": path.name,
+                    "audio_s": round(audio_s, 3),
+                    "time_to_text_ms": spans.get("key_up_to_text"),
+                    "model_ms": model_ms,
+                    "rtf": round(model_ms / 1000 / audio_s, 4) if model_ms and audio_s else None,
+                    "text": keyboard.transcript(),
+                }
+            )
+    wall_s = time.perf_counter() - wall0
+    cpu_s = time.process_time() - cpu0
+    recorder.close()
+
+    return {
+        "backend": spec,
+        "model_load_s": round(load_s, 2),
+        "wall_s": round(wall_s, 2),
+        "cpu_s": round(cpu_s, 2),
+        "peak_rss_mb": _peak_rss_mb(),
+        "summary": summarize(runs),
+        "runs": runs,
+    }
+
+
+def _run_isolated(spec: str, argv: list[str]) -> dict:
+    """Run one backend in a child process so its peak RSS is measured on its own."""
+    with tempfile.TemporaryDirectory(prefix="ht-bench-") as td:
+        report_path = Path(td) / "report.json"
+        cmd = [
+            sys.executable,
+            __file__,
+            *argv,
+            "--backend",
+            spec,
+            "--single-backend-report",
+            str(report_path),
+        ]
+        proc = subprocess.run(cmd, stdout=sys.stderr)
+        if proc.returncode != 0 or not report_path.exists():
+            return {"backend": spec, "error": f"exit={proc.returncode}"}
+        return json.loads(report_path.read_text(encoding="utf-8"))
+
+
+def _passthrough_argv(argv: list[str]) -> list[str]:
+    """argv without --backend/--output, for the per-backend child processes."""
+    result, skip = [], False
+    for arg in argv:
+        if skip:
+            skip = False
+            continue
+        if arg in ("--backend", "--output"):
+            skip = True
+            continue
+        if arg.startswith(("--backend=", "--output=")):
+            continue
+        result.append(arg)
+    return result
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    args = parse_args(argv)
+    wav_files = sorted(Path(args.wav_dir).glob("*.wav"))
+    if not wav_files:
+        print(f"Keine WAV-Dateien in {args.wav_dir}", file=sys.stderr)
+        return 1
+
+    if args.single_backend_report:
+        # Child process: recorder output goes to stderr, the report to a file.
+        sys.stdout = sys.stderr
+        report = run_backend(args.backend[-1], wav_files, args)
+        Path(args.single_backend_report).write_text(json.dumps(report), encoding="utf-8")
+        return 0
+
+    child_argv = _passthrough_argv(argv)
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "realtime": args.realtime,
+        "auto_stop": args.auto_stop,
+        "files": [p.name for p in wav_files],
+        "backends": [_run_isolated(spec, child_argv) for spec in args.backend],
+    }
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
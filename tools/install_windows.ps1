@@ -192,14 +192,14 @@ function Install-NpuBackend {
         throw "vaip_config.json nicht gefunden. Stelle sicher, dass AMD Ryzen AI Software korrekt installiert ist."
     }
 
-    # Install transformers in conda env if not present
-    Write-Host "==> Pruefe 'transformers' in Conda-Umgebung..."
-    $checkResult = & $condaPython -c "import transformers; print('ok')" 2>&1
+    # The NPU server downloads the mel/vocab JSON files via huggingface_hub (transformers is not needed)
+    Write-Host "==> Pruefe 'huggingface_hub' in Conda-Umgebung..."
+    $checkResult = & $condaPython -c "import huggingface_hub; print('ok')" 2>&1
     if ($checkResult -notmatch "ok") {
-        Write-Host "==> Installiere 'transformers' in Conda-Umgebung..."
-        Invoke-External "Install transformers" { & $condaPython -m pip install transformers }
+        Write-Host "==> Installiere 'huggingface_hub' in Conda-Umgebung..."
+        Invoke-External "Install huggingface_hub" { & $condaPython -m pip install huggingface_hub }
     } else {
-        Write-Host "==> 'transformers' bereits vorhanden."
+        Write-Host "==> 'huggingface_hub' bereits vorhanden."
     }
 
     # Set backend env var; clear legacy whisper.cpp CLI var
@@ -265,9 +265,9 @@ function Install-VulkanBackend {
         & cmake -S $whisperSrc -B $whisperBuild -DGGML_VULKAN=ON -DWHISPER_BUILD_EXAMPLES=ON
     }
 
-    Write-Host "==> Building whisper-cli (Release)"
+    Write-Host "==> Building whisper-cli and whisper-server (Release)"
     Invoke-External "Build whisper-cli" {
-        & cmake --build $whisperBuild --config Release --target whisper-cli
+        & cmake --build $whisperBuild --config Release --target whisper-cli whisper-server
     }
 
     $candidates = @(
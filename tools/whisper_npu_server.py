@@ -2,20 +2,41 @@
 """Whisper NPU inference server.
 
 Runs persistently in the ryzen-ai-1.7.0 conda environment.
-Protocol: line-delimited JSON on stdin/stdout.
-  stdin:  {"wav_path": "...", "language": "de"/"auto"}
-  stdout: {"text": "..."} or {"error": "..."}
-  First stdout line after startup: {"status": "ready"}
+Protocol: worker_protocol frames on stdin/stdout (see
+src/hotkey_transcriber/transcription/worker_protocol.py).
+  request:  transcribe {"language": "de"/"auto"} + int16 PCM payload
+  reply:    result {"text": "..."} or error {"error": "..."}
+  First frame after startup: ready
+
+Audio longer than one 30 s encoder window is cut at the quietest pause
+before each window boundary.  The encoder (NPU) works on window N+1 while
+the decoder (CPU) still decodes window N; the texts are joined in order.
+
+Features and text decoding need only numpy and the model's JSON files
+(preprocessor_config.json, vocab.json, added_tokens.json): the log-mel
+front end and the byte-level BPE decoder below replace transformers'
+WhisperFeatureExtractor and WhisperTokenizer.
 """
 
 import argparse
 import json
 import sys
-import traceback
-import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 import numpy as np
 
+# The protocol module lives in the source tree; the conda env does not have the app installed.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+from hotkey_transcriber.audio.speech_timeline import SpeechTimeline  # noqa: E402
+from hotkey_transcriber.transcription.worker_protocol import WorkerServer, claim_stdout  # noqa: E402
+
+SAMPLE_RATE = 16_000
+# Whisper's encoder sees 30 s; cut in a pause within the last 10 s of each window.
+WINDOW_MS = 30_000
+MIN_WINDOW_MS = 20_000
+_FRAME_SIZE = 512
+
 
 def parse_args():
     p = argparse.ArgumentParser()
@@ -27,6 +48,118 @@ def parse_args():
     return p.parse_args()
 
 
+def _hub_file(model_id, filename):
+    from huggingface_hub import hf_hub_download
+
+    return Path(hf_hub_download(model_id, filename))
+
+
+def mel_filter_bank(n_mels, n_fft=400, sampling_rate=SAMPLE_RATE):
+    """Slaney-style mel filters [n_mels, n_fft // 2 + 1], as librosa and transformers build them."""
+
+    # Linear below 1 kHz (mel 15), logarithmic above.
+    log_step = np.log(6.4) / 27.0
+
+    def hz_to_mel(hz):
+        hz = np.asarray(hz, dtype=np.float64)
+        log_mel = 15.0 + np.log(np.maximum(hz, 1e-10) / 1000.0) / log_step
+        return np.where(hz >= 1000.0, log_mel, 3.0 * hz / 200.0)
+
+    def mel_to_hz(mel):
+        return np.where(mel >= 15.0, 1000.0 * np.exp(log_step * (mel - 15.0)), 200.0 * mel / 3.0)
+
+    fft_freqs = np.linspace(0, sampling_rate / 2, n_fft // 2 + 1)
+    mel_points = np.linspace(hz_to_mel(0.0), hz_to_mel(sampling_rate / 2), n_mels + 2)
+    filter_freqs = mel_to_hz(mel_points)
+
+    slopes = filter_freqs[None, :] - fft_freqs[:, None]
+    widths = np.diff(filter_freqs)
+    down = -slopes[:, :-2] / widths[:-1]
+    up = slopes[:, 2:] / widths[1:]
+    filters = np.maximum(0.0, np.minimum(down, up))
+    filters *= 2.0 / (filter_freqs[2:] - filter_freqs[:-2])  # slaney area normalisation
+    return filters.T
+
+
+class LogMelFrontEnd:
+    """Whisper's log-mel spectrogram in numpy; window and filterbank are built once."""
+
+    def __init__(self, n_mels=80, n_fft=400, hop_length=160, chunk_length=30):
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.n_samples = chunk_length * SAMPLE_RATE
+        self.window = np.hanning(n_fft + 1)[:-1]  # periodic Hann
+        self.filters = mel_filter_bank(n_mels, n_fft)
+
+    @classmethod
+    def from_pretrained(cls, model_id):
+        config = json.loads(_hub_file(model_id, "preprocessor_config.json").read_text("utf-8"))
+        return cls(
+            n_mels=config.get("feature_size", 80),
+            n_fft=config.get("n_fft", 400),
+            hop_length=config.get("hop_length", 160),
+            chunk_length=config.get("chunk_length", 30),
+        )
+
+    def __call__(self, audio):
+        """Features [1, n_mels, frames] for one window, zero-padded or cut to 30 s."""
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)[: self.n_samples]
+        audio = np.pad(audio, (0, self.n_samples - len(audio)))
+        padded = np.pad(audio, self.n_fft // 2, mode="reflect")
+        frames = np.lib.stride_tricks.sliding_window_view(padded, self.n_fft)[:: self.hop_length]
+        power = np.abs(np.fft.rfft(frames * self.window, axis=1)) ** 2
+        mel = self.filters @ power[:-1].T  # the last frame is dropped, like Whisper does
+        log_spec = np.log10(np.maximum(mel, 1e-10))
+        log_spec = np.maximum(log_spec, log_spec.max() - 8.0)
+        return ((log_spec + 4.0) / 4.0).astype(np.float32)[None]
+
+
+def _bytes_to_unicode():
+    """GPT-2's reversible byte → printable character table used by Whisper's BPE vocab."""
+    printable = [
+        *range(ord("!"), ord("~") + 1),
+        *range(0xA1, 0xAC + 1),
+        *range(0xAE, 0xFF + 1),
+    ]
+    chars = list(printable)
+    extra = 0
+    for b in range(256):
+        if b not in printable:
+            printable.append(b)
+            chars.append(256 + extra)
+            extra += 1
+    return dict(zip(printable, map(chr, chars), strict=True))
+
+
+class WhisperVocab:
+    """Decode-only Whisper tokenizer: special-token lookup and byte-level BPE decoding."""
+
+    def __init__(self, vocab, added_tokens):
+        self._token_to_id = {**vocab, **added_tokens}
+        self._id_to_token = {i: t for t, i in self._token_to_id.items()}
+        self._special_ids = set(added_tokens.values())
+        self._byte_decoder = {c: b for b, c in _bytes_to_unicode().items()}
+        self.eos_token_id = self._token_to_id["<|endoftext|>"]
+
+    @classmethod
+    def from_pretrained(cls, model_id):
+        vocab = json.loads(_hub_file(model_id, "vocab.json").read_text("utf-8"))
+        added = json.loads(_hub_file(model_id, "added_tokens.json").read_text("utf-8"))
+        return cls(vocab, added)
+
+    def convert_tokens_to_ids(self, token):
+        return self._token_to_id[token]
+
+    def decode(self, ids, skip_special_tokens=False):
+        pieces = []
+        for i in ids:
+            if skip_special_tokens and i in self._special_ids:
+                continue
+            pieces.append(self._id_to_token.get(i, ""))
+        data = bytes(self._byte_decoder[c] for c in "".join(pieces) if c in self._byte_decoder)
+        return data.decode("utf-8", errors="replace")
+
+
 def load_sessions(encoder_path, decoder_path, vaip_config, cache_dir, model_id):
     import onnxruntime as ort
 
@@ -72,85 +205,188 @@ def infer_dtype(session_input):
     return np.float32
 
 
-def greedy_decode(decoder, enc_hidden, tokenizer, language):
-    """Simple greedy decoding loop."""
-    dec_inputs = decoder.get_inputs()
-    dec_output_names = [o.name for o in decoder.get_outputs()]
-
-    # First output is logits
-    logits_name = dec_output_names[0]
+# Whisper's decoder has 448 positions; generate() caps new tokens at half of that.
+MAX_NEW_TOKENS = 224
+# Without a KV cache every step re-runs the whole sequence, so keep that path short.
+MAX_NEW_TOKENS_NO_CACHE = 100
 
-    # Detect which input is token ids (int) vs encoder hidden states (float).
-    # AMD models use "x"/"xa" naming; HuggingFace Optimum uses "input_ids"/"encoder_hidden_states".
-    token_inp = None
-    enc_hs_inp = None
-    for inp in dec_inputs:
-        if "int" in inp.type:
-            token_inp = inp
-        else:
-            enc_hs_inp = inp
-
-    if token_inp is None:
-        # Fallback: first input is tokens, second is encoder states
-        token_inp = dec_inputs[0]
-        enc_hs_inp = dec_inputs[1] if len(dec_inputs) > 1 else None
 
-    # Build prompt tokens
+def prompt_ids(tokenizer, language):
+    """Start-of-transcript prompt; without a language token Whisper detects it itself."""
     sot = tokenizer.convert_tokens_to_ids("<|startoftranscript|>")
-    eot = tokenizer.eos_token_id
     task_tok = tokenizer.convert_tokens_to_ids("<|transcribe|>")
     nots_tok = tokenizer.convert_tokens_to_ids("<|notimestamps|>")
-
     if language and language != "auto":
         lang_tok = tokenizer.convert_tokens_to_ids(f"<|{language}|>")
-        ids = [sot, lang_tok, task_tok, nots_tok]
-    else:
-        # No language token → model predicts language itself (Whisper LID)
-        ids = [sot, task_tok, nots_tok]
-    max_new_tokens = 100  # Static-shape CPU decoder is slow for large models; 100 ≈ ~75 words
+        return [sot, lang_tok, task_tok, nots_tok]
+    return [sot, task_tok, nots_tok]
+
+
+class DecoderIO:
+    """Input/output layout of a decoder session.
+
+    AMD exports use "x"/"xa" naming and a static [1, 448] token input;
+    HuggingFace Optimum uses "input_ids"/"encoder_hidden_states" and, for
+    decoder_model_merged.onnx, "past_key_values.*" inputs with matching
+    "present.*" outputs plus a "use_cache_branch" flag.
+    """
+
+    def __init__(self, decoder):
+        inputs = decoder.get_inputs()
+        self.logits_name = decoder.get_outputs()[0].name
+        output_names = {o.name for o in decoder.get_outputs()}
+
+        self.past_inputs = [i for i in inputs if i.name.startswith("past_key_values")]
+        self.cache_branch = next((i for i in inputs if i.name == "use_cache_branch"), None)
+        other = [i for i in inputs if i not in self.past_inputs and i is not self.cache_branch]
+
+        # Token ids are the int input, encoder hidden states the float one.
+        self.token_inp = next((i for i in other if "int" in i.type), None)
+        self.enc_hs_inp = next((i for i in other if "int" not in i.type), None)
+        if self.token_inp is None:
+            self.token_inp = other[0]
+            self.enc_hs_inp = other[1] if len(other) > 1 else None
+        self.enc_hs_dtype = infer_dtype(self.enc_hs_inp) if self.enc_hs_inp else np.float32
+
+        self.static_seq_len = None
+        shape = self.token_inp.shape
+        if shape and len(shape) >= 2 and isinstance(shape[1], int) and shape[1] > 0:
+            self.static_seq_len = shape[1]
+
+        self.present_names = {
+            i.name: i.name.replace("past_key_values", "present", 1) for i in self.past_inputs
+        }
+        self.uses_cache = (
+            self.static_seq_len is None
+            and bool(self.past_inputs)
+            and all(name in output_names for name in self.present_names.values())
+            and all(_empty_past_shape(i.shape) is not None for i in self.past_inputs)
+        )
+
+    def empty_past(self):
+        """Zero-length cache tensors for the first step, e.g. [1, heads, 0, head_dim]."""
+        return {
+            i.name: np.zeros(_empty_past_shape(i.shape), dtype=infer_dtype(i))
+            for i in self.past_inputs
+        }
+
+
+def _empty_past_shape(shape):
+    # [batch, heads, sequence, head_dim]: batch 1, sequence 0, the rest must be fixed.
+    if not shape or len(shape) != 4:
+        return None
+    batch, heads, _, head_dim = shape
+    if not (isinstance(heads, int) and isinstance(head_dim, int)):
+        return None
+    return [batch if isinstance(batch, int) else 1, heads, 0, head_dim]
+
+
+def greedy_decode(decoder, enc_hidden, tokenizer, language, io=None):
+    """Greedy decoding; incremental with the KV cache when the export provides one."""
+    io = io or DecoderIO(decoder)
+    ids = prompt_ids(tokenizer, language)
+    enc_hidden = enc_hidden.astype(io.enc_hs_dtype, copy=False)
+    decode = _decode_with_cache if io.uses_cache else _decode_full
+    ids = decode(decoder, io, enc_hidden, ids, tokenizer.eos_token_id)
+    return tokenizer.decode(ids, skip_special_tokens=True).strip()
 
-    enc_hs_dtype = infer_dtype(enc_hs_inp) if enc_hs_inp else np.float32
 
-    # Detect static sequence length from the token input shape (e.g. AMD exports use [1, 448])
-    static_seq_len = None
-    if token_inp.shape and len(token_inp.shape) >= 2:
-        dim1 = token_inp.shape[1]
-        if isinstance(dim1, int) and dim1 > 0:
-            static_seq_len = dim1
+def _decode_with_cache(decoder, io, enc_hidden, ids, eot):
+    """Feed the prompt once, then one token per step against the cached keys/values."""
+    ids = list(ids)
+    past = io.empty_past()
+    output_names = [io.logits_name, *io.present_names.values()]
+    step_ids = ids
+    for step in range(MAX_NEW_TOKENS):
+        feed = {io.token_inp.name: np.array([step_ids], dtype=np.int64), **past}
+        if io.enc_hs_inp:
+            feed[io.enc_hs_inp.name] = enc_hidden
+        if io.cache_branch is not None:
+            feed[io.cache_branch.name] = np.array([step > 0])
+
+        logits, *presents = decoder.run(output_names, feed)
+        # The merged export passes the cross-attention cache through unchanged
+        # once use_cache_branch is set, so every present output feeds the next step.
+        past = dict(zip(io.present_names, presents, strict=True))
+
+        next_token = int(np.argmax(logits[0, -1, :]))
+        if next_token == eot:
+            break
+        ids.append(next_token)
+        step_ids = [next_token]
+    return ids
+
+
+def _decode_full(decoder, io, enc_hidden, ids, eot):
+    """Re-run the decoder over the whole sequence for every token (exports without a cache)."""
+    ids = list(ids)
+    max_new_tokens = MAX_NEW_TOKENS_NO_CACHE
+    if io.static_seq_len is not None:
+        max_new_tokens = min(max_new_tokens, io.static_seq_len - len(ids))
 
     for _ in range(max_new_tokens):
         n = len(ids)
-        if static_seq_len is not None:
+        if io.static_seq_len is not None:
             # Pad to static length; read logit at position of last real token
-            padded = np.zeros([1, static_seq_len], dtype=np.int64)
-            padded[0, :n] = ids
-            input_ids = padded
+            input_ids = np.zeros([1, io.static_seq_len], dtype=np.int64)
+            input_ids[0, :n] = ids
         else:
             input_ids = np.array([ids], dtype=np.int64)
 
-        dec_feed = {token_inp.name: input_ids}
-        if enc_hs_inp:
-            dec_feed[enc_hs_inp.name] = enc_hidden.astype(enc_hs_dtype)
+        feed = {io.token_inp.name: input_ids}
+        if io.enc_hs_inp:
+            feed[io.enc_hs_inp.name] = enc_hidden
 
-        out = decoder.run([logits_name], dec_feed)[0]  # [1, seq, vocab]
-        # For static-shape models use position of last real token; dynamic use last position
-        logit_pos = n - 1 if static_seq_len is not None else -1
+        out = decoder.run([io.logits_name], feed)[0]  # [1, seq, vocab]
+        logit_pos = n - 1 if io.static_seq_len is not None else -1
         next_token = int(np.argmax(out[0, logit_pos, :]))
         if next_token == eot:
             break
         ids.append(next_token)
-
-    return tokenizer.decode(ids, skip_special_tokens=True).strip()
+    return ids
+
+
+def split_windows(audio, window_ms=WINDOW_MS, min_window_ms=MIN_WINDOW_MS):
+    """Sample ranges of at most *window_ms*, cut in the quietest stretch before each limit.
+
+    The app's recorder has Silero flags, the server does not: a frame counts
+    as a pause when its RMS is below a tenth of the recording's loud frames.
+    """
+    n = len(audio)
+    if n <= SAMPLE_RATE * window_ms // 1000:
+        return [(0, n)]
+    n_frames = -(-n // _FRAME_SIZE)
+    frames = np.zeros(n_frames * _FRAME_SIZE, dtype=np.float32)
+    frames[:n] = audio
+    rms = np.sqrt(np.mean(frames.reshape(n_frames, _FRAME_SIZE) ** 2, axis=1))
+    threshold = max(0.1 * float(np.percentile(rms, 90)), 1e-4)
+    timeline = SpeechTimeline(rms > threshold, _FRAME_SIZE, SAMPLE_RATE)
+    bounds = [0, *timeline.split_points(n, window_ms, min_window_ms), n]
+    return list(zip(bounds[:-1], bounds[1:], strict=True))
+
+
+def transcribe_windows(audio, encode, decode, executor):
+    """Encode window N+1 on *executor* while window N is decoded; join the texts."""
+    windows = split_windows(audio)
+    pending = executor.submit(encode, audio[windows[0][0] : windows[0][1]])
+    texts = []
+    for i in range(len(windows)):
+        enc_hidden = pending.result()
+        if i + 1 < len(windows):
+            start, end = windows[i + 1]
+            pending = executor.submit(encode, audio[start:end])
+        texts.append(decode(enc_hidden))
+    return " ".join(text for text in texts if text)
 
 
 def main():
     args = parse_args()
+    # Frames own stdout from here on; VitisAI's compile log goes to stderr.
+    out = claim_stdout()
 
-    from transformers import WhisperFeatureExtractor, WhisperTokenizer
-
-    print("[NPU] Lade Feature Extractor und Tokenizer...", file=sys.stderr, flush=True)
-    fe = WhisperFeatureExtractor.from_pretrained(args.model_id)
-    tokenizer = WhisperTokenizer.from_pretrained(args.model_id)
+    print("[NPU] Lade Mel-Filterbank und Vokabular...", file=sys.stderr, flush=True)
+    fe = LogMelFrontEnd.from_pretrained(args.model_id)
+    tokenizer = WhisperVocab.from_pretrained(args.model_id)
 
     print("[NPU] Lade ONNX-Modelle (Encoder auf NPU kompilieren kann beim ersten Mal Minuten dauern)...",
           file=sys.stderr, flush=True)
@@ -159,37 +395,28 @@ def main():
     enc_inp_name = encoder.get_inputs()[0].name
     enc_inp_dtype = infer_dtype(encoder.get_inputs()[0])
     enc_out_name = encoder.get_outputs()[0].name
+    decoder_io = DecoderIO(decoder)
+    mode = "KV-Cache" if decoder_io.uses_cache else "ohne KV-Cache"
+    print(f"[NPU] Decoder: {mode}", file=sys.stderr, flush=True)
 
-    print(json.dumps({"status": "ready"}), flush=True)
-
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            req = json.loads(line)
-            wav_path = req["wav_path"]
-            language = req.get("language") or "auto"
-
-            # Load WAV
-            with wave.open(wav_path, "rb") as wf:
-                frames = wf.readframes(wf.getnframes())
-            audio = np.frombuffer(frames, np.int16).astype(np.float32) / 32767.0
+    # One encoder thread: window N+1 is encoded while the handler thread decodes window N.
+    encoder_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="npu-encoder")
 
-            # Mel spectrogram
-            feats = fe(audio, sampling_rate=16000, return_tensors="np")
-            input_features = feats.input_features.astype(enc_inp_dtype)
+    def encode(window):
+        # Mel spectrogram, then the encoder on the NPU
+        input_features = fe(window).astype(enc_inp_dtype)
+        return encoder.run([enc_out_name], {enc_inp_name: input_features})[0]
 
-            # Encoder on NPU
-            enc_hidden = encoder.run([enc_out_name], {enc_inp_name: input_features})[0]
+    def handle(req, audio):
+        language = req.get("language") or "auto"
 
-            # Greedy decode on CPU
-            text = greedy_decode(decoder, enc_hidden, tokenizer, language)
+        # Greedy decode on CPU
+        def decode(enc_hidden):
+            return greedy_decode(decoder, enc_hidden, tokenizer, language, decoder_io)
 
-            print(json.dumps({"text": text}), flush=True)
+        return {"text": transcribe_windows(audio, encode, decode, encoder_pool)}
 
-        except Exception as e:
-            print(json.dumps({"error": str(e), "trace": traceback.format_exc()}), flush=True)
+    WorkerServer(handle, stdout=out).serve()
 
 
 if __name__ == "__main__":